@@ -0,0 +1,195 @@
+"""
+asyncio facade over the generation pipeline, for async web services.
+
+Rendering is CPU-bound and blocking, so AsyncRenderer runs it in an
+executor (by default a pool of processes, each loading WeasyPrint on its
+first PDF), reads and writes files in worker threads, and bounds how many
+renders run at once and how long a caller waits for one:
+
+    async with AsyncRenderer(max_concurrency=4, timeout=30) as renderer:
+        outputs = await renderer.render_cv("cv-data/cv_fr.yml", formats=("pdf",))
+        pdf = outputs["pdf"]
+
+A render that times out cannot be interrupted inside its worker; it keeps
+its concurrency slot until it actually finishes, so timed-out requests
+never push the pool past max_concurrency.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from backend.generators.limits import RenderLimits
+from backend.generators.render import RENDER_FORMATS, render_all
+from backend.parsers.loader import load_cv
+from backend.render_worker import warm_up
+
+# Seconds a caller waits for a render by default; None waits forever
+DEFAULT_TIMEOUT_S = 60.0
+
+# File names of the outputs written by render_cv(..., output_dir=)
+OUTPUT_NAMES = {
+    "html": "cv_{lang}.html",
+    "json": "cv_{lang}.json",
+    "public_json": "cv_{lang}.public.json",
+    "pdf": "cv_{lang}.pdf",
+}
+
+
+def _write_outputs(outputs: dict[str, str | bytes], lang: str, output_dir: Path) -> list[Path]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for fmt, content in outputs.items():
+        path = output_dir / OUTPUT_NAMES[fmt].format(lang=lang)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+class AsyncRenderer:
+    """Render CVs from asyncio code without blocking the event loop."""
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = DEFAULT_TIMEOUT_S,
+        limits: RenderLimits | None = None,
+    ):
+        """Create a renderer.
+
+        Args:
+            executor: Executor running the renders (default: a process pool
+                of max_concurrency workers, created on first use and shut
+                down by close())
+            max_concurrency: Maximum renders running at once (default: one per CPU)
+            timeout: Default seconds to wait for a render; None waits forever
+            limits: Guardrails of each PDF render; max_memory_mb caps the
+                workers of the default process pool (default: RenderLimits.from_env())
+
+        Raises:
+            ValueError: If max_concurrency is not positive
+        """
+        if max_concurrency is None:
+            max_concurrency = os.cpu_count() or 1
+        self.max_concurrency = max_concurrency
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        self.timeout = timeout
+        self.limits = limits or RenderLimits.from_env()
+        self._executor = executor
+        self._own_executor = executor is None
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    @property
+    def executor(self) -> Executor:
+        """Executor running the renders."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_concurrency,
+                initializer=warm_up,
+                # WeasyPrint loads on the first PDF render, not in JSON/HTML-only workers
+                initargs=(self.limits, False),
+            )
+        return self._executor
+
+    async def __aenter__(self) -> "AsyncRenderer":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Shut down the executor if the renderer created it."""
+        if self._own_executor and self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
+
+    async def load(self, cv_file: str | Path) -> dict[str, Any]:
+        """Load and validate a CV file in a worker thread (see load_cv())."""
+        return await asyncio.to_thread(load_cv, Path(cv_file))
+
+    async def render(
+        self,
+        cv_data: dict[str, Any],
+        language: str = "en",
+        formats: tuple[str, ...] = ("pdf",),
+        timeout: float | None = None,
+    ) -> dict[str, str | bytes]:
+        """Render validated CV data in the executor.
+
+        Waits for a free concurrency slot first; the timeout covers both
+        the wait and the render.
+
+        Args:
+            cv_data: Validated CV data with translations
+            language: Language code
+            formats: Formats to render, from RENDER_FORMATS
+            timeout: Seconds to wait (default: the renderer's timeout)
+
+        Returns:
+            Rendered content by format, as from render_all()
+
+        Raises:
+            ValueError: If a format is unknown
+            RenderLimitError: If the CV or its PDF render exceeds a limit
+            TimeoutError: If the render did not finish in time
+        """
+        unknown = sorted(set(formats) - set(RENDER_FORMATS))
+        if unknown:
+            raise ValueError(f"Unknown format(s): {', '.join(unknown)}")
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"no render slot free within {timeout:g}s") from None
+        try:
+            job = functools.partial(render_all, cv_data, language, formats, limits=self.limits)
+            future = self.executor.submit(job)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is freed when the work is done, not when the caller gives up
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._slots.release))
+
+        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), remaining)
+        except asyncio.TimeoutError:
+            future.cancel()  # only succeeds if the job has not started
+            raise TimeoutError(f"render of {language} did not finish within {timeout:g}s") from None
+
+    async def render_cv(
+        self,
+        cv_file: str | Path,
+        formats: tuple[str, ...] = ("pdf",),
+        output_dir: str | Path | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, str | bytes]:
+        """Load, validate and render a CV file, optionally writing the outputs.
+
+        Args:
+            cv_file: Language-specific CV file, e.g. cv-data/cv_fr.yml
+            formats: Formats to render, from RENDER_FORMATS
+            output_dir: Directory to write cv_<lang>.<ext> files to, in a worker thread
+            timeout: Seconds to wait for the render (default: the renderer's timeout)
+
+        Returns:
+            Rendered content by format
+        """
+        cv_file = Path(cv_file)
+        language = cv_file.stem.replace("cv_", "")
+        cv_data = await self.load(cv_file)
+        outputs = await self.render(cv_data, language, formats, timeout)
+        if output_dir is not None:
+            await asyncio.to_thread(_write_outputs, outputs, language, Path(output_dir))
+        return outputs
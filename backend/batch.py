@@ -0,0 +1,273 @@
+"""
+Batch CV generation over a directory tree of tenants.
+
+Each sub-directory of the root holds one person's CV sources
+(``cv_*.yml`` plus an optional ``ui_translations.yml``). Languages are
+discovered from the file names, and every tenant × language is built in
+a long-lived process pool, so modules are imported once per worker
+rather than once per CV:
+
+    python -m backend.batch tenants/ --out build/ --jobs 8
+
+Outputs go to ``<out>/<tenant>/`` (public JSON under ``public/``) with
+a per-tenant build cache, and a machine-readable report is written to
+``<out>/summary.json``.
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from backend.build_cache import BuildManifest, data_digest, unit_key
+from backend.generate import (
+    COMPACT_PUBLIC_ENV,
+    FORMATS,
+    load_cv,
+    run_unit,
+    unit_outputs,
+    unit_variant,
+    written_outputs,
+)
+from backend.generators.assets import write_asset_manifest
+from backend.generators.context import RenderContext
+from backend.parsers.yaml_parser import parse_cv_file
+
+DEFAULT_TRANSLATIONS = Path(__file__).parent.parent / "cv-data" / "ui_translations.yml"
+
+
+def discover_units(root: Path) -> Iterator[tuple[str, str]]:
+    """Yield (tenant, language) pairs found under root, lazily and in sorted order.
+
+    Args:
+        root: Directory containing one sub-directory per tenant
+
+    Yields:
+        Tenant directory name and language code of each cv_*.yml file
+    """
+    for tenant_dir in sorted(path for path in root.iterdir() if path.is_dir()):
+        for cv_file in sorted(tenant_dir.glob("cv_*.yml")):
+            yield tenant_dir.name, cv_file.stem.replace("cv_", "")
+
+
+def build_tenant_language(
+    tenant_dir: Path,
+    lang: str,
+    out_dir: Path,
+    default_translations: Path,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Parse, validate and generate every format of one tenant language.
+
+    Runs in a worker process and never raises. The parent owns the build
+    manifest: workers check freshness against the manifest saved by the
+    previous run, and the parent records the returned keys.
+
+    Args:
+        tenant_dir: Tenant source directory
+        lang: Language code
+        out_dir: Tenant output directory
+        default_translations: UI translations used when the tenant has none
+        force: Regenerate even when the cache key is unchanged
+
+    Returns:
+        Summary record of the unit, including the cache keys of successful formats
+    """
+    started = time.perf_counter()
+    record: dict[str, Any] = {"tenant": tenant_dir.name, "lang": lang, "formats": {}, "errors": []}
+    keys: dict[str, str] = {}
+
+    try:
+        translations_file = tenant_dir / "ui_translations.yml"
+        if not translations_file.exists():
+            translations_file = default_translations
+        ui_translations = parse_cv_file(str(translations_file))
+        cv_data, lines = load_cv(tenant_dir / f"cv_{lang}.yml", ui_translations)
+    except Exception as e:
+        cv_data, lines = None, [f"  ✗ Failed to load translations: {e}"]
+
+    if cv_data is None:
+        record["errors"].append(lines[-1].strip().removeprefix("✗ "))
+    else:
+        public_dir = out_dir / "public"
+        public_dir.mkdir(parents=True, exist_ok=True)
+        data_hash = data_digest(cv_data)
+        context = RenderContext(cv_data, lang)
+        manifest = BuildManifest.in_dir(out_dir)
+        for fmt in FORMATS:
+            key = unit_key(cv_data, fmt, data_hash, unit_variant(fmt))
+            outputs = unit_outputs(fmt, lang, out_dir, public_dir)
+            if not force and manifest.is_fresh(f"{lang}:{fmt}", key, outputs):
+                record["formats"][fmt] = "up to date"
+                continue
+            ok, message = run_unit(fmt, cv_data, lang, out_dir, public_dir, context)
+            if ok:
+                keys[fmt] = key
+                record["formats"][fmt] = "generated"
+            else:
+                record["formats"][fmt] = "failed"
+                record["errors"].append(message)
+
+    record["ok"] = not record["errors"]
+    record["keys"] = keys
+    record["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return record
+
+
+def run_batch(
+    root: Path,
+    out_root: Path,
+    jobs: int,
+    default_translations: Path = DEFAULT_TRANSLATIONS,
+    force: bool = False,
+    max_pending: int | None = None,
+) -> dict[str, Any]:
+    """Build every tenant language under root through a bounded process pool.
+
+    At most max_pending units (default: twice the worker count) are queued
+    at a time, so discovery never runs far ahead of the workers.
+
+    Args:
+        root: Directory containing one sub-directory per tenant
+        out_root: Directory receiving one output directory per tenant
+        jobs: Number of worker processes
+        default_translations: UI translations used when a tenant has none
+        force: Regenerate every output, ignoring the build caches
+        max_pending: Maximum number of queued or running units
+
+    Returns:
+        Summary report (also written to out_root/summary.json)
+    """
+    started = time.perf_counter()
+    slots = threading.BoundedSemaphore(max_pending or 2 * jobs)
+    lock = threading.Lock()
+    manifests: dict[str, BuildManifest] = {}
+    results: list[dict[str, Any]] = []
+
+    def _done(tenant: str, lang: str, future: Future) -> None:
+        try:
+            record = future.result()
+        except Exception as e:  # worker process died
+            record = {"tenant": tenant, "lang": lang, "ok": False, "formats": {}}
+            record["errors"] = [f"worker failed: {e}"]
+        try:
+            with lock:
+                out_dir = out_root / tenant
+                for fmt, key in record.pop("keys", {}).items():
+                    outputs = written_outputs(fmt, lang, out_dir, out_dir / "public")
+                    manifests[tenant].record(f"{lang}:{fmt}", key, outputs)
+                results.append(record)
+                status = "✓" if record["ok"] else "✗"
+                detail = f": {'; '.join(record['errors'])}" if record["errors"] else ""
+                print(f"  {status} {tenant}/{lang}{detail}", flush=True)
+        finally:
+            slots.release()
+
+    out_root.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        try:
+            for tenant, lang in discover_units(root):
+                out_dir = out_root / tenant
+                with lock:
+                    if tenant not in manifests:
+                        out_dir.mkdir(parents=True, exist_ok=True)
+                        manifests[tenant] = BuildManifest.in_dir(out_dir)
+                # Back-pressure: wait for a free slot before queueing more work
+                slots.acquire()
+                future = executor.submit(
+                    build_tenant_language,
+                    root / tenant,
+                    lang,
+                    out_dir,
+                    default_translations,
+                    force,
+                )
+                future.add_done_callback(functools.partial(_done, tenant, lang))
+        finally:
+            executor.shutdown(wait=True)
+            for tenant, manifest in manifests.items():
+                manifest.save()
+                public_dir = out_root / tenant / "public"
+                if public_dir.is_dir():
+                    write_asset_manifest(public_dir)
+
+    results.sort(key=lambda record: (record["tenant"], record["lang"]))
+    summary = {
+        "root": str(root),
+        "output": str(out_root),
+        "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "duration_s": round(time.perf_counter() - started, 3),
+        "tenants": len(manifests),
+        "units": len(results),
+        "failed": sum(not record["ok"] for record in results),
+        "results": results,
+    }
+    summary_file = out_root / "summary.json"
+    summary_file.write_text(
+        json.dumps(summary, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run batch generation.
+
+    Returns:
+        Process exit code: 0 if every unit succeeded, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Generate CVs for every tenant under a directory.")
+    parser.add_argument("root", type=Path, help="directory with one sub-directory per tenant")
+    parser.add_argument("--out", type=Path, required=True, help="output root directory")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--translations",
+        type=Path,
+        default=DEFAULT_TRANSLATIONS,
+        help="UI translations for tenants without their own ui_translations.yml",
+    )
+    parser.add_argument("--force", action="store_true", help="ignore the build caches")
+    parser.add_argument(
+        "--compact-public",
+        action="store_true",
+        help="write public JSON without indentation",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if not args.root.is_dir():
+        parser.error(f"{args.root} is not a directory")
+
+    if args.compact_public:
+        # Exported before the pool starts so that every worker sees it
+        os.environ[COMPACT_PUBLIC_ENV] = "1"
+
+    print("🔄 Resume-as-Code Batch Generator")
+    print("=" * 50)
+    summary = run_batch(args.root, args.out, args.jobs, args.translations, args.force)
+    print("\n" + "=" * 50)
+    succeeded = summary["units"] - summary["failed"]
+    print(
+        f"{'❌' if summary['failed'] else '✅'} {succeeded}/{summary['units']} units succeeded "
+        f"across {summary['tenants']} tenants in {summary['duration_s']}s"
+    )
+    print(f"📁 Summary: {args.out / 'summary.json'}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
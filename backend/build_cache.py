@@ -0,0 +1,161 @@
+"""Content-addressed build cache for generated artifacts.
+
+Each language × format unit gets a key hashed from everything that can
+change its output: the validated CV data (merged YAML plus UI
+translations), the generator and template sources, and CACHE_VERSION.
+Keys of successful units are stored in a manifest under ``dist/`` so the
+next run can skip units whose key and outputs are unchanged.
+"""
+
+import hashlib
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from backend.utils import write_atomic
+
+# Bump to invalidate every cached artifact, e.g. when output paths change
+CACHE_VERSION = 1
+
+MANIFEST_NAME = ".build-manifest.json"
+
+_BACKEND_DIR = Path(__file__).parent
+
+# Source files (or directories of them) whose content affects each output format
+FORMAT_SOURCES: dict[str, tuple[Path, ...]] = {
+    "html": (
+        _BACKEND_DIR / "generators" / "html_generator.py",
+        _BACKEND_DIR / "generators" / "fragments.py",
+        _BACKEND_DIR / "generators" / "render.py",
+        _BACKEND_DIR / "templates" / "cv.html",
+    ),
+    "json": (
+        _BACKEND_DIR / "generators" / "json_generator.py",
+        _BACKEND_DIR / "generators" / "assets.py",
+        _BACKEND_DIR / "generators" / "context.py",
+        _BACKEND_DIR / "generators" / "render.py",
+    ),
+    "pdf": (
+        _BACKEND_DIR / "generators" / "pdf_generator.py",
+        _BACKEND_DIR / "generators" / "context.py",
+        _BACKEND_DIR / "templates" / "fonts",
+    ),
+}
+
+
+@cache
+def source_digest(fmt: str) -> str:
+    """Hash the generator/template sources of an output format.
+
+    Computed once per process; missing files hash as empty, and
+    directories hash every file directly inside them.
+
+    Args:
+        fmt: Output format (html, json, pdf)
+
+    Returns:
+        Hex digest of the format's sources
+    """
+    digest = hashlib.sha256()
+    for source in FORMAT_SOURCES.get(fmt, ()):
+        paths = sorted(p for p in source.iterdir() if p.is_file()) if source.is_dir() else [source]
+        for path in paths:
+            digest.update(path.name.encode("utf-8"))
+            if path.exists():
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def data_digest(cv_data: dict[str, Any]) -> str:
+    """Hash CV data in a canonical (key-sorted) JSON form.
+
+    Args:
+        cv_data: Validated CV data with translations
+
+    Returns:
+        Hex digest of the data
+    """
+    canonical = json.dumps(
+        cv_data,
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def unit_key(
+    cv_data: dict[str, Any],
+    fmt: str,
+    data_hash: str | None = None,
+    variant: str = "",
+) -> str:
+    """Compute the cache key of one language × format unit.
+
+    Args:
+        cv_data: Validated CV data with translations
+        fmt: Output format (html, json, pdf)
+        data_hash: Precomputed data_digest(cv_data), to hash the data once per language
+        variant: Output options that change the unit's files, e.g. "compact"
+
+    Returns:
+        Hex digest identifying the unit's inputs
+    """
+    data_hash = data_hash or data_digest(cv_data)
+    parts = [str(CACHE_VERSION), fmt, source_digest(fmt), data_hash, variant]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """Manifest of cache keys for previously generated units."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self.entries = data.get("entries", {})
+
+    @classmethod
+    def in_dir(cls, dist_dir: Path) -> "BuildManifest":
+        """Load the manifest stored in an output directory."""
+        return cls(dist_dir / MANIFEST_NAME)
+
+    def is_fresh(self, unit: str, key: str, outputs: list[Path]) -> bool:
+        """Check whether a unit was already built from the same inputs.
+
+        Args:
+            unit: Unit identifier, e.g. "en:pdf"
+            key: Current cache key of the unit
+            outputs: Files the unit writes; these and the outputs recorded
+                for it must all still exist
+
+        Returns:
+            True if the unit can be skipped
+        """
+        entry = self.entries.get(unit)
+        if not entry or entry.get("key") != key:
+            return False
+        recorded = [Path(path) for path in entry.get("outputs", [])]
+        return all(path.exists() for path in [*outputs, *recorded])
+
+    def record(self, unit: str, key: str, outputs: list[Path]) -> None:
+        """Record a successfully built unit."""
+        entry = {"key": key, "outputs": [str(path) for path in outputs]}
+        if self.entries.get(unit) != entry:
+            self.entries[unit] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest atomically if anything changed."""
+        if not self._dirty:
+            return
+        data = {"version": CACHE_VERSION, "entries": self.entries}
+        write_atomic(self.path, json.dumps(data, indent=2, sort_keys=True) + "\n")
+        self._dirty = False
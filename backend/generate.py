@@ -4,97 +4,489 @@ Main CV generation script.
 Parses YAML CV data and generates HTML, JSON, and PDF outputs.
 """
 
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
-from backend.generators.html_generator import generate_html
-from backend.generators.json_generator import generate_json, generate_public_json
-from backend.generators.pdf_generator import generate_pdf
-from backend.parsers.schema import validate_cv
+from backend.build_cache import BuildManifest, data_digest, source_digest, unit_key
+from backend.generators.assets import (
+    emit_public_asset,
+    public_asset_files,
+    write_asset_manifest,
+)
+from backend.generators.context import RenderContext
+from backend.generators.render import render_all
+from backend.metrics import METRICS_ENV, PROFILE_ENV, read_records, stage, write_prometheus
+from backend.parsers.loader import validate_cv_data
 from backend.parsers.yaml_parser import parse_cv_file, parse_cv_with_base
+from backend.render_worker import RENDER_SOCKET_ENV, RenderClient
 
+FORMATS = ("html", "json", "pdf")
 
-def main():
-    """Generate CV outputs from YAML sources."""
+# Environment variable enabling compact (unindented) public JSON in web/public
+COMPACT_PUBLIC_ENV = "RESUME_COMPACT_PUBLIC_JSON"
 
-    # Paths
-    cv_data_dir = Path(__file__).parent.parent / "cv-data"
-    dist_dir = Path(__file__).parent.parent / "dist"
-    dist_dir.mkdir(exist_ok=True)
-    web_public_dir = Path(__file__).parent.parent / "web" / "public"
-    web_public_dir.mkdir(exist_ok=True)
+# Environment variable enabling PNG page previews and page metadata next to each PDF
+PDF_PREVIEWS_ENV = "RESUME_PDF_PREVIEWS"
+
+
+def _write_html(context: RenderContext, dist_dir: Path, web_public_dir: Path) -> str:
+    """Render and write the HTML output, returning the report line."""
+    lang = context.language
+    html_content = render_all(context.cv_data, lang, ("html",), context)["html"]
+    html_file = dist_dir / f"cv_{lang}.html"
+    html_file.write_text(html_content)  # type: ignore[arg-type]
+    return f"Generated HTML → {html_file.name}"
+
+
+def _write_json(context: RenderContext, dist_dir: Path, web_public_dir: Path) -> str:
+    """Render and write the full and public JSON outputs, returning the report line."""
+    lang = context.language
+    compact = bool(os.environ.get(COMPACT_PUBLIC_ENV))
+    # The public JSON for web/public is sanitized (no phone/DOB, base64 email)
+    outputs = render_all(context.cv_data, lang, ("json", "public_json"), context, compact)
+    json_file = dist_dir / f"cv_{lang}.json"
+    json_file.write_text(outputs["json"])  # type: ignore[arg-type]
+    web_json_file = web_public_dir / f"cv_{lang}.json"
+    web_json_file.write_text(outputs["public_json"])  # type: ignore[arg-type]
+    # Minified, fingerprinted and precompressed copy for long-term caching; the
+    # context serializes it once, shared with public_json in compact mode
+    with stage("public_assets", lang=lang):
+        emit_public_asset(context.public_json(compact=True), lang, web_public_dir)
+    return f"Generated JSON → {json_file.name}"
+
+
+def _write_pdf(context: RenderContext, dist_dir: Path, web_public_dir: Path) -> str:
+    """Render and write the PDF output, returning the report line.
+
+    Renders in a running backend.render_worker when RESUME_RENDER_SOCKET is set,
+    unless RESUME_PDF_PREVIEWS asks for previews, which reuse the local layout.
+    """
+    # Imported here so that runs without PDFs never load WeasyPrint
+    from backend.generators.pdf_generator import generate_pdf, page_metadata, write_pdf_previews
+
+    lang = context.language
+    pdf_file = dist_dir / f"cv_{lang}.pdf"
+    if os.environ.get(PDF_PREVIEWS_ENV):
+        # One layout for the PDF, its page metadata and (from the PDF) its previews
+        document = generate_pdf(context.cv_data, str(pdf_file), lang, context=context)
+        with stage("pdf_previews", lang=lang):
+            previews = write_pdf_previews(pdf_file, dist_dir, pdf_file.stem)
+        metadata = page_metadata(document)
+        metadata["previews"] = [preview.name for preview in previews]
+        pages_file = dist_dir / f"cv_{lang}.pages.json"
+        pages_file.write_text(json.dumps(metadata, indent=2, ensure_ascii=False) + "\n")
+        return f"Generated PDF → {pdf_file.name} ({len(previews)} page previews)"
+
+    render_socket = os.environ.get(RENDER_SOCKET_ENV)
+    if not render_socket:
+        generate_pdf(context.cv_data, str(pdf_file), lang, context=context)
+        return f"Generated PDF → {pdf_file.name}"
+
+    with RenderClient(render_socket) as client:
+        result = client.render(cv_data=context.cv_data, lang=lang, output=str(pdf_file.resolve()))
+    if not result["ok"]:
+        raise RuntimeError(result["error"])
+    return f"Generated PDF → {pdf_file.name} (worker: {result['timing']['total_ms']:.0f} ms)"
+
+
+FORMAT_WRITERS = {
+    "html": _write_html,
+    "json": _write_json,
+    "pdf": _write_pdf,
+}
+
+
+def unit_variant(fmt: str) -> str:
+    """Return the output options of a format that belong in its cache key."""
+    if fmt == "json" and os.environ.get(COMPACT_PUBLIC_ENV):
+        return "compact"
+    if fmt == "pdf" and os.environ.get(PDF_PREVIEWS_ENV):
+        return "previews"
+    return ""
+
+
+def _preview_files(pages_file: Path) -> list[Path]:
+    """List the page previews recorded in a pages.json file, if it is readable."""
+    try:
+        names = json.loads(pages_file.read_text(encoding="utf-8"))["previews"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+    return [pages_file.parent / name for name in names]
+
+
+def unit_outputs(fmt: str, lang: str, dist_dir: Path, web_public_dir: Path) -> list[Path]:
+    """List the files written by one unit, primary output first.
+
+    Page previews are listed from the unit's current pages.json.
+    """
+    outputs = [dist_dir / f"cv_{lang}.{fmt}"]
+    if fmt == "json":
+        outputs.append(web_public_dir / f"cv_{lang}.json")
+    if fmt == "pdf" and os.environ.get(PDF_PREVIEWS_ENV):
+        pages_file = dist_dir / f"cv_{lang}.pages.json"
+        outputs.append(pages_file)
+        outputs.extend(_preview_files(pages_file))
+    return outputs
+
+
+def written_outputs(fmt: str, lang: str, dist_dir: Path, web_public_dir: Path) -> list[Path]:
+    """List the files a unit wrote, once it has run, to record in the build cache.
+
+    Unlike unit_outputs() beforehand, this includes the files named after
+    their content: the fingerprinted public JSON assets, and the previews
+    of the new page count.
+    """
+    outputs = unit_outputs(fmt, lang, dist_dir, web_public_dir)
+    if fmt == "json":
+        outputs += public_asset_files(lang, web_public_dir)
+    return outputs
+
+
+def run_unit(
+    fmt: str,
+    cv_data: dict[str, Any],
+    lang: str,
+    dist_dir: Path,
+    web_public_dir: Path,
+    context: RenderContext | None = None,
+    sources: str | None = None,
+) -> tuple[bool, str]:
+    """Generate one output format for one language.
+
+    Never raises, so it can run unchanged inline or in a worker process.
+
+    Args:
+        fmt: Output format (html, json, pdf)
+        cv_data: Validated CV data with translations
+        lang: Language code
+        dist_dir: Output directory for generated files
+        web_public_dir: Output directory for public web JSON
+        context: Render intermediates shared by the formats of this language
+        sources: Source digest of fmt the caller keyed the unit on; a worker
+            process holding an older one reloads its templates first
+
+    Returns:
+        Tuple of (success, report line)
+    """
+    try:
+        if sources is not None and source_digest(fmt) != sources:
+            # Watch mode reloads edited templates in the parent process only
+            from backend.generators import html_generator
+
+            html_generator.reload_templates()
+        context = context or RenderContext(cv_data, lang)
+        return True, FORMAT_WRITERS[fmt](context, dist_dir, web_public_dir)
+    except Exception as e:
+        return False, f"{fmt.upper()} generation failed: {e}"
+
+
+def load_cv(
+    cv_file: Path,
+    ui_translations: dict[str, Any],
+) -> tuple[dict[str, Any] | None, list[str]]:
+    """Parse and validate one language file.
+
+    Args:
+        cv_file: Path to language-specific CV file
+        ui_translations: UI translations attached to the validated data
+
+    Returns:
+        Tuple of (CV data or None on failure, report lines)
+    """
+    lines: list[str] = []
+
+    # Parse YAML (with English as base for non-English languages)
+    try:
+        cv_data = parse_cv_with_base(str(cv_file))
+        lines.append("  ✓ Parsed YAML")
+    except Exception as e:
+        lines.append(f"  ✗ Failed to parse: {e}")
+        return None, lines
+
+    # Validate schema (skipped for content already validated by this process)
+    try:
+        cv_data = validate_cv_data(cv_data, ui_translations, cv_file.stem.replace("cv_", ""))
+        lines.append("  ✓ Validated schema")
+    except Exception as e:
+        lines.append(f"  ✗ Validation failed: {e}")
+        return None, lines
+
+    return cv_data, lines
+
+
+def _report(lang: str, lines: list[str], results: list[tuple[bool, str]]) -> bool:
+    """Print the report block for one language.
 
+    Returns:
+        True if every unit of the language succeeded
+    """
+    print(f"\n📝 Processing: {lang.upper()}")
+    for line in lines:
+        print(line)
+    for ok, message in results:
+        print(f"  {'✓' if ok else '✗'} {message}")
+    return all(ok for ok, _ in results)
+
+
+def _finish(
+    lang: str,
+    lines: list[str],
+    units: list[tuple[str, str, Any]],
+    manifest: BuildManifest,
+    dist_dir: Path,
+    web_public_dir: Path,
+) -> bool:
+    """Wait for the units of one language, record them in the cache and report them.
+
+    Returns:
+        True if every unit of the language succeeded
+    """
+    results = []
+    for fmt, key, outcome in units:
+        ok, message = _resolve(fmt, outcome)
+        if ok:
+            outputs = written_outputs(fmt, lang, dist_dir, web_public_dir)
+            manifest.record(f"{lang}:{fmt}", key, outputs)
+        results.append((ok, message))
+    return _report(lang, lines, results)
+
+
+def _resolve(fmt: str, outcome: tuple[bool, str] | Future) -> tuple[bool, str]:
+    """Return the result of a unit that ran inline or in a worker."""
+    if not isinstance(outcome, Future):
+        return outcome
+    try:
+        return outcome.result()
+    except Exception as e:  # worker process died
+        return False, f"{fmt.upper()} generation failed: {e}"
+
+
+def build(
+    targets: dict[str, tuple[str, ...]],
+    cv_data_dir: Path,
+    dist_dir: Path,
+    web_public_dir: Path,
+    manifest: BuildManifest,
+    executor: Executor | None = None,
+    force: bool = False,
+) -> bool:
+    """Build some formats of some languages and print their reports.
+
+    Units whose cache key and outputs are unchanged are skipped unless force
+    is set. The caller saves the manifest.
+
+    Args:
+        targets: Formats to build, by language, in report order
+        cv_data_dir: Directory with the cv_*.yml and ui_translations.yml sources
+        dist_dir: Output directory for generated files
+        web_public_dir: Output directory for public web JSON
+        manifest: Build cache manifest; successful units are recorded in it
+        executor: Pool running the units, or None to run them inline
+        force: Regenerate every unit, ignoring the build cache
+
+    Returns:
+        True if every unit succeeded
+    """
     # Load UI translations
     ui_translations_file = cv_data_dir / "ui_translations.yml"
     ui_translations = parse_cv_file(str(ui_translations_file))
 
-    languages = ["en", "fr", "it"]
+    failed = False
+    # In parallel mode, reports are held back and printed in language order
+    # once the units have finished, so the output matches a serial run.
+    pending: list[tuple[str, list[str], list[tuple[str, str, Any]]]] = []
 
-    print("🔄 Resume-as-Code Generator")
-    print("=" * 50)
-
-    for lang in languages:
+    for lang, formats in targets.items():
         cv_file = cv_data_dir / f"cv_{lang}.yml"
 
         if not cv_file.exists():
             print(f"⚠️  Skipping {lang}: {cv_file} not found")
             continue
 
-        print(f"\n📝 Processing: {lang.upper()}")
+        cv_data, lines = load_cv(cv_file, ui_translations)
+        units = []
+        if cv_data is None:
+            failed = True
+        else:
+            data_hash = data_digest(cv_data)
+            # Intermediates shared by every format of this language
+            context = RenderContext(cv_data, lang)
+            for fmt in formats:
+                key = unit_key(cv_data, fmt, data_hash, unit_variant(fmt))
+                outputs = unit_outputs(fmt, lang, dist_dir, web_public_dir)
+                sources = source_digest(fmt)
+                unit_args = (fmt, cv_data, lang, dist_dir, web_public_dir, context, sources)
+                if not force and manifest.is_fresh(f"{lang}:{fmt}", key, outputs):
+                    outcome = (True, f"{fmt.upper()} up to date → {outputs[0].name}")
+                elif executor is None:
+                    outcome = run_unit(*unit_args)
+                else:
+                    outcome = executor.submit(run_unit, *unit_args)
+                units.append((fmt, key, outcome))
+        pending.append((lang, lines, units))
 
-        # Parse YAML (with English as base for non-English languages)
-        try:
-            cv_data = parse_cv_with_base(str(cv_file))
-            print("  ✓ Parsed YAML")
-        except Exception as e:
-            print(f"  ✗ Failed to parse: {e}")
-            continue
+        if executor is None:
+            failed |= not _finish(*pending.pop(), manifest, dist_dir, web_public_dir)
 
-        # Validate schema
-        try:
-            cv_data = validate_cv(cv_data)
-            # Add UI translations
-            cv_data = cv_data.model_dump()
-            cv_data["translations"] = ui_translations
-            print("  ✓ Validated schema")
-        except Exception as e:
-            print(f"  ✗ Validation failed: {e}")
-            continue
+    for lang, lines, units in pending:
+        failed |= not _finish(lang, lines, units, manifest, dist_dir, web_public_dir)
 
-        # Generate HTML
-        try:
-            html_content = generate_html(cv_data, lang)
-            html_file = dist_dir / f"cv_{lang}.html"
-            html_file.write_text(html_content)
-            print(f"  ✓ Generated HTML → {html_file.name}")
-        except Exception as e:
-            print(f"  ✗ HTML generation failed: {e}")
-
-        # Generate JSON
-        try:
-            json_content = generate_json(cv_data)
-            json_file = dist_dir / f"cv_{lang}.json"
-            json_file.write_text(json_content)
-            # Generate sanitized JSON for web/public
-            # (no phone/DOB, base64 email)
-            public_json_content = generate_public_json(cv_data)
-            web_json_file = web_public_dir / f"cv_{lang}.json"
-            web_json_file.write_text(public_json_content)
-            print(f"  ✓ Generated JSON → {json_file.name}")
-        except Exception as e:
-            print(f"  ✗ JSON generation failed: {e}")
-
-        # Generate PDF
+    if any("json" in formats for formats in targets.values()):
+        # Written here rather than by the JSON units, which may run concurrently
+        write_asset_manifest(web_public_dir)
+    return not failed
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate CV outputs from YAML sources.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes for language × format units (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--formats",
+        default=",".join(FORMATS),
+        help=f"comma-separated formats to generate (default: {','.join(FORMATS)})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate every output, ignoring the build cache",
+    )
+    parser.add_argument(
+        "--render-socket",
+        metavar="PATH",
+        help=f"render PDFs in a running backend.render_worker (default: ${RENDER_SOCKET_ENV})",
+    )
+    parser.add_argument(
+        "--compact-public",
+        action="store_true",
+        help=f"write web/public JSON without indentation (default: ${COMPACT_PUBLIC_ENV})",
+    )
+    parser.add_argument(
+        "--pdf-previews",
+        action="store_true",
+        help=f"also write PNG page previews and page metadata (default: ${PDF_PREVIEWS_ENV})",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="PATH",
+        type=Path,
+        help=(
+            "record per-stage timings: appended as JSON lines, or written as a "
+            f"Prometheus textfile if PATH ends in .prom (default: ${METRICS_ENV})"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        type=Path,
+        help=f"write a cProfile dump per stage to DIR (default: ${PROFILE_ENV})",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="after the first build, rebuild the outputs affected by each source change",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    formats = {fmt.strip() for fmt in args.formats.split(",") if fmt.strip()}
+    unknown = sorted(formats - set(FORMATS))
+    if unknown or not formats:
+        parser.error(f"--formats takes a comma-separated subset of {', '.join(FORMATS)}")
+    # Canonical order, so reports and cache units don't depend on the flag's order
+    args.formats = tuple(fmt for fmt in FORMATS if fmt in formats)
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Generate CV outputs from YAML sources.
+
+    Returns:
+        Process exit code: 0 if every unit succeeded, 1 otherwise
+    """
+    args = parse_args(argv)
+    if args.render_socket:
+        # Exported so that worker processes of --jobs see it too
+        os.environ[RENDER_SOCKET_ENV] = args.render_socket
+    if args.compact_public:
+        os.environ[COMPACT_PUBLIC_ENV] = "1"
+    if args.pdf_previews:
+        os.environ[PDF_PREVIEWS_ENV] = "1"
+    if args.profile:
+        os.environ[PROFILE_ENV] = str(args.profile.resolve())
+    prometheus_file = None
+    if args.metrics:
+        metrics_file = args.metrics.resolve()
+        if metrics_file.suffix == ".prom":
+            # Stages append JSON lines, converted once every unit has finished
+            prometheus_file = metrics_file
+            metrics_file = metrics_file.with_name(metrics_file.name + ".jsonl")
+            metrics_file.unlink(missing_ok=True)
+        os.environ[METRICS_ENV] = str(metrics_file)
+
+    # Paths
+    cv_data_dir = Path(__file__).parent.parent / "cv-data"
+    dist_dir = Path(__file__).parent.parent / "dist"
+    dist_dir.mkdir(exist_ok=True)
+    web_public_dir = Path(__file__).parent.parent / "web" / "public"
+    web_public_dir.mkdir(exist_ok=True)
+
+    languages = ["en", "fr", "it"]
+
+    print("🔄 Resume-as-Code Generator")
+    print("=" * 50)
+
+    manifest = BuildManifest.in_dir(dist_dir)
+    executor = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+
+    def _build(targets: dict[str, tuple[str, ...]], force: bool = False) -> bool:
         try:
-            pdf_file = dist_dir / f"cv_{lang}.pdf"
-            generate_pdf(cv_data, str(pdf_file), lang)
-            print(f"  ✓ Generated PDF → {pdf_file.name}")
-        except Exception as e:
-            print(f"  ✗ PDF generation failed: {e}")
+            return build(targets, cv_data_dir, dist_dir, web_public_dir, manifest, executor, force)
+        finally:
+            manifest.save()
+
+    try:
+        failed = not _build({lang: args.formats for lang in languages}, args.force)
+        if args.watch:
+            from backend.watch import watch
+
+            try:
+                watch(languages, args.formats, cv_data_dir, _build)
+            except KeyboardInterrupt:
+                print("\n👋 Stopped watching")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if prometheus_file is not None:
+            jsonl_file = Path(os.environ[METRICS_ENV])
+            if jsonl_file.exists():
+                write_prometheus(read_records(jsonl_file), prometheus_file)
+                jsonl_file.unlink()
 
     print("\n" + "=" * 50)
-    print("✅ Generation complete!")
+    if failed:
+        print("❌ Generation finished with errors")
+    else:
+        print("✅ Generation complete!")
     print(f"📁 Outputs: {dist_dir}")
+    if args.metrics:
+        print(f"📊 Metrics: {args.metrics}")
+    if args.profile:
+        print(f"🔬 Profiles: {args.profile}")
+
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
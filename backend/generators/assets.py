@@ -0,0 +1,108 @@
+"""Fingerprinted, precompressed public JSON assets for the web frontend.
+
+Each language's minified public JSON is written under a content-hashed
+name with gzip and Brotli siblings, so it can be served with immutable
+cache headers and without on-the-fly compression:
+
+    web/public/cv_en.3f2a9c1b7d4e.json
+    web/public/cv_en.3f2a9c1b7d4e.json.gz
+    web/public/cv_en.3f2a9c1b7d4e.json.br
+
+A small manifest (``cv-manifest.json``) maps each language to its
+current file; ``web/src/App.jsx`` reads it to find the data to load.
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from backend.utils import write_atomic
+
+try:  # optional Brotli encoder
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None  # type: ignore[assignment]
+
+MANIFEST_NAME = "cv-manifest.json"
+MANIFEST_VERSION = 1
+
+# Hex digits of the content hash kept in file names
+FINGERPRINT_LENGTH = 12
+
+
+def emit_public_asset(minified_json: str, lang: str, public_dir: Path) -> Path:
+    """Write the fingerprinted JSON of one language and its compressed siblings.
+
+    Assets of the language with another fingerprint are removed.
+
+    Args:
+        minified_json: Compact public JSON, as from generate_public_json(..., compact=True)
+        lang: Language code
+        public_dir: Directory served as the web root
+
+    Returns:
+        Path of the fingerprinted JSON file
+    """
+    data = minified_json.encode("utf-8")
+    fingerprint = hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+    asset = public_dir / f"cv_{lang}.{fingerprint}.json"
+    gzipped = asset.with_name(asset.name + ".gz")
+    brotlied = asset.with_name(asset.name + ".br")
+
+    if not asset.exists() or asset.read_bytes() != data:
+        write_atomic(asset, data)
+        gzipped.unlink(missing_ok=True)
+        brotlied.unlink(missing_ok=True)
+    # Siblings are (re)written when missing, e.g. deleted after a previous build
+    if not gzipped.exists():
+        # mtime=0 keeps the gzip output reproducible for identical content
+        write_atomic(gzipped, gzip.compress(data, 9, mtime=0))
+    if brotli is not None and not brotlied.exists():
+        write_atomic(brotlied, brotli.compress(data, quality=11))
+
+    for stale in public_asset_files(lang, public_dir):
+        if not stale.name.startswith(asset.name):
+            stale.unlink()
+    return asset
+
+
+def public_asset_files(lang: str, public_dir: Path) -> list[Path]:
+    """List the fingerprinted JSON of one language and its compressed siblings.
+
+    Args:
+        lang: Language code
+        public_dir: Directory served as the web root
+
+    Returns:
+        Existing asset files, sorted by name
+    """
+    return sorted(public_dir.glob(f"cv_{lang}.*.json*"))
+
+
+def write_asset_manifest(public_dir: Path) -> dict[str, Any]:
+    """Write the manifest of every fingerprinted asset in public_dir.
+
+    Args:
+        public_dir: Directory served as the web root
+
+    Returns:
+        Manifest data, by language: file name and raw/gzip/Brotli sizes
+    """
+    files: dict[str, dict[str, Any]] = {}
+    for asset in sorted(public_dir.glob("cv_*.*.json")):
+        lang = asset.name.split(".", 1)[0].removeprefix("cv_")
+        entry: dict[str, Any] = {"file": asset.name, "size": asset.stat().st_size}
+        for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+            compressed = asset.with_name(asset.name + suffix)
+            if compressed.exists():
+                entry[encoding] = compressed.stat().st_size
+        files[lang] = entry
+
+    manifest = {"version": MANIFEST_VERSION, "files": files}
+    content = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    manifest_file = public_dir / MANIFEST_NAME
+    if not manifest_file.exists() or manifest_file.read_text(encoding="utf-8") != content:
+        write_atomic(manifest_file, content.encode("utf-8"))
+    return manifest
@@ -0,0 +1,66 @@
+"""Render intermediates shared by the output generators."""
+
+from functools import cached_property
+from typing import Any
+
+from backend.generators.json_generator import generate_public_json, sanitize_personal
+
+
+class RenderContext:
+    """Intermediates of one CV in one language, computed once on first use.
+
+    Pass the same context to several generators so that they share the
+    contact block, translated headings, joined skill lists and sanitized
+    personal section instead of each deriving them from cv_data again.
+    """
+
+    def __init__(self, cv_data: dict[str, Any], language: str):
+        self.cv_data = cv_data
+        self.language = language
+        self._public_json: dict[bool, str] = {}
+
+    @cached_property
+    def person(self) -> dict[str, Any]:
+        """Contact block with empty strings for missing fields."""
+        personal = self.cv_data["personal"]
+        person: dict[str, Any] = {
+            "name": personal.get("name") or "CV",
+            "email": personal.get("email") or "",
+            "phone": personal.get("phone") or "",
+            "location": personal.get("location") or "",
+            "birth_date": personal.get("birth_date"),
+            "website": personal.get("website", ""),
+            "socials": personal.get("socials", []),
+        }
+        person["birth_date_str"] = str(person["birth_date"]) if person["birth_date"] else ""
+        return person
+
+    @cached_property
+    def headings(self) -> dict[str, str]:
+        """Translated section headings of the language."""
+        return self.cv_data["translations"][self.language]
+
+    @cached_property
+    def skill_lines(self) -> list[tuple[str, str]]:
+        """(category, comma-joined items) per skill entry."""
+        skills = self.cv_data.get("skills", [])
+        return [(skill["category"], ", ".join(skill["items"])) for skill in skills]
+
+    @cached_property
+    def public_personal(self) -> dict[str, Any]:
+        """Personal section without PII and with the email obfuscated."""
+        return sanitize_personal(self.cv_data.get("personal", {}))
+
+    def public_json(self, compact: bool = False) -> str:
+        """Sanitized public JSON, serialized at most once per form.
+
+        The web/public copy and the fingerprinted asset share one
+        serialization when both are compact.
+
+        Args:
+            compact: Omit indentation and whitespace
+        """
+        if compact not in self._public_json:
+            personal = self.public_personal
+            self._public_json[compact] = generate_public_json(self.cv_data, personal, compact)
+        return self._public_json[compact]
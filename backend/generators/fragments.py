@@ -0,0 +1,72 @@
+"""Cache of rendered fragments of the CV HTML template.
+
+Override languages often leave whole sections (education, certifications)
+as merged from the base CV, and a long-lived process (watch mode, the
+render worker, batch and async pool workers) renders the same sections
+build after build. The entries of the experience, education, projects and
+certifications sections are rendered once per fragment key:
+
+    (section, renderer version, section entries, any other inputs of the fragment)
+
+Keys cover a whole section rather than each entry: entry markup is cheaper
+to render than to hash, so only skipping a section's worth of entries with
+one key pays off. The PDF generator's f-string markup is cheaper to build
+than any key, so it is not cached.
+
+The renderer version is the build cache's source digest of the HTML
+generator, so editing the template or generator never serves stale markup.
+Fragments do not depend on the language unless it is passed as an extra
+input, which lets languages reuse each other's unchanged sections.
+"""
+
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+from backend.generators.json_generator import dumps_json
+from backend.utils import LRUCache
+
+# Maximum number of fragments kept per process
+FRAGMENT_CACHE_SIZE = 1024
+
+
+def fragment_key(section: str, version: str, *inputs: Any) -> str:
+    """Hash everything a fragment is rendered from.
+
+    Args:
+        section: Section name, e.g. "experience"
+        version: Version of the code rendering the fragment
+        *inputs: Section entries and any other values the fragment uses
+
+    Returns:
+        Hex digest identifying the fragment
+    """
+    data = dumps_json([section, version, *inputs], compact=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class FragmentCache(LRUCache[str, str]):
+    """Bounded, thread-safe LRU cache of rendered fragments."""
+
+    def __init__(self, maxsize: int = FRAGMENT_CACHE_SIZE):
+        super().__init__(maxsize)
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> str:
+        """Return the cached fragment for key, rendering and storing it on a miss.
+
+        Args:
+            key: Fragment key, from fragment_key()
+            render: Renders the fragment; called outside the lock
+
+        Returns:
+            Rendered fragment
+        """
+        fragment = self.get(key)
+        if fragment is None:
+            fragment = render()
+            self.put(key, fragment)
+        return fragment
+
+
+# Process-wide cache used by the HTML generator
+fragment_cache = FragmentCache()
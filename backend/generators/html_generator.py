@@ -1,9 +1,67 @@
 """HTML generation from CV data."""
 
+import os
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
+
+from backend.build_cache import source_digest
+from backend.generators.fragments import fragment_cache, fragment_key
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+TEMPLATE_NAME = "cv.html"
+
+# Set RESUME_DEV=1 to pick up template edits without restarting the process
+DEV_MODE = os.environ.get("RESUME_DEV", "").lower() in {"1", "true", "yes"}
+
+# Optional directory for compiled template bytecode shared across processes
+TEMPLATE_CACHE_DIR = os.environ.get("RESUME_TEMPLATE_CACHE_DIR")
+
+
+def render_fragment(section: str, *inputs: Any, caller: Callable[[], str]) -> str:
+    """Template global rendering a cached section fragment.
+
+    Used as ``{% call fragment("experience", cv["experience"]) %}...{% endcall %}``;
+    the block may only use the values passed after the section name.
+    """
+    if DEV_MODE:
+        # Templates are reloaded on change; their fragments are not
+        return caller()
+    key = fragment_key(section, source_digest("html"), *inputs)
+    return fragment_cache.get_or_render(key, caller)
+
+
+@cache
+def get_environment() -> Environment:
+    """Return the process-wide Jinja2 environment.
+
+    Templates are compiled once and kept in the environment's cache;
+    in DEV_MODE they are re-checked on disk and recompiled when edited.
+    """
+    bytecode_cache = None
+    if TEMPLATE_CACHE_DIR:
+        Path(TEMPLATE_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+    environment = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        auto_reload=DEV_MODE,
+        bytecode_cache=bytecode_cache,
+    )
+    environment.globals["fragment"] = render_fragment
+    return environment
+
+
+def reload_templates() -> None:
+    """Forget the compiled templates and source digests, e.g. after cv.html was edited.
+
+    Fragments are keyed on the source digest, so cached ones stop matching too.
+    """
+    get_environment.cache_clear()
+    source_digest.cache_clear()
 
 
 def generate_html(cv_data: dict[str, str], language: str = "en") -> str:
@@ -16,16 +74,12 @@ def generate_html(cv_data: dict[str, str], language: str = "en") -> str:
     Returns:
         HTML string
     """
-    template_path = Path(__file__).parent.parent / "templates" / "cv.html"
-
-    if not template_path.exists():
+    try:
+        template = get_environment().get_template(TEMPLATE_NAME)
+    except TemplateNotFound:
         # Fallback: generate minimal HTML
         return generate_minimal_html(cv_data)
 
-    with open(template_path, "r", encoding="utf-8") as f:
-        template_str = f.read()
-
-    template = Template(template_str)
     html = template.render(cv=cv_data, lang=language)
 
     return html
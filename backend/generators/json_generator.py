@@ -2,24 +2,62 @@
 
 Includes helpers to produce sanitized public JSON by removing PII
 and obfuscating email with base64 encoding.
+
+Serialization uses orjson when it is installed and the standard library
+otherwise; both produce the same text.
 """
 
 import base64
 import json
+from datetime import date
 from typing import Any, Dict
 
+try:  # optional fast serializer
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 PII_FIELDS = {"phone", "birth_date"}
 
 
-def _sanitize_public(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a sanitized copy of CV data for public use.
+def _default(value: Any) -> str:
+    """Serialize dates as ISO 8601 strings and reject any other unknown type."""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(data: Any, compact: bool = False) -> str:
+    """Serialize data to JSON text with a trailing newline.
+
+    Args:
+        data: JSON-compatible data; dates and datetimes become ISO 8601 strings
+        compact: Omit indentation and whitespace (for payloads served over the network)
+
+    Returns:
+        JSON string, indented by two spaces unless compact
+
+    Raises:
+        TypeError: If data contains a value that is not JSON serializable
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option).decode("utf-8")
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_default) + "\n"
+    return json.dumps(data, ensure_ascii=False, indent=2, default=_default) + "\n"
+
 
-    Removes phone and birth_date from personal section.
+def sanitize_personal(personal: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a sanitized copy of the personal section for public use.
+
+    Removes phone and birth_date.
     Base64-encodes email to make it less scrapable.
     """
-    # Deep copy to avoid modifying original
-    sanitized = dict(data)
-    personal = dict(sanitized.get("personal", {}))
+    # Copy to avoid modifying original
+    personal = dict(personal)
 
     # Remove PII fields
     for key in PII_FIELDS:
@@ -42,6 +80,25 @@ def _sanitize_public(data: Dict[str, Any]) -> Dict[str, Any]:
         # Store as "reversedEncoded@reversedEncoded"
         personal["email"] = f"{user_final}@{domain_final}"
 
+    return personal
+
+
+def _sanitize_public(
+    data: Dict[str, Any],
+    personal: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """Return a sanitized copy of CV data for public use.
+
+    Args:
+        data: CV data
+        personal: Already sanitized personal section, if computed elsewhere
+
+    Returns:
+        Shallow copy of data with a sanitized personal section
+    """
+    sanitized = dict(data)
+    if personal is None:
+        personal = sanitize_personal(data.get("personal", {}))
     sanitized["personal"] = personal
     return sanitized
 
@@ -55,17 +112,23 @@ def generate_json(cv_data: dict[str, Any] | None) -> str:
     Returns:
         JSON string with trailing newline
     """
-    return json.dumps(cv_data, ensure_ascii=False, indent=2, default=str) + "\n"
+    return dumps_json(cv_data)
 
 
-def generate_public_json(cv_data: dict[str, Any]) -> str:
+def generate_public_json(
+    cv_data: dict[str, Any],
+    public_personal: dict[str, Any] | None = None,
+    compact: bool = False,
+) -> str:
     """Generate sanitized public JSON without PII and obfuscated email.
 
     Args:
         cv_data: Parsed and validated CV data (dict)
+        public_personal: Precomputed sanitize_personal() result, e.g. from a RenderContext
+        compact: Omit indentation and whitespace to shrink the payload
 
     Returns:
         Sanitized JSON string with trailing newline
     """
-    sanitized = _sanitize_public(cv_data)
-    return json.dumps(sanitized, ensure_ascii=False, indent=2, default=str) + "\n"
+    sanitized = _sanitize_public(cv_data, public_personal)
+    return dumps_json(sanitized, compact=compact)
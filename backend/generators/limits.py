@@ -0,0 +1,219 @@
+"""Guardrails bounding the work and memory of a render.
+
+User-supplied CVs can be arbitrarily large. RenderLimits caps them before
+rendering (entries per section, characters per field) and while rendering
+(pages, wall time, memory); exceeding a limit raises RenderLimitError,
+which carries the limit, the offending value and where it was found, so a
+worker can report it and move on to the next job.
+
+Limits are unset by default. A limit of 0 rejects any content (e.g. any
+page), except max_seconds, which must be positive: a timer cannot be
+armed for no time. They are configured per call or through the
+environment, so pool workers inherit them:
+
+- ``RESUME_LIMIT_ENTRIES``: entries per list section
+- ``RESUME_LIMIT_FIELD_CHARS``: characters per text field
+- ``RESUME_LIMIT_PAGES``: pages per PDF
+- ``RESUME_LIMIT_SECONDS``: wall time of a PDF layout
+- ``RESUME_LIMIT_MEMORY_MB``: address space of an isolated worker process
+"""
+
+import os
+import signal
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+try:  # POSIX only
+    import resource
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
+LIMIT_ENVS = {
+    "max_entries": "RESUME_LIMIT_ENTRIES",
+    "max_field_chars": "RESUME_LIMIT_FIELD_CHARS",
+    "max_pages": "RESUME_LIMIT_PAGES",
+    "max_seconds": "RESUME_LIMIT_SECONDS",
+    "max_memory_mb": "RESUME_LIMIT_MEMORY_MB",
+}
+
+
+class RenderLimitError(ValueError):
+    """A CV or its render exceeded a RenderLimits limit."""
+
+    def __init__(self, limit: str, value: float, maximum: float, where: str = ""):
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        self.where = where
+        location = f" at {where}" if where else ""
+        super().__init__(f"{limit} limit exceeded{location}: {value:g} > {maximum:g}")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the error as JSON-serializable data, e.g. for a worker result."""
+        return {
+            "limit": self.limit,
+            "value": self.value,
+            "maximum": self.maximum,
+            "where": self.where,
+        }
+
+
+@dataclass(frozen=True)
+class RenderLimits:
+    """Limits of one render; None disables a limit.
+
+    Attributes:
+        max_entries: Entries per list section (experience, skills...)
+        max_field_chars: Characters per text field
+        max_pages: Pages per PDF, checked after layout
+        max_seconds: Wall time of building and laying out a PDF; must be positive
+        max_memory_mb: Address space of an isolated worker process, see apply_memory_limit()
+
+    Raises:
+        ValueError: If a limit is negative or max_seconds is not positive
+    """
+
+    max_entries: int | None = None
+    max_field_chars: int | None = None
+    max_pages: int | None = None
+    max_seconds: float | None = None
+    max_memory_mb: int | None = None
+
+    def __post_init__(self) -> None:
+        for name, value in asdict(self).items():
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must not be negative, got {value:g}")
+        if self.max_seconds == 0:
+            raise ValueError("max_seconds must be positive, got 0")
+
+    @classmethod
+    def from_env(cls) -> "RenderLimits":
+        """Read the limits set in the environment (see LIMIT_ENVS)."""
+        values: dict[str, Any] = {}
+        for name, env in LIMIT_ENVS.items():
+            raw = os.environ.get(env)
+            if raw:
+                values[name] = float(raw) if name == "max_seconds" else int(raw)
+        return cls(**values)
+
+    def to_env(self) -> dict[str, str]:
+        """Return the environment variables configuring these limits."""
+        values = {name: value for name, value in asdict(self).items() if value is not None}
+        return {LIMIT_ENVS[name]: str(value) for name, value in values.items()}
+
+
+def check_cv_limits(cv_data: dict[str, Any], limits: RenderLimits) -> None:
+    """Check the size of CV data before rendering it.
+
+    Args:
+        cv_data: CV data about to be rendered
+        limits: Limits to enforce; only max_entries and max_field_chars apply
+
+    Raises:
+        RenderLimitError: If a section has too many entries or a field is too long
+    """
+    if limits.max_entries is None and limits.max_field_chars is None:
+        return
+
+    def _check(value: Any, where: str) -> None:
+        if isinstance(value, str):
+            if limits.max_field_chars is not None and len(value) > limits.max_field_chars:
+                raise RenderLimitError("max_field_chars", len(value), limits.max_field_chars, where)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                _check(item, f"{where}.{key}" if where else str(key))
+        elif isinstance(value, list):
+            if limits.max_entries is not None and len(value) > limits.max_entries:
+                raise RenderLimitError("max_entries", len(value), limits.max_entries, where)
+            for index, item in enumerate(value):
+                _check(item, f"{where}[{index}]")
+
+    # UI translations are not user content
+    _check({key: value for key, value in cv_data.items() if key != "translations"}, "")
+
+
+def check_page_limit(page_count: int, limits: RenderLimits) -> None:
+    """Check the page count of a laid out PDF.
+
+    Raises:
+        RenderLimitError: If the document has more than max_pages pages
+    """
+    if limits.max_pages is not None and page_count > limits.max_pages:
+        raise RenderLimitError("max_pages", page_count, limits.max_pages)
+
+
+@contextmanager
+def time_limit(seconds: float | None, where: str = "") -> Iterator[None]:
+    """Bound the wall time of a block.
+
+    In the main thread (as in pool worker processes) the block is
+    interrupted by SIGALRM when the time is up. Elsewhere it cannot be
+    interrupted, and the limit is checked when the block finishes.
+
+    Args:
+        seconds: Wall time limit, positive; None disables it
+        where: Description of the block for the error
+
+    Raises:
+        RenderLimitError: If the block ran longer than seconds
+        ValueError: If seconds is not positive
+    """
+    if seconds is None:
+        yield
+        return
+    if seconds <= 0:
+        # setitimer() would disarm the timer instead of firing at once
+        raise ValueError(f"time limit must be positive, got {seconds:g}")
+
+    started = time.monotonic()
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    if not in_main_thread or not hasattr(signal, "setitimer"):
+        yield
+        elapsed = time.monotonic() - started
+        if elapsed > seconds:
+            raise RenderLimitError("max_seconds", round(elapsed, 3), seconds, where)
+        return
+
+    def _interrupt(signum: int, frame: Any) -> None:
+        raise RenderLimitError("max_seconds", round(time.monotonic() - started, 3), seconds, where)
+
+    previous = signal.signal(signal.SIGALRM, _interrupt)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident memory of the current process in MiB (0 if unknown)."""
+    if resource is None:
+        return 0.0
+    # ru_maxrss is in KiB on Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def apply_memory_limit(max_memory_mb: int | None) -> None:
+    """Cap the address space of the current process.
+
+    Meant for isolated worker processes (e.g. as a pool initializer): an
+    allocation beyond the cap raises MemoryError in that worker instead of
+    letting the kernel's OOM killer pick a victim on a shared node. Linux
+    does not enforce RSS limits, so this caps virtual memory, which must
+    leave room for the mapped libraries (WeasyPrint needs a few hundred MB).
+
+    Args:
+        max_memory_mb: Address space limit in MiB; None leaves it unchanged
+    """
+    if max_memory_mb is None or resource is None:
+        return
+    limit = max_memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
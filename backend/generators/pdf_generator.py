@@ -1,70 +1,64 @@
 """PDF generation from CV data."""
 
-from typing import Any
-
-from weasyprint import HTML  # type: ignore
-
-
-def _render_social_links(socials: list[dict[str, str]]) -> str:
-    """Render social links as HTML spans."""
-    parts: list[str] = []
-    for s in socials:
-        url = s["url"]
-        platform = s["platform"].capitalize()
-        parts.append(f'<span><a href="{url}">{platform}</a></span>')
-    return "".join(parts)
-
-
-def _render_website_link(website: str) -> str:
-    """Render website link span if present."""
-    return f'<span><a href="{website}">{website}</a></span>' if website else ""
-
-
-def generate_pdf(cv_data: dict[str, Any], output_path: str, language: str = "en") -> None:
-    """Generate PDF from CV data.
-
-    Args:
-        cv_data: Parsed CV data
-        output_path: Path to save PDF
-        language: Language code
-    """
-    # Create minimal HTML for PDF
-    html_content = create_pdf_html(cv_data, language)
-
-    # Generate PDF using WeasyPrint
-    HTML(string=html_content).write_pdf(output_path)  # type: ignore
-
-
-def create_pdf_html(cv_data: dict[str, Any], language: str) -> str:
-    """Create HTML suitable for PDF generation.
-
-    Args:
-        cv_data: CV data (dict)
-        language: Language code
-
-    Returns:
-        HTML string
-    """
-    personal = cv_data["personal"]
-    person: dict[str, Any] = {
-        "name": personal.get("name") or "CV",
-        "email": personal.get("email") or "",
-        "phone": personal.get("phone") or "",
-        "location": personal.get("location") or "",
-        "birth_date": personal.get("birth_date"),
-        "website": personal.get("website", ""),
-        "socials": personal.get("socials", []),
-    }
-    person["birth_date_str"] = str(person["birth_date"]) if person["birth_date"] else ""
-
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-
-        body {{
+import io
+import os
+from collections.abc import Iterator
+from functools import cache
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from weasyprint import CSS, HTML  # type: ignore
+from weasyprint.text.fonts import FontConfiguration  # type: ignore
+
+from backend.generators.context import RenderContext
+from backend.generators.limits import (
+    RenderLimitError,
+    RenderLimits,
+    check_cv_limits,
+    check_page_limit,
+    peak_rss_mb,
+    time_limit,
+)
+from backend.metrics import stage
+
+try:  # optional PDF rasterizer for page previews
+    import pypdfium2 as pdfium  # type: ignore
+except ImportError:
+    pdfium = None  # type: ignore[assignment]
+
+try:  # WeasyPrint with class-based URL fetchers
+    from weasyprint.urls import URLFetcher, URLFetcherResponse  # type: ignore
+except ImportError:  # older WeasyPrint: plain fetcher functions
+    URLFetcher = None  # type: ignore[assignment,misc]
+    from weasyprint import default_url_fetcher  # type: ignore
+
+# Locally bundled font files, served instead of the Google Fonts stylesheet
+FONTS_DIR = Path(__file__).parent.parent / "templates" / "fonts"
+GOOGLE_FONTS_PREFIX = "https://fonts.googleapis.com/"
+
+# Inter weights used by the stylesheet -> file name suffix
+INTER_WEIGHTS = {400: "Regular", 500: "Medium", 600: "SemiBold", 700: "Bold"}
+_FONT_FORMATS = (("woff2", "woff2"), ("woff", "woff"), ("ttf", "truetype"), ("otf", "opentype"))
+
+# Where generate_pdf() can write: a file path or a writable binary file object
+PdfTarget = str | os.PathLike[str] | BinaryIO
+
+# Chunk size of stream_pdf(), a typical socket send buffer
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Width of the PNG page previews, in pixels
+PREVIEW_WIDTH = 400
+
+# WeasyPrint page sizes are in CSS pixels (96 per inch)
+MM_PER_PX = 25.4 / 96
+
+# Inter web font stylesheet, imported by PDF_STYLESHEET
+INTER_CSS_URL = f"{GOOGLE_FONTS_PREFIX}css2?family=Inter:wght@400;500;600;700&display=swap"
+
+# Static stylesheet, built once per process
+PDF_STYLESHEET = f"        @import url('{INTER_CSS_URL}');" + """
+
+        body {
             font-family: 'Inter', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #1a1a1a;
@@ -72,39 +66,39 @@ def create_pdf_html(cv_data: dict[str, Any], language: str) -> str:
             padding: 50px;
             max-width: 210mm;
             background: #ffffff;
-        }}
+        }
 
-        .header {{
+        .header {
             text-align: center;
             margin-bottom: 40px;
             padding-bottom: 20px;
             border-bottom: 3px solid #2563eb;
-        }}
+        }
 
-        h1 {{
+        h1 {
             color: #1e293b;
             margin: 0 0 8px 0;
             font-size: 32px;
             font-weight: 700;
             letter-spacing: -0.5px;
-        }}
+        }
 
-        .contact {{
+        .contact {
             color: #64748b;
             font-size: 14px;
             font-weight: 500;
             margin-top: 8px;
-        }}
+        }
 
-        .contact p {{
+        .contact p {
             margin: 0;
             display: flex;
             justify-content: center;
             gap: 20px;
             flex-wrap: wrap;
-        }}
+        }
 
-        h2 {{
+        h2 {
             color: #0f172a;
             font-size: 18px;
             font-weight: 600;
@@ -113,72 +107,72 @@ def create_pdf_html(cv_data: dict[str, Any], language: str) -> str:
             letter-spacing: 1px;
             border-bottom: 2px solid #e2e8f0;
             padding-bottom: 8px;
-        }}
+        }
 
-        .entry {{
+        .entry {
             margin-bottom: 20px;
             page-break-inside: avoid;
-        }}
+        }
 
-        .entry-header {{
+        .entry-header {
             font-weight: 600;
             font-size: 16px;
             color: #1e293b;
             margin-bottom: 4px;
-        }}
+        }
 
-        .entry-subheader {{
+        .entry-subheader {
             font-weight: 500;
             font-size: 14px;
             color: #2563eb;
             margin-bottom: 6px;
-        }}
+        }
 
-        .entry-meta {{
+        .entry-meta {
             color: #64748b;
             font-size: 13px;
             font-weight: 500;
             margin-bottom: 8px;
-        }}
+        }
 
-        .entry-description {{
+        .entry-description {
             font-size: 14px;
             line-height: 1.6;
             color: #374151;
             margin: 0;
-        }}
+        }
 
-        .skills {{
+        .skills {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 20px;
             margin-top: 15px;
-        }}
+        }
 
-        .skill-category {{
+        .skill-category {
             font-weight: 600;
             font-size: 14px;
             color: #1e293b;
             margin-bottom: 8px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .skill-items {{
+        .skill-items {
             font-size: 13px;
             color: #64748b;
             line-height: 1.5;
-        }}
+        }
 
-        .technologies {{
+        .technologies {
             background: #f1f5f9;
             padding: 8px 12px;
             border-radius: 6px;
             margin-top: 8px;
             display: inline-block;
-        }}
+        }
 
-        .technologies span {{
+        .technologies span {
             background: #2563eb;
             color: white;
             padding: 2px 8px;
@@ -188,24 +182,364 @@ def create_pdf_html(cv_data: dict[str, Any], language: str) -> str:
             margin-right: 6px;
             margin-bottom: 4px;
             display: inline-block;
-        }}
+        }
 
-        a {{
+        a {
             color: #2563eb;
             text-decoration: none;
-        }}
+        }
 
-        a:hover {{
+        a:hover {
             text-decoration: underline;
-        }}
+        }
 
-        @page {{
+        @page {
             margin: 25mm 20mm;
             size: A4;
-        }}
-    </style>
-</head>
-<body>
+        }
+"""
+
+_HTML_HEAD = (
+    '<!DOCTYPE html>\n<html>\n<head>\n    <meta charset="UTF-8">\n    <style>\n'
+    + PDF_STYLESHEET
+    + "    </style>\n</head>\n"
+)
+
+# Head without the inline stylesheet, for renders passing PDF_STYLESHEET separately
+_HTML_HEAD_UNSTYLED = '<!DOCTYPE html>\n<html>\n<head>\n    <meta charset="UTF-8">\n</head>\n'
+
+
+@cache
+def local_fonts_css() -> str:
+    """Build @font-face rules for the Inter files found in FONTS_DIR.
+
+    Returns an empty stylesheet when no font files are bundled, in which
+    case the fallback fonts of the font-family stack are used.
+    """
+    rules: list[str] = []
+    for weight, suffix in INTER_WEIGHTS.items():
+        for extension, font_format in _FONT_FORMATS:
+            font_file = FONTS_DIR / f"Inter-{suffix}.{extension}"
+            if font_file.exists():
+                rules.append(
+                    "@font-face {\n"
+                    "    font-family: 'Inter';\n"
+                    "    font-style: normal;\n"
+                    f"    font-weight: {weight};\n"
+                    f"    src: url('{font_file.as_uri()}') format('{font_format}');\n"
+                    "}\n"
+                )
+                break
+    return "".join(rules)
+
+
+def _refuse_remote(url: str) -> None:
+    """Reject network URLs, so rendering never blocks on the network."""
+    if url.startswith(("http://", "https://", "ftp://")):
+        raise ValueError(f"Network access is disabled for PDF rendering: {url}")
+
+
+if URLFetcher is not None:
+
+    class OfflineURLFetcher(URLFetcher):
+        """URL fetcher serving Google Fonts from FONTS_DIR and refusing network access."""
+
+        def fetch(self, url, headers=None):
+            if url.startswith(GOOGLE_FONTS_PREFIX):
+                headers = {"Content-Type": "text/css; charset=utf-8"}
+                return URLFetcherResponse(url, local_fonts_css(), headers)
+            _refuse_remote(url)
+            return super().fetch(url, headers)
+
+    def _make_url_fetcher() -> Any:
+        return OfflineURLFetcher()
+
+else:
+
+    def offline_url_fetcher(url: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """URL fetcher serving Google Fonts from FONTS_DIR and refusing network access."""
+        if url.startswith(GOOGLE_FONTS_PREFIX):
+            return {
+                "string": local_fonts_css(),
+                "mime_type": "text/css",
+                "encoding": "utf-8",
+                "redirected_url": url,
+            }
+        _refuse_remote(url)
+        return default_url_fetcher(url, *args, **kwargs)
+
+    def _make_url_fetcher() -> Any:
+        return offline_url_fetcher
+
+
+@cache
+def pdf_resources() -> tuple[Any, Any, Any]:
+    """Return the (stylesheet, font configuration, URL fetcher) shared by all renders.
+
+    PDF_STYLESHEET is parsed and its fonts are resolved once per process.
+    """
+    font_config = FontConfiguration()
+    url_fetcher = _make_url_fetcher()
+    stylesheet = CSS(string=PDF_STYLESHEET, font_config=font_config, url_fetcher=url_fetcher)
+    return stylesheet, font_config, url_fetcher
+
+
+def _render_social_links(socials: list[dict[str, str]]) -> str:
+    """Render social links as HTML spans."""
+    parts: list[str] = []
+    for s in socials:
+        url = s["url"]
+        platform = s["platform"].capitalize()
+        parts.append(f'<span><a href="{url}">{platform}</a></span>')
+    return "".join(parts)
+
+
+def _render_website_link(website: str) -> str:
+    """Render website link span if present."""
+    return f'<span><a href="{website}">{website}</a></span>' if website else ""
+
+
+def _render_document(cv_data: dict[str, Any], language: str, context: RenderContext | None) -> Any:
+    """Build the PDF HTML of a CV and lay it out with the shared, offline resources."""
+    # Create minimal HTML for PDF; the stylesheet is passed pre-parsed
+    with stage("pdf_html", lang=language):
+        html_content = create_pdf_html(cv_data, language, inline_styles=False, context=context)
+    stylesheet, font_config, url_fetcher = pdf_resources()
+
+    # Lay out the PDF using WeasyPrint, without any network access
+    with stage("pdf_layout", lang=language):
+        return HTML(string=html_content, url_fetcher=url_fetcher).render(  # type: ignore
+            stylesheets=[stylesheet], font_config=font_config
+        )
+
+
+def layout_pdf(
+    cv_data: dict[str, Any],
+    language: str = "en",
+    context: RenderContext | None = None,
+    limits: RenderLimits | None = None,
+) -> Any:
+    """Lay out the PDF of a CV once, for writing the PDF, previews and metadata.
+
+    Args:
+        cv_data: Parsed CV data
+        language: Language code
+        context: Shared render intermediates of cv_data and language
+        limits: Size, page and time limits (default: RenderLimits.from_env())
+
+    Returns:
+        WeasyPrint Document, accepted by generate_pdf(..., document=) and page_metadata()
+
+    Raises:
+        RenderLimitError: If the CV or its layout exceeds a limit
+    """
+    limits = limits or RenderLimits.from_env()
+    check_cv_limits(cv_data, limits)
+    try:
+        with time_limit(limits.max_seconds, f"PDF layout ({language})"):
+            document = _render_document(cv_data, language, context)
+    except MemoryError:
+        if limits.max_memory_mb is None:
+            raise
+        raise RenderLimitError("max_memory_mb", peak_rss_mb(), limits.max_memory_mb) from None
+
+    check_page_limit(len(document.pages), limits)
+    return document
+
+
+def generate_pdf(
+    cv_data: dict[str, Any],
+    output: PdfTarget,
+    language: str = "en",
+    context: RenderContext | None = None,
+    document: Any = None,
+    limits: RenderLimits | None = None,
+) -> Any:
+    """Generate PDF from CV data.
+
+    Args:
+        cv_data: Parsed CV data
+        output: Path to save PDF, or a writable binary file object
+            (an open file, io.BytesIO, a response body...)
+        language: Language code
+        context: Shared render intermediates of cv_data and language
+        document: Document from layout_pdf() to write instead of laying out again
+        limits: Size, page and time limits of the layout (default: from the environment)
+
+    Returns:
+        The written WeasyPrint Document, reusable for page_metadata()
+    """
+    if document is None:
+        document = layout_pdf(cv_data, language, context, limits)
+    with stage("pdf_write", lang=language):
+        document.write_pdf(os.fspath(output) if isinstance(output, os.PathLike) else output)
+    return document
+
+
+def page_metadata(document: Any) -> dict[str, Any]:
+    """Describe the pages of a laid out PDF.
+
+    Args:
+        document: Document from layout_pdf() or generate_pdf()
+
+    Returns:
+        Title, page count and size of each page in millimetres
+    """
+    pages = []
+    for page in document.pages:
+        width_mm = round(page.width * MM_PER_PX, 1)
+        pages.append({"width_mm": width_mm, "height_mm": round(page.height * MM_PER_PX, 1)})
+    return {"title": document.metadata.title, "page_count": len(pages), "pages": pages}
+
+
+def write_pdf_previews(
+    pdf: str | os.PathLike[str] | bytes | memoryview,
+    output_dir: Path,
+    stem: str,
+    width: int = PREVIEW_WIDTH,
+) -> list[Path]:
+    """Write a PNG preview of each page of a PDF.
+
+    The pages are rasterized from the written PDF, so the document is not
+    laid out again (WeasyPrint has no raster output since version 53).
+
+    Args:
+        pdf: PDF file path or content, e.g. from render_pdf_buffer()
+        output_dir: Destination directory
+        stem: File name prefix; pages are written as <stem>-p<n>.png
+        width: Preview width in pixels
+
+    Returns:
+        Written preview files, in page order
+
+    Raises:
+        RuntimeError: If pypdfium2 is not installed
+    """
+    if pdfium is None:
+        raise RuntimeError("PDF previews require pypdfium2 (pip install pypdfium2)")
+    source = os.fspath(pdf) if isinstance(pdf, os.PathLike) else pdf
+    if isinstance(source, memoryview):
+        source = source.tobytes()
+    previews = []
+    document = pdfium.PdfDocument(source)
+    try:
+        for number, page in enumerate(document, start=1):
+            page_width, _ = page.get_size()
+            image = page.render(scale=width / page_width).to_pil()
+            preview = output_dir / f"{stem}-p{number}.png"
+            image.save(preview, optimize=True)
+            previews.append(preview)
+    finally:
+        document.close()
+    for stale in output_dir.glob(f"{stem}-p*.png"):
+        if stale not in previews:
+            stale.unlink()
+    return previews
+
+
+def render_pdf_bytes(
+    cv_data: dict[str, Any],
+    language: str = "en",
+    context: RenderContext | None = None,
+    limits: RenderLimits | None = None,
+) -> bytes:
+    """Generate PDF from CV data in memory.
+
+    Args:
+        cv_data: Parsed CV data
+        language: Language code
+        context: Shared render intermediates of cv_data and language
+        limits: Size, page and time limits of the layout (default: from the environment)
+
+    Returns:
+        PDF content
+    """
+    document = layout_pdf(cv_data, language, context, limits)
+    with stage("pdf_write", lang=language):
+        return document.write_pdf()
+
+
+def render_pdf_buffer(
+    cv_data: dict[str, Any],
+    language: str = "en",
+    context: RenderContext | None = None,
+    limits: RenderLimits | None = None,
+) -> memoryview:
+    """Generate PDF from CV data in memory, without copying the written buffer.
+
+    Args:
+        cv_data: Parsed CV data
+        language: Language code
+        context: Shared render intermediates of cv_data and language
+        limits: Size, page and time limits of the layout (default: from the environment)
+
+    Returns:
+        Read-only view of the PDF content
+    """
+    buffer = io.BytesIO()
+    generate_pdf(cv_data, buffer, language, context=context, limits=limits)
+    return buffer.getbuffer().toreadonly()
+
+
+def stream_pdf(
+    cv_data: dict[str, Any],
+    language: str = "en",
+    context: RenderContext | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    limits: RenderLimits | None = None,
+) -> Iterator[memoryview]:
+    """Generate PDF from CV data as chunks, e.g. for a chunked HTTP response.
+
+    The PDF is rendered when iteration starts; chunks are views into the
+    rendered buffer, so nothing is copied before it is sent.
+
+    Args:
+        cv_data: Parsed CV data
+        language: Language code
+        context: Shared render intermediates of cv_data and language
+        chunk_size: Maximum chunk size in bytes
+        limits: Size, page and time limits of the layout (default: from the environment)
+
+    Yields:
+        Consecutive chunks of the PDF content
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    pdf = render_pdf_buffer(cv_data, language, context=context, limits=limits)
+    for offset in range(0, len(pdf), chunk_size):
+        yield pdf[offset : offset + chunk_size]
+
+
+def create_pdf_html(
+    cv_data: dict[str, Any],
+    language: str,
+    inline_styles: bool = True,
+    context: RenderContext | None = None,
+) -> str:
+    """Create HTML suitable for PDF generation.
+
+    Args:
+        cv_data: CV data (dict)
+        language: Language code
+        inline_styles: Embed PDF_STYLESHEET in a <style> element; disable when
+            the stylesheet is passed to WeasyPrint separately
+        context: Shared render intermediates of cv_data and language
+
+    Returns:
+        HTML string
+    """
+    context = context or RenderContext(cv_data, language)
+    person = context.person
+    headings = context.headings
+
+    # Collect fragments and join once at the end
+    parts: list[str] = [_HTML_HEAD if inline_styles else _HTML_HEAD_UNSTYLED]
+    add = parts.append
+
+    add(f"""<body>
     <div class="header">
             <h1>{person["name"]}</h1>
         <div class="contact">
@@ -222,17 +556,17 @@ def create_pdf_html(cv_data: dict[str, Any], language: str) -> str:
         </div>
     </div>
 
-    <h2>{cv_data['translations'][language]['summary']}</h2>
+    <h2>{headings['summary']}</h2>
     <p>{cv_data.get('summary', '')}</p>
 
-    <h2>{cv_data['translations'][language]['experience']}</h2>
-"""
+    <h2>{headings['experience']}</h2>
+""")
 
     for exp in cv_data.get("experience", []):
         location_str = exp.get("location", "")
         location_part = f" | {location_str}" if location_str else ""
         meta = f"{exp['period']}{location_part}"
-        html += f"""
+        add(f"""
     <div class="entry">
         <div class="entry-header">{exp['title']}</div>
         <div class="entry-subheader">{exp['company']}</div>
@@ -241,92 +575,92 @@ def create_pdf_html(cv_data: dict[str, Any], language: str) -> str:
         </div>
         <div class="entry-description">{exp['description']}</div>
     </div>
-"""
+""")
 
-    html += f"""
-    <h2>{cv_data['translations'][language]['education']}</h2>
-"""
+    add(f"""
+    <h2>{headings['education']}</h2>
+""")
 
     for edu in cv_data.get("education", []):
-        html += f"""
+        add(f"""
     <div class="entry">
         <div class="entry-header">{edu['degree']}</div>
         <div class="entry-subheader">{edu.get('school', '')}</div>
         <div class="entry-meta">{edu.get('graduation_year', '')}</div>
     </div>
-"""
+""")
 
-    html += f"""
-    <h2>{cv_data['translations'][language]['skills']}</h2>
+    add(f"""
+    <h2>{headings['skills']}</h2>
     <div class="skills">
-"""
+""")
 
-    for skill in cv_data.get("skills", []):
-        html += f"""
+    for category, items in context.skill_lines:
+        add(f"""
         <div>
-            <div class="skill-category">{skill['category']}</div>
-            <div class="skill-items">{', '.join(skill['items'])}</div>
+            <div class="skill-category">{category}</div>
+            <div class="skill-items">{items}</div>
         </div>
-"""
+""")
 
-    html += """
+    add("""
     </div>
-"""
+""")
 
     if cv_data.get("projects"):
-        html += f"""
-    <h2>{cv_data['translations'][language]['projects']}</h2>
-"""
+        add(f"""
+    <h2>{headings['projects']}</h2>
+""")
         for proj in cv_data.get("projects", []):
-            html += f"""
+            add(f"""
     <div class="entry">
         <div class="entry-header">{proj['title']}</div>
         <div class="entry-description">{proj['description']}</div>
-"""
+""")
             if proj.get("technologies"):
-                html += f"""
+                add(f"""
         <div class="entry-meta">Technologies: {', '.join(proj['technologies'])}
         </div>
-"""
+""")
             if proj.get("url"):
-                html += f"""
+                add(f"""
         <div class="entry-meta"><a href="{proj['url']}">{proj['url']}</a></div>
-"""
-            html += """
+""")
+            add("""
     </div>
-"""
+""")
 
     if cv_data.get("certifications"):
-        html += f"""
-    <h2>{cv_data['translations'][language]['certifications']}</h2>
-"""
+        add(f"""
+    <h2>{headings['certifications']}</h2>
+""")
         for cert in cv_data.get("certifications", []):
-            html += f"""
+            add(f"""
     <div class="entry">
         <div class="entry-header">{cert['title']}</div>
         <div class="entry-subheader">{cert.get('issuer', '')}</div>
         <div class="entry-meta">{cert.get('issued_date', '')}</div>
     </div>
-"""
+""")
 
     if cv_data.get("languages"):
-        html += f"""
-    <h2>{cv_data['translations'][language]['languages']}</h2>
+        add(f"""
+    <h2>{headings['languages']}</h2>
     <div class="skills">
-"""
+""")
         for lang_item in cv_data.get("languages", []):
-            html += f"""
+            add(f"""
         <div>
             <div class="skill-category">{lang_item['name']}</div>
             <div class="skill-items">{lang_item['level']}</div>
         </div>
-"""
-        html += """
+""")
+        add("""
     </div>
-"""
+""")
 
-    html += """
+    add("""
 </body>
-</html>"""
+</html>""")
 
-    return html
+    return "".join(parts)
@@ -0,0 +1,69 @@
+"""Single-pass rendering of several output formats from one validated CV."""
+
+from typing import Any
+
+from backend.generators.context import RenderContext
+from backend.generators.json_generator import generate_json
+from backend.generators.limits import RenderLimits
+from backend.metrics import stage
+
+# Formats produced by render_all, in rendering order
+RENDER_FORMATS = ("html", "json", "public_json", "pdf")
+
+
+def render_all(
+    cv_data: dict[str, Any],
+    language: str,
+    formats: tuple[str, ...] = RENDER_FORMATS,
+    context: RenderContext | None = None,
+    compact_public: bool = False,
+    limits: RenderLimits | None = None,
+) -> dict[str, str | bytes]:
+    """Render the requested formats of one CV in one language.
+
+    The formats share one RenderContext, so the contact block, headings,
+    joined skill lists and sanitized personal section are derived once
+    rather than once per generator. WeasyPrint is only imported when the
+    PDF is requested.
+
+    Args:
+        cv_data: Validated CV data with translations
+        language: Language code
+        formats: Formats to render, any of RENDER_FORMATS
+        context: Existing context of cv_data and language to reuse
+        compact_public: Render public_json without indentation
+        limits: Guardrails of the PDF render (default: RenderLimits.from_env())
+
+    Returns:
+        Rendered output by format: str for html, json and public_json, bytes for pdf
+
+    Raises:
+        ValueError: If a format is unknown
+        RenderLimitError: If the PDF render exceeds a limit
+    """
+    unknown = sorted(set(formats) - set(RENDER_FORMATS))
+    if unknown:
+        raise ValueError(f"Unknown format(s): {', '.join(unknown)}")
+
+    context = context or RenderContext(cv_data, language)
+    outputs: dict[str, str | bytes] = {}
+    for fmt in formats:
+        if fmt == "html":
+            # Generators other than JSON are imported on first use, so that
+            # JSON-only runs never load Jinja2 or WeasyPrint
+            from backend.generators.html_generator import generate_html
+
+            with stage("html", lang=language):
+                outputs[fmt] = generate_html(cv_data, language)
+        elif fmt == "json":
+            with stage("json", lang=language):
+                outputs[fmt] = generate_json(cv_data)
+        elif fmt == "public_json":
+            with stage("public_json", lang=language):
+                outputs[fmt] = context.public_json(compact_public)
+        else:
+            from backend.generators.pdf_generator import render_pdf_bytes
+
+            # render_pdf_bytes records its own pdf_* stages
+            outputs[fmt] = render_pdf_bytes(cv_data, language, context=context, limits=limits)
+    return outputs
@@ -0,0 +1,163 @@
+"""
+Per-stage timing and profiling of the generation pipeline.
+
+Pipeline stages (parse, merge, validate, html, json, public_json,
+public_assets, pdf_html, pdf_layout, pdf_write) run inside ``stage()``,
+which does nothing unless instrumentation is enabled through the
+environment, so worker processes inherit the settings:
+
+- ``RESUME_METRICS_FILE``: append one JSON line per stage run to this file
+- ``RESUME_PROFILE_DIR``: write a cProfile dump per stage to this directory,
+  named ``<stage>-<labels>.pstats`` (inspect with ``python -m pstats``)
+
+cProfile hooks the whole process, so profiling is meant for single-threaded
+runs (worker processes are fine). One stage is profiled at a time: nested
+stages are part of the outer stage's dump, and a stage starting in another
+thread meanwhile is only timed, with a RuntimeWarning.
+
+``generate.py --metrics`` and ``--profile`` set these variables, and
+``write_prometheus()`` turns the JSON lines into a Prometheus textfile.
+"""
+
+import cProfile
+import json
+import os
+import re
+import threading
+import time
+import warnings
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from backend.utils import write_atomic
+
+METRICS_ENV = "RESUME_METRICS_FILE"
+PROFILE_ENV = "RESUME_PROFILE_DIR"
+
+# Held by the stage being profiled; only one cProfile profiler can be active
+# per process, and it sees every thread
+_profiler_lock = threading.Lock()
+_profiler_thread: int | None = None
+
+# Record fields that are not labels
+_FIELDS = ("ts", "seconds", "ok", "pid")
+
+
+def _append(metrics_file: str, record: dict[str, Any]) -> None:
+    """Append one record; single small O_APPEND writes don't interleave between processes."""
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(metrics_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def _profile_path(profile_dir: str, name: str, labels: dict[str, str]) -> Path:
+    parts = [name, *(re.sub(r"[^\w.-]", "_", str(value)) for value in labels.values())]
+    return Path(profile_dir) / ("-".join(parts) + ".pstats")
+
+
+@contextmanager
+def stage(name: str, **labels: str) -> Iterator[None]:
+    """Time (and optionally profile) a pipeline stage.
+
+    Args:
+        name: Stage name, e.g. "pdf_layout"
+        **labels: Dimensions of the measurement, e.g. lang="fr", format="pdf"
+    """
+    global _profiler_thread
+
+    metrics_file = os.environ.get(METRICS_ENV)
+    profile_dir = os.environ.get(PROFILE_ENV)
+    if not metrics_file and not profile_dir:
+        yield
+        return
+
+    profiler = None
+    if profile_dir:
+        if _profiler_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            _profiler_thread = threading.get_ident()
+        elif _profiler_thread != threading.get_ident():
+            warnings.warn(
+                f"stage {name!r} not profiled: another thread's stage is being profiled",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+    ok = False
+    started = time.perf_counter()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        yield
+        ok = True
+    finally:
+        seconds = time.perf_counter() - started
+        if profiler is not None:
+            profiler.disable()
+            _profiler_thread = None
+            _profiler_lock.release()
+            Path(profile_dir).mkdir(parents=True, exist_ok=True)  # type: ignore[arg-type]
+            profiler.dump_stats(_profile_path(profile_dir, name, labels))  # type: ignore[arg-type]
+        if metrics_file:
+            record = {
+                "ts": round(time.time(), 3),
+                "stage": name,
+                **labels,
+                "seconds": round(seconds, 6),
+                "ok": ok,
+                "pid": os.getpid(),
+            }
+            _append(metrics_file, record)
+
+
+def read_records(metrics_file: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a JSON-lines metrics file, skipping malformed lines."""
+    with open(metrics_file, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def write_prometheus(records: Iterable[dict[str, Any]], output: Path) -> None:
+    """Write stage records as a Prometheus textfile (for node_exporter's textfile collector).
+
+    Runs of the same stage and labels are summed. The file is replaced
+    atomically so the collector never reads a partial file.
+
+    Args:
+        records: Stage records, e.g. from read_records()
+        output: Destination .prom file
+    """
+    seconds: dict[tuple[tuple[str, str], ...], float] = {}
+    runs: dict[tuple[tuple[str, str], ...], int] = {}
+    failures: dict[tuple[tuple[str, str], ...], int] = {}
+    for record in records:
+        pairs = ((key, str(value)) for key, value in record.items() if key not in _FIELDS)
+        labels = tuple(sorted(pairs))
+        seconds[labels] = seconds.get(labels, 0.0) + record.get("seconds", 0.0)
+        runs[labels] = runs.get(labels, 0) + 1
+        failures[labels] = failures.get(labels, 0) + (not record.get("ok", True))
+
+    lines = []
+    for metric, kind, help_text, values in (
+        ("resume_stage_seconds", "gauge", "Time spent in each generation stage", seconds),
+        ("resume_stage_runs", "gauge", "Number of runs of each generation stage", runs),
+        ("resume_stage_failures", "gauge", "Number of failed runs of each stage", failures),
+    ):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for labels, value in sorted(values.items()):
+            label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels)
+            lines.append(f"{metric}{{{label_text}}} {round(value, 6)}")
+
+    write_atomic(output, "\n".join(lines) + "\n")
@@ -0,0 +1,53 @@
+"""Load CV files as the generators receive them: merged, validated, translated."""
+
+from pathlib import Path
+from typing import Any
+
+from backend.build_cache import data_digest
+from backend.metrics import stage
+from backend.parsers.schema import validate_cv_dump
+from backend.parsers.yaml_parser import parse_cv_file, parse_cv_with_base
+
+TRANSLATIONS_NAME = "ui_translations.yml"
+
+
+def validate_cv_data(
+    raw_data: dict[str, Any],
+    ui_translations: dict[str, Any],
+    lang: str = "en",
+) -> dict[str, Any]:
+    """Validate merged CV data and attach the UI translations.
+
+    Content validated before by this process is not validated again.
+
+    Args:
+        raw_data: CV data merged with the base language, as from parse_cv_with_base()
+        ui_translations: Parsed UI translations
+        lang: Language code, labelling the validate stage
+
+    Returns:
+        Validated CV data, as the generators receive it
+
+    Raises:
+        ValidationError: If the data doesn't match the schema
+    """
+    with stage("validate", lang=lang):
+        cv_data = validate_cv_dump(raw_data, data_digest(raw_data))
+    cv_data["translations"] = ui_translations
+    return cv_data
+
+
+def load_cv(cv_file: Path, translations_file: Path | None = None) -> dict[str, Any]:
+    """Parse, merge and validate a CV file and attach its UI translations.
+
+    Args:
+        cv_file: Language-specific CV file, merged with the English base
+        translations_file: UI translations (default: ui_translations.yml next to cv_file)
+
+    Returns:
+        Validated CV data, as the generators receive it
+    """
+    raw_data = parse_cv_with_base(str(cv_file))
+    translations_file = translations_file or cv_file.parent / TRANSLATIONS_NAME
+    ui_translations = parse_cv_file(str(translations_file))
+    return validate_cv_data(raw_data, ui_translations, cv_file.stem.replace("cv_", ""))
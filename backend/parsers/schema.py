@@ -1,9 +1,16 @@
 """CV data schema validation."""
 
 from datetime import date
-from typing import Any, Dict, List, Optional
+from types import UnionType
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter
+
+from backend.parsers.yaml_parser import copy_tree
+from backend.utils import LRUCache
+
+# Maximum number of validated CVs remembered by content digest
+VALIDATED_CACHE_SIZE = 256
 
 
 class SocialLink(BaseModel):
@@ -87,6 +94,13 @@ class CVData(BaseModel):
     projects: Optional[List[Project]] = []
 
 
+# Compiled once and reused by every validation
+_CV_ADAPTER: TypeAdapter[CVData] = TypeAdapter(CVData)
+
+# Content digest of input data -> validated dump
+_validated: LRUCache[str, Dict[str, Any]] = LRUCache(VALIDATED_CACHE_SIZE)
+
+
 def validate_cv(data: Dict[str, Any]) -> CVData:
     """Validate CV data against schema.
 
@@ -99,4 +113,105 @@ def validate_cv(data: Dict[str, Any]) -> CVData:
     Raises:
         ValidationError: If data doesn't match schema
     """
-    return CVData(**data)
+    return _CV_ADAPTER.validate_python(data)
+
+
+def validate_cv_json(raw: str | bytes) -> CVData:
+    """Validate CV data straight from JSON, without building a dict first.
+
+    Args:
+        raw: JSON document
+
+    Returns:
+        Validated CVData object
+
+    Raises:
+        ValidationError: If data doesn't match schema
+    """
+    return _CV_ADAPTER.validate_json(raw)
+
+
+def _construct(annotation: Any, value: Any) -> Any:
+    """Build nested models from already validated data, without checks."""
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        inner = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _construct(inner[0], value) if len(inner) == 1 else value
+    if origin is list:
+        (item_type,) = get_args(annotation)
+        return [_construct(item_type, item) for item in value]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        fields = {
+            name: _construct(field.annotation, value[name])
+            for name, field in annotation.model_fields.items()
+            if name in value
+        }
+        return annotation.model_construct(**fields)
+    return value
+
+
+def construct_cv(data: Dict[str, Any]) -> CVData:
+    """Build a CVData from trusted, already validated data using model_construct.
+
+    No validation or coercion happens, so only pass data produced by a
+    validated model (e.g. its model_dump()).
+
+    Args:
+        data: Validated CV data dictionary
+
+    Returns:
+        CVData object
+    """
+    return _construct(CVData, data)
+
+
+def validate_cv_dump(data: Dict[str, Any], digest: str) -> Dict[str, Any]:
+    """Validate CV data and return its model_dump(), skipping inputs seen before.
+
+    Inputs are identified by a content digest computed by the caller (e.g.
+    backend.build_cache.data_digest). A digest that already validated in
+    this process returns a copy of the remembered dump directly.
+
+    Args:
+        data: CV data dictionary
+        digest: Content digest of data
+
+    Returns:
+        Validated CV data dictionary
+
+    Raises:
+        ValidationError: If data doesn't match schema
+    """
+    dump = _validated.get(digest)
+    if dump is None:
+        dump = validate_cv(data).model_dump()
+        _validated.put(digest, dump)
+    return copy_tree(dump)
+
+
+def validate_cv_cached(data: Dict[str, Any], digest: str) -> CVData:
+    """Validate CV data, using model_construct for digests validated before.
+
+    Args:
+        data: CV data dictionary
+        digest: Content digest of data
+
+    Returns:
+        Validated CVData object
+
+    Raises:
+        ValidationError: If data doesn't match schema
+    """
+    dump = _validated.get(digest)
+    if dump is not None:
+        return construct_cv(dump)
+    cv = validate_cv(data)
+    _validated.put(digest, cv.model_dump())
+    return cv
+
+
+def clear_validation_cache() -> None:
+    """Forget every validated digest."""
+    _validated.clear()
@@ -1,46 +1,150 @@
 """YAML parser for CV data."""
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from backend.metrics import stage
+from backend.utils import LRUCache
+
+try:
+    # libyaml-backed loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Maximum number of parsed files kept in the parse cache
+PARSE_CACHE_SIZE = 128
+
+# Resolved path -> (mtime_ns, size, parsed data)
+_parse_cache: LRUCache[str, tuple[int, int, dict[str, Any]]] = LRUCache(PARSE_CACHE_SIZE)
+
+
+def copy_tree(value: Any) -> Any:
+    """Copy the dicts and lists of a parsed YAML tree.
+
+    Scalars (str, int, date, ...) are immutable and shared.
+    """
+    if isinstance(value, dict):
+        return {key: copy_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_tree(item) for item in value]
+    return value
+
+
+def _load_cached(filepath: str) -> dict[str, Any]:
+    """Parse a YAML file through the parse cache.
+
+    Entries are keyed on (path, mtime, size) so edited files are re-read.
+    The returned data is the cached object itself and must not be mutated.
+    """
+    path = os.path.realpath(filepath)
+    stat = os.stat(path)
+
+    entry = _parse_cache.get(path)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=SafeLoader) or {}
+    # Replaces the entry of an older version of the file
+    _parse_cache.put(path, (stat.st_mtime_ns, stat.st_size, data))
+    return data
+
+
+def clear_parse_cache() -> None:
+    """Empty the parse cache."""
+    _parse_cache.clear()
+
 
 def parse_cv_file(filepath: str) -> dict[str, Any]:
     """Parse CV YAML file.
 
+    Results are memoized per (path, mtime, size); each call returns a
+    private copy, so callers may mutate it freely.
+
     Args:
         filepath: Path to YAML file
 
     Returns:
         Parsed CV data dictionary
     """
+    return copy_tree(_load_cached(filepath))
+
+
+def iter_cv_bundle(filepath: str) -> Iterator[dict[str, Any]]:
+    """Lazily parse a multi-document YAML bundle of CVs.
+
+    Documents are separated by ``---`` and parsed one at a time, so only
+    the CV being processed is held in memory. Empty documents are skipped.
+    Bundles are streamed, not cached.
+
+    Args:
+        filepath: Path to YAML bundle file
+
+    Yields:
+        Parsed CV data dictionary per document
+    """
     with open(filepath, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    return data or {}
+        for document in yaml.load_all(f, Loader=SafeLoader):
+            if document:
+                yield document
+
+
+# Field used to match list items between base and override files
+DEFAULT_MERGE_KEY = "id"
+
+# Per-section match fields for lists whose items have no "id"
+DEFAULT_MERGE_KEYS: dict[str, str] = {
+    "skills": "category",
+    "languages": "name",
+}
 
+# What to do with override items whose key has no match in the base list
+UNMATCHED_POLICIES = ("ignore", "append", "error")
 
-def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+
+def deep_merge(
+    base: dict[str, Any],
+    override: dict[str, Any],
+    merge_keys: dict[str, str] | None = None,
+    unmatched: str = "ignore",
+) -> dict[str, Any]:
     """Deep merge override into base dict.
 
-    Lists are merged by matching 'id' field if present.
+    Lists are merged by matching items on a key field: the section's entry
+    in merge_keys, else "id". Neither input is mutated.
 
     Args:
         base: Base dictionary
         override: Override dictionary
+        merge_keys: Match field per section name (default: DEFAULT_MERGE_KEYS)
+        unmatched: Policy for unmatched override list items (ignore, append, error)
 
     Returns:
         Merged dictionary
     """
+    if merge_keys is None:
+        merge_keys = DEFAULT_MERGE_KEYS
+
     result = base.copy()
 
     for key, value in override.items():
         if key in result:
             if isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = deep_merge(result[key], value)
+                result[key] = deep_merge(result[key], value, merge_keys, unmatched)
             elif isinstance(result[key], list) and isinstance(value, list):
-                # Merge lists by matching 'id' field
-                result[key] = merge_lists_by_id(result[key], value)
+                # Merge lists by matching the section's key field
+                result[key] = merge_lists_by_id(
+                    result[key],
+                    value,
+                    key=merge_keys.get(key, DEFAULT_MERGE_KEY),
+                    unmatched=unmatched,
+                    merge_keys=merge_keys,
+                )
             else:
                 result[key] = value
         else:
@@ -49,47 +153,83 @@ def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]
     return result
 
 
-def merge_lists_by_id(base_list: list[Any], override_list: list[Any]) -> list[Any]:
-    """Merge two lists by matching 'id' field.
+def merge_lists_by_id(
+    base_list: list[Any],
+    override_list: list[Any],
+    key: str = DEFAULT_MERGE_KEY,
+    unmatched: str = "ignore",
+    merge_keys: dict[str, str] | None = None,
+) -> list[Any]:
+    """Merge two lists by matching a key field ('id' by default).
+
+    The override list is indexed once, so the merge is linear in the size
+    of both lists. Base order is kept; when several override items share a
+    key, the first one wins.
 
     Args:
         base_list: Base list
         override_list: Override list
+        key: Field identifying matching items
+        unmatched: Policy for override items whose key is not in the base list:
+            "ignore" drops them, "append" adds them after the base items,
+            "error" raises ValueError
+        merge_keys: Match fields passed on to nested merges
 
     Returns:
         Merged list
+
+    Raises:
+        ValueError: If unmatched is unknown, or is "error" and an override item has no match
     """
-    # Create lookup by id for base items
-    base_by_id = {}
-    for item in base_list:
-        if isinstance(item, dict) and "id" in item:
-            base_by_id[item["id"]] = item
+    if unmatched not in UNMATCHED_POLICIES:
+        raise ValueError(
+            f"Unknown unmatched policy {unmatched!r}, expected one of {UNMATCHED_POLICIES}",
+        )
+
+    # Create lookup by key for override items
+    override_by_key: dict[Any, dict[str, Any]] = {}
+    for item in override_list:
+        if isinstance(item, dict) and key in item:
+            override_by_key.setdefault(item[key], item)
 
     result = []
+    base_keys = set()
     for item in base_list:
-        if isinstance(item, dict) and "id" in item:
-            item_id = item["id"]
-            # Find matching override
-            override_item = next(
-                (o for o in override_list if isinstance(o, dict) and o.get("id") == item_id),
-                None,
-            )
-            if override_item:
-                result.append(deep_merge(item, override_item))
-            else:
-                result.append(item)
-        else:
+        if isinstance(item, dict) and key in item:
+            item_key = item[key]
+            base_keys.add(item_key)
+            override_item = override_by_key.get(item_key)
+            if override_item is not None:
+                result.append(deep_merge(item, override_item, merge_keys, unmatched))
+                continue
+        result.append(item)
+
+    if unmatched != "ignore":
+        for item_key, item in override_by_key.items():
+            if item_key in base_keys:
+                continue
+            if unmatched == "error":
+                raise ValueError(
+                    f"Override item with {key}={item_key!r} has no match in the base list",
+                )
             result.append(item)
 
     return result
 
 
-def parse_cv_with_base(filepath: str, base_lang: str = "en") -> dict[str, Any]:
+def parse_cv_with_base(
+    filepath: str,
+    base_lang: str = "en",
+    merge_keys: dict[str, str] | None = None,
+    unmatched: str = "ignore",
+) -> dict[str, Any]:
     """Parse CV file with English as base and merge overrides.
 
     Args:
         filepath: Path to language-specific CV file
         base_lang: Base language code (default: en)
+        merge_keys: Match field per list section (default: DEFAULT_MERGE_KEYS)
+        unmatched: Policy for override list items missing from the base (ignore, append, error)
 
     Returns:
         Merged CV data dictionary
@@ -99,14 +239,19 @@ def parse_cv_with_base(filepath: str, base_lang: str = "en") -> dict[str, Any]:
 
     # If it's the base language, just return it
     if lang == base_lang:
-        return parse_cv_file(filepath)
+        with stage("parse", lang=lang):
+            return parse_cv_file(filepath)
 
-    # Load base (English) file
+    # Load base (English) file, parsed once and shared by every language
     base_file = path.parent / f"cv_{base_lang}.yml"
-    base_data = parse_cv_file(str(base_file))
+    with stage("parse", lang=base_lang):
+        base_data = _load_cached(str(base_file))
 
     # Load language override
-    override_data = parse_cv_file(filepath)
+    with stage("parse", lang=lang):
+        override_data = _load_cached(filepath)
 
-    # Merge
-    return deep_merge(base_data, override_data)
+    # Merge (deep_merge never mutates its inputs), then detach the result
+    # from the cached trees it shares nested values with
+    with stage("merge", lang=lang):
+        return copy_tree(deep_merge(base_data, override_data, merge_keys, unmatched))
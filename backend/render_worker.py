@@ -0,0 +1,363 @@
+"""
+Long-lived PDF render worker.
+
+Keeps a pool of processes with WeasyPrint, fonts and the PDF stylesheet
+preloaded, and renders CV jobs received as JSON lines, either over
+stdin/stdout or over a Unix socket:
+
+    python -m backend.render_worker --workers 4
+    python -m backend.render_worker --socket /tmp/cv-render.sock
+
+A job names its CV either as a YAML file (merged with the English base,
+validated and given the UI translations found next to it) or as
+already validated data:
+
+    {"id": "1", "cv_file": "cv-data/cv_fr.yml", "output": "dist/cv_fr.pdf"}
+    {"id": "2", "lang": "en", "cv_data": {...}}
+
+Each job gets one result line, in completion order. Jobs without an
+"output" path get the PDF back base64-encoded, unless they set
+"discard": true to only check that the CV renders:
+
+    {"id": "1", "ok": true, "output": "dist/cv_fr.pdf", "size": 51234, "timing": {...}}
+    {"id": "2", "ok": true, "pdf_base64": "...", "size": 50873, "timing": {...}}
+    {"id": "3", "ok": false, "error": "ValueError: ...", "timing": {...}}
+
+Jobs over the limits set with --max-entries, --max-field-chars,
+--max-pages, --max-seconds or --max-memory-mb (see
+backend.generators.limits) fail with the exceeded limit:
+
+    {"id": "4", "ok": false, "error": "RenderLimitError: ...",
+     "limit": {"limit": "max_pages", "value": 212, "maximum": 20, "where": ""}, ...}
+"""
+
+import argparse
+import base64
+import functools
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+
+from backend.generators.limits import (
+    LIMIT_ENVS,
+    RenderLimitError,
+    RenderLimits,
+    apply_memory_limit,
+)
+from backend.parsers.loader import load_cv
+
+# Environment variable naming the socket of a running worker; when set,
+# generate.py and the validation hook send PDF renders to it
+RENDER_SOCKET_ENV = "RESUME_RENDER_SOCKET"
+
+# Seconds a client waits for the next result when no time limit is set
+CLIENT_TIMEOUT_S = 120.0
+# Added to the PDF layout time limit for loading the CV and writing the PDF
+CLIENT_TIMEOUT_MARGIN_S = 30.0
+
+
+def warm_up(limits: RenderLimits | None = None, preload_pdf: bool = True) -> None:
+    """Pool initializer: import WeasyPrint, parse the stylesheet and fonts, cap memory.
+
+    Args:
+        limits: Render limits whose max_memory_mb caps this worker
+            (default: RenderLimits.from_env())
+        preload_pdf: Load the PDF resources now; without it, the first PDF
+            render of the worker loads them
+    """
+    if preload_pdf:
+        from backend.generators.pdf_generator import pdf_resources
+
+        pdf_resources()
+    apply_memory_limit((limits or RenderLimits.from_env()).max_memory_mb)
+
+
+def _load_job(job: dict[str, Any]) -> tuple[dict[str, Any], str]:
+    """Return the validated CV data (with translations) and language of a job."""
+    if "cv_data" in job:
+        return job["cv_data"], job.get("lang", "en")
+
+    if "cv_file" not in job:
+        raise ValueError("job needs either 'cv_file' or 'cv_data'")
+
+    cv_file = Path(job["cv_file"])
+    lang = job.get("lang") or cv_file.stem.replace("cv_", "")
+    translations_file = job.get("translations_file")
+    return load_cv(cv_file, Path(translations_file) if translations_file else None), lang
+
+
+def render_job(job: dict[str, Any]) -> dict[str, Any]:
+    """Render one job; runs inside a worker process and never raises.
+
+    Args:
+        job: Decoded job (see module docstring)
+
+    Returns:
+        Result dict without the parent-side timings
+    """
+    started = time.perf_counter()
+    result: dict[str, Any] = {"id": job.get("id")}
+    try:
+        cv_data, lang = _load_job(job)
+
+        from backend.generators.pdf_generator import generate_pdf, render_pdf_buffer
+
+        output = job.get("output")
+        if output:
+            generate_pdf(cv_data, output, lang)
+            result.update(ok=True, output=output, size=os.path.getsize(output))
+        else:
+            pdf = render_pdf_buffer(cv_data, lang)
+            result.update(ok=True, size=pdf.nbytes)
+            if not job.get("discard"):
+                result["pdf_base64"] = base64.b64encode(pdf).decode("ascii")
+    except RenderLimitError as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}", limit=e.to_dict())
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    result["render_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+class RenderService:
+    """Dispatch render jobs to a pool of preloaded worker processes."""
+
+    def __init__(self, workers: int = 1, executor: Executor | None = None):
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
+
+    def submit(self, job: dict[str, Any]) -> Future:
+        """Queue a job.
+
+        Returns:
+            Future resolving to the result dict, including per-job timing
+        """
+        submitted = time.perf_counter()
+        done: Future = Future()
+
+        def _finish(future: Future) -> None:
+            try:
+                result = future.result()
+            except Exception as e:  # worker process died
+                result = {"id": job.get("id"), "ok": False, "error": f"{type(e).__name__}: {e}"}
+            total_ms = round((time.perf_counter() - submitted) * 1000, 2)
+            render_ms = result.pop("render_ms", 0.0)
+            result["timing"] = {
+                "render_ms": render_ms,
+                "queued_ms": round(max(total_ms - render_ms, 0.0), 2),
+                "total_ms": total_ms,
+            }
+            done.set_result(result)
+
+        self.executor.submit(render_job, job).add_done_callback(_finish)
+        return done
+
+    def submit_line(self, line: str) -> Future:
+        """Queue a job given as one JSON line; malformed lines fail immediately."""
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("job must be a JSON object")
+        except ValueError as e:
+            failed: Future = Future()
+            failed.set_result({"id": None, "ok": False, "error": f"invalid job: {e}"})
+            return failed
+        return self.submit(job)
+
+    def serve_stream(self, infile: IO[str], outfile: IO[str]) -> None:
+        """Serve jobs read from infile until EOF, writing results as they complete.
+
+        Returns once every result is written, so the caller may close outfile.
+        """
+        lock = threading.Lock()
+        written: list[threading.Event] = []
+
+        def _write_when_done(event: threading.Event, future: Future) -> None:
+            # Done callbacks run after result() waiters are woken, so waiting on
+            # the futures alone could return before the last result is written
+            try:
+                with lock:
+                    outfile.write(json.dumps(future.result()) + "\n")
+                    outfile.flush()
+            finally:
+                event.set()
+
+        for line in infile:
+            if line.strip():
+                event = threading.Event()
+                written.append(event)
+                self.submit_line(line).add_done_callback(functools.partial(_write_when_done, event))
+
+        for event in written:
+            event.wait()
+
+    def socket_server(self, socket_path: str) -> socketserver.ThreadingUnixStreamServer:
+        """Bind a Unix socket server, one JSON-lines stream per connection."""
+        service = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                reader = io.TextIOWrapper(self.rfile, encoding="utf-8")
+                writer = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+                service.serve_stream(reader, writer)
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return socketserver.ThreadingUnixStreamServer(socket_path, _Handler)
+
+    def serve_socket(self, socket_path: str) -> None:
+        """Serve jobs over a Unix socket until interrupted."""
+        with self.socket_server(socket_path) as server:
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(socket_path)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self.executor.shutdown()
+
+
+def client_timeout(limits: RenderLimits | None = None) -> float:
+    """Return how long a client waits for a worker before giving up.
+
+    Args:
+        limits: Render limits (default: RenderLimits.from_env())
+
+    Returns:
+        Seconds: the layout time limit plus a margin, or CLIENT_TIMEOUT_S without one
+    """
+    max_seconds = (limits or RenderLimits.from_env()).max_seconds
+    return CLIENT_TIMEOUT_S if max_seconds is None else max_seconds + CLIENT_TIMEOUT_MARGIN_S
+
+
+class RenderClient:
+    """Submit render jobs to a worker listening on a Unix socket.
+
+    Connecting, sending jobs and waiting for each result time out after
+    timeout seconds (default: client_timeout()) with a TimeoutError; the
+    client must be closed after one.
+    """
+
+    def __init__(self, socket_path: str, timeout: float | None = None):
+        self.socket_path = socket_path
+        self.timeout = client_timeout() if timeout is None else timeout
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(self.timeout)
+        try:
+            self._sock.connect(socket_path)
+        except TimeoutError:
+            self._sock.close()
+            raise self._timed_out("accepted the connection") from None
+        self._reader = self._sock.makefile("r", encoding="utf-8")
+        self._next_id = 0
+
+    def __enter__(self) -> "RenderClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._reader.close()
+        self._sock.close()
+
+    def _timed_out(self, what: str) -> TimeoutError:
+        return TimeoutError(
+            f"render worker at {self.socket_path} has not {what} within {self.timeout:g}s",
+        )
+
+    def render_many(self, jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send jobs and wait for all results.
+
+        Args:
+            jobs: Jobs (see module docstring); ids are assigned when missing
+
+        Returns:
+            Results in the order of jobs
+
+        Raises:
+            ConnectionError: If the worker closed the connection
+            TimeoutError: If the worker stopped responding
+        """
+        ids = []
+        payload = []
+        for job in jobs:
+            if "id" not in job:
+                self._next_id += 1
+                job = {**job, "id": f"job-{self._next_id}"}
+            ids.append(job["id"])
+            payload.append(json.dumps(job, ensure_ascii=False, default=str) + "\n")
+        try:
+            self._sock.sendall("".join(payload).encode("utf-8"))
+        except TimeoutError:
+            raise self._timed_out("accepted the jobs") from None
+
+        results = {}
+        while len(results) < len(ids):
+            try:
+                line = self._reader.readline()
+            except TimeoutError:
+                raise self._timed_out("sent a result") from None
+            if not line:
+                raise ConnectionError("render worker closed the connection")
+            result = json.loads(line)
+            results[result["id"]] = result
+        return [results[job_id] for job_id in ids]
+
+    def render(self, **job: Any) -> dict[str, Any]:
+        """Send one job and wait for its result."""
+        return self.render_many([job])[0]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the render worker."""
+    parser = argparse.ArgumentParser(description="Serve PDF render jobs from preloaded workers.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--socket", help="Unix socket path (default: JSON lines on stdin/stdout)")
+    for name, help_text in (
+        ("max_entries", "entries per CV section"),
+        ("max_field_chars", "characters per CV field"),
+        ("max_pages", "pages per PDF"),
+        ("max_seconds", "seconds per PDF layout"),
+        ("max_memory_mb", "MiB of address space per worker process"),
+    ):
+        parser.add_argument(
+            "--" + name.replace("_", "-"),
+            type=float if name == "max_seconds" else int,
+            help=f"reject jobs over this many {help_text} (default: ${LIMIT_ENVS[name]})",
+        )
+    args = parser.parse_args(argv)
+    # Exported so that the worker processes inherit the limits
+    for name, env in LIMIT_ENVS.items():
+        if getattr(args, name) is not None:
+            os.environ[env] = str(getattr(args, name))
+    try:
+        RenderLimits.from_env()
+    except ValueError as e:
+        parser.error(str(e))
+
+    service = RenderService(workers=args.workers)
+    try:
+        if args.socket:
+            print(f"🖨️  Render worker listening on {args.socket}", file=sys.stderr)
+            service.serve_socket(args.socket)
+        else:
+            service.serve_stream(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""
+Seeded generator of synthetic CVs for load, scaling and stress tests.
+
+Produces schema-valid base CVs (``cv_en.yml``) of any size plus language
+override files that translate a configurable share of the entries, so
+benchmarks can exercise large merges, long templates and multi-page PDFs
+without hand-written fixtures. The same seed and sizes always give the
+same files. Each output directory is one tenant folder for backend.batch
+(generate.py always builds the repository's own cv-data/):
+
+    python -m backend.synthetic build/synthetic/large --experiences 500 --projects 200
+    python -m backend.batch build/synthetic --out build/synthetic-out
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+BASE_LANGUAGE = "en"
+
+# Sizes of a generated CV, roughly those of a real one
+DEFAULT_SIZES = {
+    "experiences": 3,
+    "education": 2,
+    "projects": 2,
+    "skills": 4,
+    "certifications": 2,
+    "spoken_languages": 3,
+}
+
+# Section headings written to ui_translations.yml for each supported language
+HEADINGS: dict[str, dict[str, str]] = {
+    "en": {
+        "experience": "Experience",
+        "education": "Education",
+        "skills": "Skills",
+        "projects": "Projects",
+        "certifications": "Certifications",
+        "summary": "Summary",
+        "languages": "Languages",
+    },
+    "fr": {
+        "experience": "Expérience",
+        "education": "Éducation",
+        "skills": "Compétences",
+        "projects": "Projets",
+        "certifications": "Certifications",
+        "summary": "Résumé",
+        "languages": "Langues",
+    },
+    "it": {
+        "experience": "Esperienze",
+        "education": "Istruzione",
+        "skills": "Competenze",
+        "projects": "Progetti",
+        "certifications": "Certificazioni",
+        "summary": "Riassunto",
+        "languages": "Lingue",
+    },
+    "de": {
+        "experience": "Berufserfahrung",
+        "education": "Ausbildung",
+        "skills": "Kenntnisse",
+        "projects": "Projekte",
+        "certifications": "Zertifizierungen",
+        "summary": "Profil",
+        "languages": "Sprachen",
+    },
+}
+
+_FIRST_NAMES = ["Alex", "Maria", "Chen", "Amara", "Luca", "Sofia", "Jonas", "Priya", "Omar"]
+_LAST_NAMES = ["Rossi", "Martin", "Nakamura", "Okafor", "Schmidt", "Silva", "Novak", "Haddad"]
+_CITIES = ["Lausanne", "Milan", "Lyon", "Berlin", "Toronto", "Austin", "Lisbon", "Singapore"]
+_COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Vandelay", "Stark", "Wayne"]
+_SUFFIXES = ["Labs", "Systems", "Cloud", "Analytics", "Networks", "Industries"]
+_TITLES = ["Software Engineer", "SRE", "Platform Engineer", "Tech Lead", "Architect"]
+_LEVELS = ["Junior", "", "Senior", "Staff", "Principal"]
+_TECHNOLOGIES = [
+    "Python", "Go", "Rust", "TypeScript", "React", "Kubernetes", "Terraform", "AWS",
+    "GCP", "PostgreSQL", "Kafka", "Redis", "Docker", "Ansible", "GraphQL", "Linux",
+]  # fmt: skip
+_SKILL_CATEGORIES = ["Languages", "Cloud", "Data", "Frontend", "DevOps", "Security", "Monitoring"]
+_DEGREES = ["BSc Computer Science", "MSc Software Engineering", "MSc Data Science", "PhD Systems"]
+_ISSUERS = ["Amazon Web Services", "Cloud Native Computing Foundation", "HashiCorp", "Google Cloud"]
+_SPOKEN = ["English", "French", "Italian", "German", "Spanish", "Mandarin", "Japanese", "Arabic"]
+_SPOKEN_LEVELS = ["Native", "Fluent", "Advanced", "Intermediate", "Basic"]
+_WORDS = (
+    "designed built migrated automated scaled reduced improved led mentored delivered "
+    "platform pipeline service cluster latency throughput reliability cost deployment "
+    "observability infrastructure team customers release architecture data api"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng, rng.randint(8, 16)) for _ in range(sentences))
+
+
+def generate_cv(
+    seed: int = 0,
+    experiences: int = DEFAULT_SIZES["experiences"],
+    education: int = DEFAULT_SIZES["education"],
+    projects: int = DEFAULT_SIZES["projects"],
+    skills: int = DEFAULT_SIZES["skills"],
+    certifications: int = DEFAULT_SIZES["certifications"],
+    spoken_languages: int = DEFAULT_SIZES["spoken_languages"],
+) -> dict[str, Any]:
+    """Generate a base-language CV conforming to CVData.
+
+    Args:
+        seed: Random seed; equal seeds and sizes give equal CVs
+        experiences: Number of experience entries
+        education: Number of education entries
+        projects: Number of projects
+        skills: Number of skill categories (names repeat with a counter beyond the pool)
+        certifications: Number of certifications
+        spoken_languages: Number of entries in the languages section
+
+    Returns:
+        CV data as written to cv_en.yml
+    """
+    rng = random.Random(seed)
+    first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+    handle = f"{first}.{last}".lower()
+    today = date(2025, 1, 1)
+
+    cv: dict[str, Any] = {
+        "personal": {
+            "name": f"{first} {last}",
+            "email": f"{handle}@example.com",
+            "phone": f"+41 {rng.randint(10, 99)} {rng.randint(100, 999)} {rng.randint(10, 99)} 00",
+            "location": rng.choice(_CITIES),
+            "birth_date": date(1970, 1, 1) + timedelta(days=rng.randint(0, 12000)),
+            "website": f"https://{handle.replace('.', '')}.dev",
+            "socials": [
+                {"platform": "github", "url": f"https://github.com/{handle}"},
+                {"platform": "linkedin", "url": f"https://linkedin.com/in/{handle}"},
+            ],
+        },
+        "summary": _paragraph(rng, 3),
+        "experience": [],
+        "education": [],
+        "skills": [],
+        "certifications": [],
+        "languages": [],
+        "projects": [],
+    }
+
+    end = today.year
+    for n in range(experiences):
+        # Going back in time, floored so that huge CVs keep plausible years
+        start = max(1960, end - rng.randint(1, 4))
+        level = rng.choice(_LEVELS)
+        cv["experience"].append(
+            {
+                "id": f"exp_{n + 1}",
+                "company": f"{rng.choice(_COMPANIES)} {rng.choice(_SUFFIXES)}",
+                "location": rng.choice(_CITIES),
+                "period": f"{start} - Present" if n == 0 else f"{start} - {end}",
+                "title": f"{level} {rng.choice(_TITLES)}".strip(),
+                "technologies": rng.sample(_TECHNOLOGIES, rng.randint(2, 6)),
+                "description": _paragraph(rng),
+            }
+        )
+        end = start
+
+    for n in range(education):
+        cv["education"].append(
+            {
+                "id": f"edu_{n + 1}",
+                "degree": rng.choice(_DEGREES),
+                "school": f"University of {rng.choice(_CITIES)}",
+                "graduation_year": today.year - 5 - 3 * n,
+                "description": _sentence(rng, 12),
+            }
+        )
+
+    for n in range(skills):
+        category = _SKILL_CATEGORIES[n % len(_SKILL_CATEGORIES)]
+        if n >= len(_SKILL_CATEGORIES):
+            category = f"{category} {n // len(_SKILL_CATEGORIES) + 1}"
+        items = rng.sample(_TECHNOLOGIES, rng.randint(3, 8))
+        cv["skills"].append({"category": category, "items": items})
+
+    for n in range(certifications):
+        issued = today - timedelta(days=rng.randint(30, 3000))
+        cv["certifications"].append(
+            {
+                "id": f"cert_{n + 1}",
+                "title": f"Certified {rng.choice(_TECHNOLOGIES)} {rng.choice(_TITLES)}",
+                "issuer": rng.choice(_ISSUERS),
+                "issued_date": issued,
+                "expires_date": issued + timedelta(days=3 * 365),
+            }
+        )
+
+    for n in range(spoken_languages):
+        name = _SPOKEN[n % len(_SPOKEN)]
+        if n >= len(_SPOKEN):
+            name = f"{name} {n // len(_SPOKEN) + 1}"
+        level = _SPOKEN_LEVELS[min(n, len(_SPOKEN_LEVELS) - 1)]
+        cv["languages"].append({"name": name, "level": level})
+
+    for n in range(projects):
+        cv["projects"].append(
+            {
+                "id": f"proj_{n + 1}",
+                "title": f"{rng.choice(_WORDS).capitalize()} {rng.choice(_WORDS)}",
+                "technologies": rng.sample(_TECHNOLOGIES, rng.randint(2, 5)),
+                "description": _paragraph(rng, 2),
+                "url": f"https://github.com/{handle}/project-{n + 1}",
+            }
+        )
+
+    return cv
+
+
+def generate_override(
+    base: dict[str, Any],
+    lang: str,
+    override_ratio: float = 0.5,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Generate a language override file for a base CV.
+
+    Translated entries carry only their match key (id, category or name)
+    and the translated fields, like the hand-written cv_fr.yml.
+
+    Args:
+        base: Base CV from generate_cv()
+        lang: Language code of the override
+        override_ratio: Share of list entries translated, from 0.0 to 1.0
+        seed: Random seed choosing the translated entries
+
+    Returns:
+        Override data as written to cv_<lang>.yml
+    """
+    if not 0.0 <= override_ratio <= 1.0:
+        raise ValueError(f"override_ratio must be between 0 and 1, got {override_ratio}")
+    rng = random.Random(f"{seed}:{lang}")
+    tag = f"[{lang}]"
+
+    def _pick(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        count = round(len(entries) * override_ratio)
+        chosen = sorted(rng.sample(range(len(entries)), count))
+        return [entries[i] for i in chosen]
+
+    override: dict[str, Any] = {"summary": f"{tag} {base['summary']}"}
+    sections: dict[str, tuple[str, tuple[str, ...]]] = {
+        "experience": ("id", ("title", "description")),
+        "education": ("id", ("degree", "description")),
+        "projects": ("id", ("title", "description")),
+        "certifications": ("id", ("title",)),
+        "skills": ("category", ()),
+        "languages": ("name", ("level",)),
+    }
+    for section, (key, fields) in sections.items():
+        entries = []
+        for entry in _pick(base.get(section, [])):
+            translated = {key: entry[key]}
+            for field in fields:
+                if entry.get(field):
+                    translated[field] = f"{tag} {entry[field]}"
+            if section == "skills":
+                translated["items"] = [f"{item} {tag}" for item in entry["items"]]
+            entries.append(translated)
+        if entries:
+            override[section] = entries
+    return override
+
+
+def write_cv_set(
+    directory: Path,
+    languages: tuple[str, ...] = ("en", "fr", "it"),
+    seed: int = 0,
+    override_ratio: float = 0.5,
+    **sizes: int,
+) -> list[Path]:
+    """Write a base CV, its language overrides and UI translations to a directory.
+
+    Args:
+        directory: Destination, created if missing (e.g. a batch tenant folder)
+        languages: Languages to write; the base language is always included
+        seed: Random seed
+        override_ratio: Share of list entries translated in each override
+        **sizes: Entry counts passed to generate_cv()
+
+    Returns:
+        Written files, cv_en.yml first
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    base = generate_cv(seed, **sizes)
+    files = [directory / f"cv_{BASE_LANGUAGE}.yml"]
+    _dump(base, files[0])
+    for lang in languages:
+        if lang == BASE_LANGUAGE:
+            continue
+        files.append(directory / f"cv_{lang}.yml")
+        _dump(generate_override(base, lang, override_ratio, seed), files[-1])
+
+    fallback = HEADINGS[BASE_LANGUAGE]
+    translations = {lang: HEADINGS.get(lang, fallback) for lang in (BASE_LANGUAGE, *languages)}
+    files.append(directory / "ui_translations.yml")
+    _dump(translations, files[-1])
+    return files
+
+
+def _dump(data: dict[str, Any], path: Path) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False, width=100)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write a synthetic CV set."""
+    parser = argparse.ArgumentParser(description="Write seeded synthetic CV sources.")
+    parser.add_argument("directory", type=Path, help="output directory")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        default=["en", "fr", "it"],
+        help="languages to write (default: en fr it)",
+    )
+    parser.add_argument(
+        "--override-ratio",
+        type=float,
+        default=0.5,
+        help="share of entries translated by each override (default: 0.5)",
+    )
+    for name, default in DEFAULT_SIZES.items():
+        flag = "--" + name.replace("_", "-")
+        label = name.replace("_", " ")
+        help_text = f"number of {label} (default: {default})"
+        parser.add_argument(flag, type=int, default=default, help=help_text)
+    args = parser.parse_args(argv)
+    if not 0.0 <= args.override_ratio <= 1.0:
+        parser.error("--override-ratio must be between 0 and 1")
+
+    sizes = {name: getattr(args, name) for name in DEFAULT_SIZES}
+    languages = tuple(args.languages)
+    files = write_cv_set(args.directory, languages, args.seed, args.override_ratio, **sizes)
+    for path in files:
+        print(f"  ✓ {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
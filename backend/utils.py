@@ -0,0 +1,72 @@
+"""Small helpers shared across the backend: atomic writes and an LRU cache."""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from pathlib import Path
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def write_atomic(path: Path, data: bytes | str) -> None:
+    """Write a file through a temporary sibling so readers never see partial content.
+
+    Args:
+        path: File to write
+        data: Content; text is encoded as UTF-8
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data.encode("utf-8") if isinstance(data, str) else data)
+    os.replace(tmp_path, path)
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded, thread-safe mapping that evicts the least recently used entries.
+
+    Values are stored as is; callers that hand them out must copy mutable
+    values themselves. None cannot be stored, it means a miss.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return the value of key and mark it as recently used, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entries past maxsize."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over a snapshot of the keys, least recently used first."""
+        with self._lock:
+            return iter(list(self._entries))
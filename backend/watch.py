@@ -0,0 +1,357 @@
+"""
+Watch mode for generate.py: rebuild only the outputs affected by a change.
+
+Sources are watched with inotify on Linux and by polling their stat
+results elsewhere. A dependency graph maps each source to the language ×
+format units it feeds:
+
+- ``cv_en.yml`` is the merge base of every language, so it invalidates all
+  of them; ``cv_fr.yml`` only invalidates FR.
+- ``ui_translations.yml`` invalidates the HTML and PDF headings of the
+  languages whose section changed, plus every JSON output, which embeds
+  the whole translations mapping.
+- ``backend/templates/cv.html`` invalidates the HTML of every language.
+
+Changes are applied after a short settle delay that coalesces editor
+save bursts; PDF renders, the slowest units, are further debounced until
+the sources have been quiet for a while.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from backend.generators import html_generator
+from backend.parsers.yaml_parser import parse_cv_file
+
+# Seconds to wait for more events after the first one of a burst
+SETTLE_S = 0.1
+# Seconds without changes before pending PDFs are rendered
+PDF_DEBOUNCE_S = 1.0
+# Polling interval of the fallback watcher
+POLL_INTERVAL_S = 0.5
+
+# inotify(7) event masks
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_DELETE
+_IN_EVENT = struct.Struct("iIII")
+
+Targets = dict[str, set[str]]
+
+
+class PollingWatcher:
+    """Detect changes to a set of files by comparing their stat results."""
+
+    def __init__(self, paths: Iterable[Path], interval: float = POLL_INTERVAL_S):
+        self.paths = set(paths)
+        self.interval = interval
+        self._state = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int] | None]:
+        state: dict[Path, tuple[int, int] | None] = {}
+        for path in self.paths:
+            try:
+                stat = path.stat()
+                state[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                state[path] = None
+        return state
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until some files change or timeout seconds elapse.
+
+        Returns:
+            Changed files; empty on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._snapshot()
+            changed = {path for path in self.paths if state[path] != self._state[path]}
+            self._state = state
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            remaining = self.interval if deadline is None else deadline - time.monotonic()
+            time.sleep(max(0.0, min(self.interval, remaining)))
+
+    def close(self) -> None:
+        """Release resources (nothing to do when polling)."""
+
+
+class InotifyWatcher:
+    """Detect changes to a set of files with Linux inotify.
+
+    The parent directories are watched, so saves that replace a file by
+    renaming a temporary one over it are seen too. A watched directory
+    that is removed is polled until it exists again, then watched anew.
+
+    Raises:
+        OSError: If inotify is unavailable
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        self.paths = {path.resolve() for path in paths}
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        # Directories whose watch went away, polled until they can be watched again
+        self._missing: set[Path] = set()
+        for directory in {path.parent for path in self.paths}:
+            if not self._add_watch(directory):
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+
+    def _add_watch(self, directory: Path) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_WATCH_MASK)
+        if wd < 0:
+            return False
+        self._dirs[wd] = directory
+        return True
+
+    def _rewatch(self) -> set[Path]:
+        """Watch again the removed directories that exist anew.
+
+        Returns:
+            Sources found in them, which may have changed while unwatched
+        """
+        changed = set()
+        for directory in list(self._missing):
+            if self._add_watch(directory):
+                self._missing.discard(directory)
+                changed |= {p for p in self.paths if p.parent == directory and p.exists()}
+        return changed
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until some files change or timeout seconds elapse.
+
+        Returns:
+            Changed files; empty on timeout, every watched file if the
+            kernel event queue overflowed and changes may have been lost
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._missing:
+                # Wake up to poll for the removed directories
+                poll = POLL_INTERVAL_S
+                remaining = poll if remaining is None else min(remaining, poll)
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            changed = self._read_events() if readable else set()
+            changed |= self._rewatch()
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+    def _read_events(self) -> set[Path]:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _IN_EVENT.unpack_from(data, offset)
+            offset += _IN_EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped (wd is -1): treat every source as changed
+                return set(self.paths)
+            if mask & _IN_IGNORED:
+                # The watch is gone, e.g. its directory was removed
+                directory = self._dirs.pop(wd, None)
+                if directory is not None:
+                    self._missing.add(directory)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name)
+            if path in self.paths:
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        os.close(self._fd)
+
+
+def make_watcher(paths: Iterable[Path]) -> InotifyWatcher | PollingWatcher:
+    """Return an inotify watcher where available, a polling one otherwise."""
+    paths = [path.resolve() for path in paths]
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths)
+
+
+def dependency_graph(
+    languages: list[str],
+    formats: tuple[str, ...],
+    cv_data_dir: Path,
+    base_lang: str = "en",
+) -> dict[Path, Targets]:
+    """Map each watched source to the units that depend on it.
+
+    Args:
+        languages: Languages being built
+        formats: Output formats being built
+        cv_data_dir: Directory with the cv_*.yml and ui_translations.yml sources
+        base_lang: Language merged under every other one by parse_cv_with_base
+
+    Returns:
+        Resolved source path -> formats to rebuild, by language
+    """
+    cv_data_dir = cv_data_dir.resolve()
+    graph: dict[Path, Targets] = {}
+    for lang in languages:
+        graph[cv_data_dir / f"cv_{lang}.yml"] = {lang: set(formats)}
+    if base_lang in languages:
+        graph[cv_data_dir / f"cv_{base_lang}.yml"] = {lang: set(formats) for lang in languages}
+    # Upper bound; narrowed to the changed sections by translation_targets()
+    graph[cv_data_dir / "ui_translations.yml"] = {lang: set(formats) for lang in languages}
+    if "html" in formats:
+        template = (html_generator.TEMPLATES_DIR / html_generator.TEMPLATE_NAME).resolve()
+        graph[template] = {lang: {"html"} for lang in languages}
+    return graph
+
+
+def translation_targets(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    languages: list[str],
+    formats: tuple[str, ...],
+) -> Targets:
+    """Return the units affected by a change of the UI translations.
+
+    Args:
+        old: Translations before the change
+        new: Translations after the change
+        languages: Languages being built
+        formats: Output formats being built
+
+    Returns:
+        Formats to rebuild, by language
+    """
+    if old == new:
+        return {}
+    targets: Targets = {}
+    for lang in languages:
+        # JSON outputs embed every language's translations
+        affected = {"json"} & set(formats)
+        if old.get(lang) != new.get(lang):
+            affected |= {"html", "pdf"} & set(formats)
+        if affected:
+            targets[lang] = affected
+    return targets
+
+
+def _merge(targets: Targets, more: Targets) -> None:
+    for lang, formats in more.items():
+        targets.setdefault(lang, set()).update(formats)
+
+
+def _ordered(
+    targets: Targets,
+    languages: list[str],
+    formats: tuple[str, ...],
+) -> dict[str, tuple[str, ...]]:
+    """Order targets like a full build: by language, then by format."""
+    ordered = {}
+    for lang in languages:
+        if targets.get(lang):
+            ordered[lang] = tuple(fmt for fmt in formats if fmt in targets[lang])
+    return ordered
+
+
+def watch(
+    languages: list[str],
+    formats: tuple[str, ...],
+    cv_data_dir: Path,
+    build: Callable[[dict[str, tuple[str, ...]]], bool],
+    pdf_debounce: float = PDF_DEBOUNCE_S,
+) -> None:
+    """Rebuild affected units whenever a source changes; runs until interrupted.
+
+    Args:
+        languages: Languages being built
+        formats: Output formats being built
+        cv_data_dir: Directory with the cv_*.yml and ui_translations.yml sources
+        build: Callback building formats by language, e.g. a bound generate.build
+        pdf_debounce: Seconds without changes before pending PDFs are rendered
+    """
+    graph = dependency_graph(languages, formats, cv_data_dir)
+    translations_file = (cv_data_dir / "ui_translations.yml").resolve()
+    template = (html_generator.TEMPLATES_DIR / html_generator.TEMPLATE_NAME).resolve()
+    translations = parse_cv_file(str(translations_file))
+    watcher = make_watcher(graph)
+    pending_pdf: Targets = {}
+    pdf_due: float | None = None
+
+    print(f"\n👀 Watching {len(graph)} sources ({type(watcher).__name__}); Ctrl+C to stop")
+    try:
+        while True:
+            timeout = None if pdf_due is None else max(0.0, pdf_due - time.monotonic())
+            changed = watcher.wait(timeout)
+            if not changed:
+                if pending_pdf:
+                    build(_ordered(pending_pdf, languages, formats))
+                    pending_pdf.clear()
+                pdf_due = None
+                continue
+
+            # Coalesce the rest of the burst (editors often write several times)
+            while more := watcher.wait(SETTLE_S):
+                changed |= more
+
+            targets: Targets = {}
+            for path in changed:
+                if path == translations_file:
+                    try:
+                        new_translations = parse_cv_file(str(path))
+                    except Exception as e:
+                        # Keep the current outputs until the file parses again
+                        print(f"  ✗ Failed to parse {path.name}: {e}")
+                        continue
+                    diff = translation_targets(translations, new_translations, languages, formats)
+                    _merge(targets, diff)
+                    translations = new_translations
+                else:
+                    if path == template:
+                        # New template and cache key for the HTML units; pool
+                        # workers catch up when run_unit sees the new key
+                        html_generator.reload_templates()
+                    _merge(targets, graph.get(path, {}))
+
+            names = ", ".join(sorted(path.name for path in changed))
+            print(f"\n🔁 Changed: {names}")
+            for lang in list(targets):
+                if "pdf" in targets[lang]:
+                    targets[lang].discard("pdf")
+                    pending_pdf.setdefault(lang, set()).add("pdf")
+            if any(targets.values()):
+                build(_ordered(targets, languages, formats))
+            if pending_pdf:
+                pdf_due = time.monotonic() + pdf_debounce
+                print(f"⏳ PDF render in {pdf_debounce:g}s: {', '.join(sorted(pending_pdf))}")
+    finally:
+        watcher.close()
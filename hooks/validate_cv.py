@@ -1,48 +1,229 @@
 #!/usr/bin/env python3
-"""Validate CV YAML files against schema."""
+"""Validate CV YAML files against schema.
 
+Pre-commit passes the changed ``cv-data`` YAML files; each is checked
+together with the CVs that depend on it (a changed ``cv_en.yml`` base
+rechecks every language next to it, and so does ``ui_translations.yml``
+when the CVs are also rendered). Without arguments, every ``cv_*.yml`` in
+``cv-data/`` is checked.
+
+Files are validated in parallel and reported as they finish. Passing
+results are cached by the hash of everything they depend on, so unchanged
+files are skipped on the next run.
+"""
+
+import argparse
+import hashlib
+import json
+import os
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
 
 from backend.parsers.schema import validate_cv
 from backend.parsers.yaml_parser import parse_cv_with_base
+from backend.render_worker import RENDER_SOCKET_ENV, RenderClient
+from backend.utils import write_atomic
 
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CV_DATA_DIR = ROOT_DIR / "cv-data"
+DEFAULT_CACHE = ROOT_DIR / ".validate-cv-cache.json"
 
-def main():
-    """Validate all CV YAML files."""
-    script_dir = Path(__file__).parent
-    cv_data_dir = script_dir.parent / "cv-data"
-    languages = ["en", "fr", "it"]
+BASE_LANG = "en"
+TRANSLATIONS_NAME = "ui_translations.yml"
+
+# Bump to invalidate every cached result
+CACHE_VERSION = 1
+
+# Sources whose content affects validation results
+_VALIDATOR_SOURCES = (
+    ROOT_DIR / "backend" / "parsers" / "schema.py",
+    ROOT_DIR / "backend" / "parsers" / "yaml_parser.py",
+)
+
+
+def expand_targets(paths: list[Path], render: bool = False) -> list[Path]:
+    """Return the CV files to check for a set of changed files.
+
+    Args:
+        paths: Changed YAML files, as passed by pre-commit
+        render: Whether the check includes a PDF render; only renders read
+            the UI translations
+
+    Returns:
+        Sorted CV files: the changed ones plus their dependents
+    """
+    base_names = {f"cv_{BASE_LANG}.yml", TRANSLATIONS_NAME} if render else {f"cv_{BASE_LANG}.yml"}
+    targets: set[Path] = set()
+    for path in paths:
+        if path.name in base_names:
+            targets.update(path.parent.glob("cv_*.yml"))
+        if path.name.startswith("cv_") and path.suffix in (".yml", ".yaml"):
+            targets.add(path)
+    return sorted(targets)
+
+
+def input_key(cv_file: Path, render: bool = False) -> str:
+    """Hash everything the result of checking a CV file depends on.
+
+    Args:
+        cv_file: CV file to check
+        render: Whether the check includes a PDF render
+
+    Returns:
+        Hex digest; missing files hash as empty
+    """
+    inputs = [*_VALIDATOR_SOURCES, cv_file]
+    if cv_file.name != f"cv_{BASE_LANG}.yml":
+        inputs.append(cv_file.parent / f"cv_{BASE_LANG}.yml")
+    if render:
+        inputs.append(cv_file.parent / TRANSLATIONS_NAME)
+
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{render}".encode("utf-8"))
+    for path in inputs:
+        digest.update(b"\0" + path.name.encode("utf-8") + b"\0")
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cache(cache_file: Path) -> dict[str, str]:
+    """Load the passing results of previous runs: resolved path -> input key."""
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("passed", {})
 
-    errors: list[str] = []
 
-    for lang in languages:
-        cv_file = cv_data_dir / f"cv_{lang}.yml"
-        if not cv_file.exists():
-            errors.append(f"CV file {cv_file} does not exist")
-            continue
+def save_cache(cache_file: Path, passed: dict[str, str]) -> None:
+    """Write the passing results atomically."""
+    data = {"version": CACHE_VERSION, "passed": passed}
+    write_atomic(cache_file, json.dumps(data, indent=2, sort_keys=True) + "\n")
 
-        try:
-            # Parse YAML (merges with English base for non-English files)
-            cv_data: dict[str, Any] = parse_cv_with_base(str(cv_file))
 
-            # Validate schema
-            validate_cv(cv_data)
+def _label(path: Path) -> str:
+    """Path as shown in reports: relative to the working directory when inside it."""
+    relative = os.path.relpath(path)
+    return path.as_posix() if relative.startswith("..") else relative
+
+
+def check_file(cv_file: str) -> str | None:
+    """Parse (merged with the base language) and validate one CV file.
+
+    Runs in a worker process and never raises.
+
+    Returns:
+        None if the CV is valid, the error message otherwise
+    """
+    if not os.path.exists(cv_file):
+        return f"CV file {cv_file} does not exist"
+    try:
+        validate_cv(parse_cv_with_base(cv_file))
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Validate CV YAML files against the schema.")
+    parser.add_argument("files", nargs="*", type=Path, help="changed files (default: all CVs)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help=f"file caching passing results (default: {DEFAULT_CACHE.name} in the repository)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="check every file, ignoring cached results",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None, executor: Executor | None = None) -> int:
+    """Validate the CV files named on the command line.
+
+    Args:
+        argv: Command line arguments (default: sys.argv)
+        executor: Pool to validate in (default: a process pool of --jobs workers)
+
+    Returns:
+        Process exit code: 0 if every file is valid, 1 otherwise
+    """
+    args = parse_args(argv)
+
+    # Optionally check that each CV renders, using a running render worker
+    render_socket = os.environ.get(RENDER_SOCKET_ENV)
+    client = RenderClient(render_socket) if render_socket else None
+
+    if args.files:
+        files = expand_targets(args.files, render=client is not None)
+    else:
+        files = sorted(CV_DATA_DIR.glob("cv_*.yml"))
+
+    passed = {} if args.no_cache else load_cache(args.cache)
+    pending: dict[Path, str] = {}
+    for cv_file in files:
+        key = input_key(cv_file, render=client is not None)
+        if passed.get(str(cv_file.resolve())) == key:
+            print(f"✓ {_label(cv_file)}: Valid (cached)", flush=True)
+        else:
+            pending[cv_file] = key
+
+    errors: list[str] = []
+    own_executor = executor is None and len(pending) > 1 and args.jobs > 1
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=min(args.jobs, len(pending)))
+    try:
+        if executor is None:
+            results = ((cv_file, check_file(str(cv_file))) for cv_file in pending)
+        else:
+            futures = {executor.submit(check_file, str(cv_file)): cv_file for cv_file in pending}
+            results = ((futures[future], future.result()) for future in as_completed(futures))
 
-            print(f"✓ {lang.upper()}: Valid")
+        # Report each file as soon as it is checked
+        for cv_file, error in results:
+            if error is None and client is not None:
+                result = client.render(cv_file=str(cv_file), discard=True)
+                if not result["ok"]:
+                    error = f"PDF render failed: {result['error']}"
+            if error is None:
+                passed[str(cv_file.resolve())] = pending[cv_file]
+                print(f"✓ {_label(cv_file)}: Valid", flush=True)
+            else:
+                passed.pop(str(cv_file.resolve()), None)
+                errors.append(f"✗ {_label(cv_file)}: {error}")
+                print(errors[-1], flush=True)
+    finally:
+        if own_executor:
+            executor.shutdown()  # type: ignore[union-attr]
+        if client is not None:
+            client.close()
 
-        except Exception as e:
-            errors.append(f"✗ {lang.upper()}: {e}")
+    if not args.no_cache and pending:
+        save_cache(args.cache, passed)
 
     if errors:
         print("\nValidation errors:")
         for error in errors:
             print(f"  {error}")
-        sys.exit(1)
+        return 1
 
     print("\n✅ All CV files are valid!")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
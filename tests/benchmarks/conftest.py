@@ -0,0 +1,50 @@
+"""
+Fixtures for the benchmark suite.
+
+Benchmarks are skipped in the regular test run; run them with
+``make bench`` (compares against the saved baseline) or
+``make bench-baseline`` (saves a new one).
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from backend.parsers.schema import validate_cv
+from backend.parsers.yaml_parser import parse_cv_file, parse_cv_with_base
+from backend.synthetic import DEFAULT_SIZES, write_cv_set
+
+CV_DATA_DIR = Path(__file__).resolve().parent.parent.parent / "cv-data"
+
+# "real" is cv-data as is; numbers multiply the entries of a real-sized synthetic CV
+SCALES = ["real", 10, 100, 1000]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless pytest runs with --benchmark-only."""
+    if config.getoption("benchmark_only", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with make bench (--benchmark-only)")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session", params=SCALES, ids=[f"x{s}" if s != "real" else s for s in SCALES])
+def sources(request, tmp_path_factory) -> Path:
+    """Directory with cv_en.yml, cv_fr.yml and ui_translations.yml at one scale."""
+    if request.param == "real":
+        return CV_DATA_DIR
+    directory = tmp_path_factory.mktemp(f"cv-x{request.param}")
+    sizes = {name: size * request.param for name, size in DEFAULT_SIZES.items()}
+    write_cv_set(directory, ("en", "fr"), seed=request.param, **sizes)
+    return directory
+
+
+@pytest.fixture(scope="session")
+def cv_data(sources: Path) -> dict[str, Any]:
+    """Validated, merged French CV with UI translations, as the generators receive it."""
+    data = validate_cv(parse_cv_with_base(str(sources / "cv_fr.yml"))).model_dump()
+    data["translations"] = parse_cv_file(str(sources / "ui_translations.yml"))
+    return data
@@ -0,0 +1,87 @@
+"""
+Benchmarks of the parse, merge, validate and generation stages.
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from backend.generators.fragments import fragment_cache
+from backend.generators.html_generator import generate_html
+from backend.generators.json_generator import generate_json, generate_public_json
+from backend.parsers.schema import validate_cv
+from backend.parsers.yaml_parser import (
+    clear_parse_cache,
+    deep_merge,
+    parse_cv_file,
+    parse_cv_with_base,
+)
+
+try:
+    from backend.generators.pdf_generator import create_pdf_html, generate_pdf
+except (ImportError, OSError):  # WeasyPrint or its system libraries are missing
+    create_pdf_html = generate_pdf = None
+
+needs_weasyprint = pytest.mark.skipif(generate_pdf is None, reason="WeasyPrint unavailable")
+
+
+def test_parse_cv_file(benchmark, sources: Path):
+    """Parse the base YAML file, bypassing the parse cache."""
+    path = str(sources / "cv_en.yml")
+    benchmark.pedantic(parse_cv_file, args=(path,), setup=clear_parse_cache, rounds=5)
+
+
+def test_parse_cv_with_base(benchmark, sources: Path):
+    """Parse and merge a language override onto the base, bypassing the parse cache."""
+    path = str(sources / "cv_fr.yml")
+    benchmark.pedantic(parse_cv_with_base, args=(path,), setup=clear_parse_cache, rounds=5)
+
+
+def test_deep_merge(benchmark, sources: Path):
+    """Merge already parsed base and override trees."""
+    base = parse_cv_file(str(sources / "cv_en.yml"))
+    override = parse_cv_file(str(sources / "cv_fr.yml"))
+    benchmark(deep_merge, base, override)
+
+
+def test_validate_cv(benchmark, sources: Path):
+    """Validate merged data against the schema (uncached)."""
+    data = parse_cv_with_base(str(sources / "cv_fr.yml"))
+    benchmark(validate_cv, data)
+
+
+def test_generate_html_cold(benchmark, cv_data):
+    """Render the HTML template, bypassing the fragment cache."""
+    benchmark.pedantic(generate_html, args=(cv_data, "fr"), setup=fragment_cache.clear, rounds=5)
+
+
+def test_generate_html_warm(benchmark, cv_data):
+    """Render the HTML template with every section fragment cached."""
+    generate_html(cv_data, "fr")
+    benchmark(generate_html, cv_data, "fr")
+
+
+def test_generate_json(benchmark, cv_data):
+    """Serialize the full JSON output."""
+    benchmark(generate_json, cv_data)
+
+
+def test_generate_public_json(benchmark, cv_data):
+    """Sanitize and serialize the public JSON output."""
+    benchmark(generate_public_json, cv_data)
+
+
+@needs_weasyprint
+def test_create_pdf_html(benchmark, cv_data):
+    """Build the HTML fed to WeasyPrint."""
+    benchmark(create_pdf_html, cv_data, "fr")
+
+
+@needs_weasyprint
+def test_generate_pdf(benchmark, cv_data):
+    """Lay out and write the PDF in memory."""
+    rounds = 1 if len(cv_data["experience"]) > 1000 else 3
+    benchmark.pedantic(
+        lambda: generate_pdf(cv_data, io.BytesIO(), "fr"), rounds=rounds, warmup_rounds=1
+    )
@@ -1,8 +1,34 @@
 """Pytest configuration and fixtures."""
 
 import sys
+from functools import cache
 from pathlib import Path
 
+import pytest
+
 # Add project-root `backend` to Python path
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
+
+
+@cache
+def weasyprint_available() -> bool:
+    """Whether WeasyPrint and its system libraries (Pango) can be loaded."""
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "weasyprint: the test renders PDFs with WeasyPrint")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked weasyprint when WeasyPrint cannot be loaded."""
+    marked = [item for item in items if "weasyprint" in item.keywords]
+    if marked and not weasyprint_available():
+        skip = pytest.mark.skip(reason="WeasyPrint or its system libraries are unavailable")
+        for item in marked:
+            item.add_marker(skip)
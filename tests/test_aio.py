@@ -0,0 +1,118 @@
+"""
+Tests for the asyncio rendering facade.
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from backend import aio
+from backend.aio import AsyncRenderer
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CV_DATA_DIR = PROJECT_ROOT / "cv-data"
+
+
+def test_render_cv_writes_outputs(tmp_path):
+    """render_cv loads, renders and writes without a process pool."""
+
+    async def main():
+        async with AsyncRenderer(executor=ThreadPoolExecutor(max_workers=2)) as renderer:
+            return await renderer.render_cv(
+                CV_DATA_DIR / "cv_fr.yml", formats=("json", "html"), output_dir=tmp_path
+            )
+
+    outputs = asyncio.run(main())
+
+    assert (tmp_path / "cv_fr.json").read_text(encoding="utf-8") == outputs["json"]
+    assert (tmp_path / "cv_fr.html").read_text(encoding="utf-8") == outputs["html"]
+
+
+def test_render_limits_concurrency(monkeypatch):
+    """No more than max_concurrency renders run at once; the loop stays responsive."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_render(cv_data, language, formats, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return {"json": language}
+
+    monkeypatch.setattr(aio, "render_all", slow_render)
+
+    async def main():
+        renderer = AsyncRenderer(executor=ThreadPoolExecutor(max_workers=8), max_concurrency=2)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        tick_task = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(renderer.render({}, str(n), ("json",)) for n in range(6)))
+        tick_task.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(main())
+
+    assert [result["json"] for result in results] == [str(n) for n in range(6)]
+    assert peak == 2
+    assert ticks > 10
+
+
+def test_render_timeout(monkeypatch):
+    """A render that exceeds its timeout raises TimeoutError and keeps its slot until done."""
+    release = threading.Event()
+    monkeypatch.setattr(aio, "render_all", lambda *args, **kwargs: release.wait(5) and {})
+
+    async def main():
+        renderer = AsyncRenderer(executor=ThreadPoolExecutor(max_workers=2), max_concurrency=1)
+        with pytest.raises(TimeoutError):
+            await renderer.render({}, "en", ("json",), timeout=0.05)
+        # The slot is still held by the running render
+        with pytest.raises(TimeoutError, match="no render slot"):
+            await renderer.render({}, "en", ("json",), timeout=0.05)
+        release.set()
+        await asyncio.sleep(0.05)
+        assert await renderer.render({}, "en", ("json",), timeout=1) == {}
+
+    asyncio.run(main())
+
+
+def test_render_rejects_unknown_formats():
+    """Unknown formats fail before anything is scheduled."""
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncRenderer(executor=ThreadPoolExecutor(1)).render({}, "en", ("docx",)))
+
+
+def test_default_pool_loads_weasyprint_lazily():
+    """Workers of the default pool don't import WeasyPrint for JSON/HTML renders."""
+    code = (
+        "import asyncio\n"
+        "from backend.aio import AsyncRenderer\n"
+        "async def main():\n"
+        "    async with AsyncRenderer(max_concurrency=1) as renderer:\n"
+        "        await renderer.render_cv('cv-data/cv_en.yml', formats=('json', 'html'))\n"
+        "        check = \"'weasyprint' in __import__('sys').modules\"\n"
+        "        return await asyncio.wrap_future(renderer.executor.submit(eval, check))\n"
+        "print(asyncio.run(main()))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,49 @@
+"""
+Tests for fingerprinted public JSON assets.
+"""
+
+import gzip
+import json
+
+from backend.generators.assets import MANIFEST_NAME, emit_public_asset, write_asset_manifest
+
+
+def test_emit_public_asset(tmp_path):
+    """Assets are content-addressed, precompressed and replace older fingerprints."""
+    first = emit_public_asset('{"summary":"a"}\n', "en", tmp_path)
+    second = emit_public_asset('{"summary":"b"}\n', "en", tmp_path)
+
+    assert first.name != second.name
+    assert second.name.startswith("cv_en.") and second.suffix == ".json"
+    assert gzip.decompress((tmp_path / f"{second.name}.gz").read_bytes()) == second.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        second.name,
+        f"{second.name}.br",
+        f"{second.name}.gz",
+    ]
+
+
+def test_emit_public_asset_restores_siblings(tmp_path):
+    """A compressed sibling deleted after a previous run is written again."""
+    asset = emit_public_asset('{"summary":"a"}\n', "en", tmp_path)
+    gzipped = tmp_path / f"{asset.name}.gz"
+    gzipped.unlink()
+
+    emit_public_asset('{"summary":"a"}\n', "en", tmp_path)
+
+    assert gzip.decompress(gzipped.read_bytes()) == asset.read_bytes()
+
+
+def test_write_asset_manifest(tmp_path):
+    """The manifest maps each language to its current fingerprinted file."""
+    en = emit_public_asset('{"summary":"en"}\n', "en", tmp_path)
+    fr = emit_public_asset('{"summary":"fr"}\n', "fr", tmp_path)
+    (tmp_path / "cv_en.json").write_text("{}\n")
+
+    manifest = write_asset_manifest(tmp_path)
+
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text()) == manifest
+    assert set(manifest["files"]) == {"en", "fr"}
+    assert manifest["files"]["en"]["file"] == en.name
+    assert manifest["files"]["fr"]["size"] == fr.stat().st_size
+    assert "gzip" in manifest["files"]["fr"]
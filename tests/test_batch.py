@@ -0,0 +1,78 @@
+"""
+Tests for multi-tenant batch generation.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from backend.batch import discover_units, run_batch
+
+CV_DATA_DIR = Path(__file__).parent.parent / "cv-data"
+
+
+def _make_tenants(root: Path) -> None:
+    """Create two complete tenants and one without a base language file."""
+    for tenant, langs in {"alice": ["en", "fr"], "bob": ["en"], "carol": ["it"]}.items():
+        tenant_dir = root / tenant
+        tenant_dir.mkdir(parents=True)
+        for lang in langs:
+            shutil.copy(CV_DATA_DIR / f"cv_{lang}.yml", tenant_dir)
+    shutil.copy(CV_DATA_DIR / "ui_translations.yml", root / "bob")
+
+
+def test_discover_units(tmp_path: Path):
+    """Languages are discovered per tenant from cv_*.yml file names."""
+    _make_tenants(tmp_path)
+    (tmp_path / "notes.txt").write_text("not a tenant")
+
+    assert list(discover_units(tmp_path)) == [("alice", "en"), ("alice", "fr"), ("bob", "en"), ("carol", "it")]
+
+
+@pytest.mark.weasyprint
+def test_run_batch_writes_outputs_and_summary(tmp_path: Path):
+    """Every tenant language is built into its own directory and summarized."""
+    root = tmp_path / "tenants"
+    out = tmp_path / "out"
+    _make_tenants(root)
+
+    summary = run_batch(root, out, jobs=2)
+
+    assert summary["tenants"] == 3
+    assert summary["units"] == 4
+    assert summary["failed"] == 1
+    assert json.loads((out / "summary.json").read_text()) == summary
+    failed = [record for record in summary["results"] if not record["ok"]]
+    assert [(record["tenant"], record["lang"]) for record in failed] == [("carol", "it")]
+    for name in ["cv_en.html", "cv_en.json", "cv_en.pdf", "cv_fr.pdf", "public/cv_fr.json"]:
+        assert (out / "alice" / name).exists(), name
+
+    # Unchanged inputs are served from the per-tenant build cache
+    rerun = run_batch(root, out, jobs=1)
+    alice_en = next(r for r in rerun["results"] if (r["tenant"], r["lang"]) == ("alice", "en"))
+    assert alice_en["formats"] == {"html": "up to date", "json": "up to date", "pdf": "up to date"}
+
+
+@pytest.mark.weasyprint
+def test_run_batch_restores_deleted_public_assets(tmp_path: Path):
+    """Deleting a tenant's fingerprinted JSON rebuilds it instead of emptying the asset manifest."""
+    root = tmp_path / "tenants"
+    out = tmp_path / "out"
+    (root / "bob").mkdir(parents=True)
+    shutil.copy(CV_DATA_DIR / "cv_en.yml", root / "bob")
+
+    run_batch(root, out, jobs=1)
+    public_dir = out / "bob" / "public"
+    assets = sorted(public_dir.glob("cv_en.*.json*"))
+    assert assets
+    for asset in assets:
+        asset.unlink()
+
+    rerun = run_batch(root, out, jobs=1)
+
+    assert rerun["results"][0]["formats"]["json"] == "generated"
+    assert sorted(public_dir.glob("cv_en.*.json*")) == assets
+    asset_manifest = json.loads((public_dir / "cv-manifest.json").read_text())
+    assert asset_manifest["files"]["en"]["file"] == assets[0].name
@@ -0,0 +1,69 @@
+"""
+Tests for the content-addressed build cache.
+"""
+
+import ast
+from pathlib import Path
+
+from backend import build_cache
+from backend.build_cache import BuildManifest, source_digest, unit_key
+
+
+def test_unit_key_tracks_data_and_format():
+    """Keys change with the CV data and differ per format."""
+    cv_data = {"summary": "Engineer", "translations": {"en": {"summary": "Summary"}}}
+
+    assert unit_key(cv_data, "pdf") == unit_key(dict(cv_data), "pdf")
+    assert unit_key(cv_data, "pdf") != unit_key(cv_data, "html")
+    assert unit_key(cv_data, "pdf") != unit_key({**cv_data, "summary": "Manager"}, "pdf")
+
+
+def test_source_digest_tracks_directories(tmp_path: Path, monkeypatch):
+    """Adding or changing a file in a source directory (e.g. fonts) changes the digest."""
+    monkeypatch.setattr(build_cache, "FORMAT_SOURCES", {"pdf": (tmp_path,)})
+    source_digest.cache_clear()
+    try:
+        empty = source_digest("pdf")
+        source_digest.cache_clear()
+        (tmp_path / "Inter-Regular.woff2").write_bytes(b"v1")
+        added = source_digest("pdf")
+        source_digest.cache_clear()
+        (tmp_path / "Inter-Regular.woff2").write_bytes(b"v2")
+        changed = source_digest("pdf")
+    finally:
+        source_digest.cache_clear()
+
+    assert len({empty, added, changed}) == 3
+
+
+def test_html_sources_cover_imported_generators():
+    """Every generator module the HTML generator imports is an html source."""
+    generators_dir = Path(build_cache.__file__).parent / "generators"
+    tree = ast.parse((generators_dir / "html_generator.py").read_text(encoding="utf-8"))
+    imported = {
+        node.module.rsplit(".", 1)[1]
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom) and (node.module or "").startswith("backend.generators.")
+    }
+
+    assert imported
+    for module in imported:
+        assert generators_dir / f"{module}.py" in build_cache.FORMAT_SOURCES["html"]
+
+
+def test_manifest_round_trip(tmp_path: Path):
+    """Recorded units are fresh until their key changes or outputs disappear."""
+    output = tmp_path / "cv_en.pdf"
+    output.write_bytes(b"%PDF")
+
+    manifest = BuildManifest.in_dir(tmp_path)
+    assert not manifest.is_fresh("en:pdf", "abc", [output])
+    manifest.record("en:pdf", "abc", [output])
+    manifest.save()
+
+    reloaded = BuildManifest.in_dir(tmp_path)
+    assert reloaded.is_fresh("en:pdf", "abc", [output])
+    assert not reloaded.is_fresh("en:pdf", "def", [output])
+
+    output.unlink()
+    assert not reloaded.is_fresh("en:pdf", "abc", [output])
@@ -0,0 +1,49 @@
+"""
+Tests for the fragment cache.
+"""
+
+from backend.generators.fragments import FragmentCache, fragment_key
+
+
+def test_fragment_key_covers_every_input():
+    """Keys change with the section, the renderer version and the entries."""
+    entries = [{"title": "Engineer", "company": "Acme"}]
+    key = fragment_key("experience", "v1", entries)
+
+    assert fragment_key("experience", "v1", [dict(entries[0])]) == key
+    assert fragment_key("projects", "v1", entries) != key
+    assert fragment_key("experience", "v2", entries) != key
+    assert fragment_key("experience", "v1", [{"title": "Engineer", "company": "Other"}]) != key
+
+
+def test_get_or_render_renders_each_key_once():
+    """A fragment is rendered on the first request and served from the cache after."""
+    cache = FragmentCache()
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "<p>fragment</p>"
+
+    assert cache.get_or_render("key", render) == "<p>fragment</p>"
+    assert cache.get_or_render("key", render) == "<p>fragment</p>"
+
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_least_recently_used_fragment_is_evicted():
+    """The cache keeps at most maxsize fragments, dropping the least recently used."""
+    cache = FragmentCache(maxsize=2)
+    cache.get_or_render("a", lambda: "a")
+    cache.get_or_render("b", lambda: "b")
+    cache.get_or_render("a", lambda: "a")
+    cache.get_or_render("c", lambda: "c")
+
+    assert len(cache) == 2
+    assert cache.get_or_render("a", lambda: "new a") == "a"
+    assert cache.get_or_render("b", lambda: "new b") == "new b"
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
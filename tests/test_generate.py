@@ -0,0 +1,176 @@
+"""
+Tests for the generation pipeline entry point.
+"""
+
+import json
+import multiprocessing
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from backend import build_cache, generate
+from backend.build_cache import BuildManifest
+from backend.generators import html_generator
+from backend.generators.assets import MANIFEST_NAME
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous ceiling for importing backend.generate; pydantic dominates it
+IMPORT_BUDGET_S = 2.0
+
+
+def test_run_unit_reports_failure(tmp_path: Path):
+    """A failing unit is reported instead of raised."""
+    ok, message = generate.run_unit("html", {}, "en", tmp_path, tmp_path)
+
+    assert not ok
+    assert message.startswith("HTML generation failed")
+
+
+def test_run_unit_writes_json(tmp_path: Path):
+    """A successful unit writes its outputs and reports the file name."""
+    dist_dir = tmp_path / "dist"
+    public_dir = tmp_path / "public"
+    dist_dir.mkdir()
+    public_dir.mkdir()
+    cv_data = {"personal": {"name": "Jane", "email": "jane@example.com"}}
+
+    ok, message = generate.run_unit("json", cv_data, "en", dist_dir, public_dir)
+
+    assert ok, message
+    assert message == "Generated JSON → cv_en.json"
+    assert (dist_dir / "cv_en.json").exists()
+    assert (public_dir / "cv_en.json").exists()
+
+
+@pytest.mark.parametrize("compact, expected", [("", [False, True]), ("1", [True])])
+def test_public_json_serialized_once_per_form(tmp_path: Path, monkeypatch, compact, expected):
+    """The web/public copy and the fingerprinted asset never serialize the same form twice."""
+    from backend.generators import context
+
+    calls = []
+    original = context.generate_public_json
+
+    def counting(cv_data, public_personal=None, compact=False):
+        calls.append(compact)
+        return original(cv_data, public_personal, compact)
+
+    monkeypatch.setattr(context, "generate_public_json", counting)
+    monkeypatch.setenv(generate.COMPACT_PUBLIC_ENV, compact)
+    cv_data = {"personal": {"name": "Jane", "email": "jane@example.com"}}
+
+    ok, message = generate.run_unit("json", cv_data, "en", tmp_path, tmp_path)
+
+    assert ok, message
+    assert calls == expected
+    assert len(list(tmp_path.glob("cv_en.*.json"))) == 1
+
+
+def test_build_restores_deleted_public_assets(tmp_path: Path):
+    """Deleting a fingerprinted asset makes the JSON unit stale instead of dropping its language."""
+    dist_dir = tmp_path / "dist"
+    public_dir = tmp_path / "public"
+    dist_dir.mkdir()
+    public_dir.mkdir()
+    args = ({"en": ("json",)}, PROJECT_ROOT / "cv-data", dist_dir, public_dir)
+
+    manifest = BuildManifest.in_dir(dist_dir)
+    assert generate.build(*args, manifest)
+    manifest.save()
+    assets = sorted(public_dir.glob("cv_en.*.json*"))
+    assert assets
+    for asset in assets:
+        asset.unlink()
+
+    assert generate.build(*args, BuildManifest.in_dir(dist_dir))
+    assert sorted(public_dir.glob("cv_en.*.json*")) == assets
+    asset_manifest = json.loads((public_dir / MANIFEST_NAME).read_text())
+    assert asset_manifest["files"]["en"]["file"] == assets[0].name
+
+
+def test_pool_workers_pick_up_template_edits(tmp_path: Path, monkeypatch):
+    """After a template edit (as in watch mode), pool workers render the new template."""
+    template = tmp_path / "templates" / html_generator.TEMPLATE_NAME
+    template.parent.mkdir()
+    shutil.copy(html_generator.TEMPLATES_DIR / html_generator.TEMPLATE_NAME, template)
+    monkeypatch.setattr(html_generator, "TEMPLATES_DIR", template.parent)
+    monkeypatch.setitem(build_cache.FORMAT_SOURCES, "html", (template,))
+    html_generator.reload_templates()
+    dist_dir = tmp_path / "dist"
+    dist_dir.mkdir()
+    manifest = BuildManifest.in_dir(dist_dir)
+    args = ({"en": ("html",)}, PROJECT_ROOT / "cv-data", dist_dir, tmp_path, manifest)
+
+    # Forked workers inherit the patched template location
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork"))
+    try:
+        assert generate.build(*args, executor)
+        template.write_text(template.read_text().replace("</body>", "<h2>Edited</h2></body>"))
+        html_generator.reload_templates()
+        assert generate.build(*args, executor)
+    finally:
+        executor.shutdown()
+        monkeypatch.undo()
+        html_generator.reload_templates()
+
+    assert "<h2>Edited</h2>" in (dist_dir / "cv_en.html").read_text()
+
+
+def test_deleted_preview_makes_pdf_stale(tmp_path: Path, monkeypatch):
+    """Page previews listed in pages.json are outputs of the PDF unit."""
+    monkeypatch.setenv(generate.PDF_PREVIEWS_ENV, "1")
+    previews = [tmp_path / "cv_en-p1.png", tmp_path / "cv_en-p2.png"]
+    for path in [tmp_path / "cv_en.pdf", *previews]:
+        path.write_bytes(b"")
+    (tmp_path / "cv_en.pages.json").write_text(json.dumps({"previews": [p.name for p in previews]}))
+
+    outputs = generate.unit_outputs("pdf", "en", tmp_path, tmp_path)
+    manifest = BuildManifest.in_dir(tmp_path)
+    manifest.record("en:pdf", "key", outputs)
+
+    assert outputs[-2:] == previews
+    assert manifest.is_fresh("en:pdf", "key", outputs)
+    previews[1].unlink()
+    assert not manifest.is_fresh("en:pdf", "key", generate.unit_outputs("pdf", "en", tmp_path, tmp_path))
+
+
+def test_parse_args_rejects_zero_jobs():
+    """--jobs must be a positive worker count."""
+    with pytest.raises(SystemExit):
+        generate.parse_args(["--jobs", "0"])
+    assert generate.parse_args(["-j", "4"]).jobs == 4
+
+
+def test_parse_args_formats():
+    """--formats selects a subset of the formats, in canonical order."""
+    assert generate.parse_args([]).formats == generate.FORMATS
+    assert generate.parse_args(["--formats", "json,html"]).formats == ("html", "json")
+    with pytest.raises(SystemExit):
+        generate.parse_args(["--formats", "json,docx"])
+    with pytest.raises(SystemExit):
+        generate.parse_args(["--formats", ","])
+
+
+def test_import_budget():
+    """Importing the CLI loads no PDF or HTML backend and stays within budget."""
+    code = (
+        "import sys, backend.generate; "
+        "print(','.join(m for m in ('weasyprint', 'jinja2') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Last -X importtime line: "import time: self [us] | cumulative | backend.generate"
+    timings = [line for line in result.stderr.splitlines() if line.endswith("| backend.generate")]
+    cumulative_us = int(timings[-1].split("|")[1])
+
+    assert result.stdout.strip() == ""
+    assert cumulative_us / 1e6 < IMPORT_BUDGET_S
@@ -0,0 +1,68 @@
+"""
+Tests for HTML generation.
+"""
+
+from backend.generators import html_generator
+from backend.generators.fragments import FragmentCache
+from backend.generators.html_generator import generate_html, get_environment
+
+CV_DATA = {
+    "personal": {"name": "Jane Doe", "email": "jane@example.com"},
+    "summary": "Engineer",
+    "experience": [],
+    "education": [],
+    "skills": [],
+    "translations": {"en": {"experience": "Experience"}},
+}
+
+
+def test_template_compiled_once():
+    """Repeated renders reuse the compiled template of the shared environment."""
+    first = get_environment().get_template(html_generator.TEMPLATE_NAME)
+    html = generate_html(CV_DATA, "en")
+
+    assert get_environment().get_template(html_generator.TEMPLATE_NAME) is first
+    assert '<html lang="en">' in html
+    assert "Jane Doe" in html
+
+
+def test_missing_template_falls_back_to_minimal_html(monkeypatch):
+    """A missing template produces the minimal built-in HTML."""
+    monkeypatch.setattr(html_generator, "TEMPLATE_NAME", "missing.html")
+
+    html = generate_html(CV_DATA, "en")
+
+    assert html == html_generator.generate_minimal_html(CV_DATA)
+
+
+def test_unchanged_sections_are_reused(monkeypatch):
+    """Sections with the same entries are rendered once, across languages too."""
+    cache = FragmentCache()
+    monkeypatch.setattr(html_generator, "fragment_cache", cache)
+    monkeypatch.setattr(html_generator, "DEV_MODE", False)
+    experience = {"title": "Engineer", "company": "Acme", "period": "2020", "description": "Work"}
+    translations = {"en": {"experience": "Experience"}, "fr": {"experience": "Expérience"}}
+    cv_data = {**CV_DATA, "experience": [experience], "translations": translations}
+
+    english = generate_html(cv_data, "en")
+    misses = cache.misses
+    french = generate_html(cv_data, "fr")
+
+    assert cache.misses == misses
+    assert "Expérience" in french
+    assert english.count("Engineer at Acme") == french.count("Engineer at Acme") == 1
+
+    changed = {**cv_data, "experience": [{**experience, "description": "New work"}]}
+    assert "New work" in generate_html(changed, "en")
+    assert cache.misses == misses + 1
+
+
+def test_dev_mode_bypasses_fragment_cache(monkeypatch):
+    """In DEV_MODE fragments are always rendered, so template edits show up."""
+    cache = FragmentCache()
+    monkeypatch.setattr(html_generator, "fragment_cache", cache)
+    monkeypatch.setattr(html_generator, "DEV_MODE", True)
+
+    generate_html(CV_DATA, "en")
+
+    assert len(cache) == 0
@@ -0,0 +1,45 @@
+"""
+Tests for JSON generation.
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+from backend.generators import json_generator
+from backend.generators.json_generator import dumps_json, generate_public_json
+
+CV_DATA = {
+    "personal": {"name": "Jane Doe", "email": "jane@example.com", "birth_date": date(1990, 1, 1)},
+    "summary": "Ingénieure",
+    "certifications": [{"name": "CKA", "issued_date": date(2024, 5, 17)}],
+}
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_serializers_agree(monkeypatch, compact):
+    """orjson and the stdlib fallback produce the same text."""
+    fast = dumps_json(CV_DATA, compact=compact)
+    monkeypatch.setattr(json_generator, "orjson", None)
+
+    assert dumps_json(CV_DATA, compact=compact) == fast
+    assert '"issued_date": "2024-05-17"' in fast or '"issued_date":"2024-05-17"' in fast
+    assert "Ingénieure" in fast
+
+
+def test_unknown_types_are_rejected():
+    """Values other than dates are not silently stringified."""
+    with pytest.raises(TypeError):
+        dumps_json({"value": object()})
+
+
+def test_compact_public_json():
+    """Compact public JSON is smaller but carries the same sanitized data."""
+    pretty = generate_public_json(CV_DATA)
+    compact = generate_public_json(CV_DATA, compact=True)
+
+    assert len(compact) < len(pretty)
+    assert compact.endswith("}\n") and "\n" not in compact[:-1]
+    assert json.loads(compact) == json.loads(pretty)
+    assert "birth_date" not in json.loads(compact)["personal"]
@@ -0,0 +1,135 @@
+"""
+Tests for the rendering guardrails.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from backend import render_worker
+from backend.parsers.loader import load_cv
+from backend.generators.limits import (
+    RenderLimitError,
+    RenderLimits,
+    check_cv_limits,
+    time_limit,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_check_cv_limits():
+    """Oversized sections and fields are reported with their location."""
+    cv_data = {
+        "personal": {"name": "Jane"},
+        "experience": [{"title": "Dev", "description": "x" * 50}, {"title": "Ops"}],
+        "translations": {"en": {"experience": "y" * 500}},
+    }
+
+    check_cv_limits(cv_data, RenderLimits(max_entries=2, max_field_chars=50))
+    with pytest.raises(RenderLimitError) as excinfo:
+        check_cv_limits(cv_data, RenderLimits(max_field_chars=49))
+    assert excinfo.value.to_dict() == {
+        "limit": "max_field_chars",
+        "value": 50,
+        "maximum": 49,
+        "where": "experience[0].description",
+    }
+    with pytest.raises(RenderLimitError, match="max_entries limit exceeded at experience"):
+        check_cv_limits(cv_data, RenderLimits(max_entries=1))
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [RenderLimits(max_pages=20, max_seconds=2.5), RenderLimits(max_entries=0, max_pages=0)],
+)
+def test_limits_from_env(monkeypatch, limits):
+    """Limits, including zero ones, round-trip through the environment inherited by workers."""
+    for env, value in limits.to_env().items():
+        monkeypatch.setenv(env, value)
+
+    assert RenderLimits.from_env() == limits
+
+
+def test_non_positive_time_limit_rejected(monkeypatch):
+    """A zero or negative time limit is an error, not a disabled timer."""
+    with pytest.raises(ValueError, match="max_seconds must be positive"):
+        RenderLimits(max_seconds=0)
+    with pytest.raises(ValueError, match="max_pages must not be negative"):
+        RenderLimits(max_pages=-1)
+    monkeypatch.setenv("RESUME_LIMIT_SECONDS", "0")
+    with pytest.raises(ValueError, match="max_seconds"):
+        RenderLimits.from_env()
+    with pytest.raises(ValueError, match="positive"):
+        with time_limit(0):
+            pass
+
+
+def test_time_limit():
+    """The main thread is interrupted; other threads fail once the block ends."""
+    started = time.monotonic()
+    with pytest.raises(RenderLimitError, match="max_seconds"):
+        with time_limit(0.05, "sleep"):
+            time.sleep(2)
+    assert time.monotonic() - started < 1
+
+    errors = []
+
+    def _sleep_in_thread():
+        try:
+            with time_limit(0.01):
+                time.sleep(0.05)
+        except RenderLimitError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=_sleep_in_thread)
+    thread.start()
+    thread.join()
+    assert [e.limit for e in errors] == ["max_seconds"]
+
+
+@pytest.mark.weasyprint
+def test_render_job_reports_limit(monkeypatch):
+    """A job over a limit fails with a structured error; the worker keeps going."""
+    monkeypatch.setenv("RESUME_LIMIT_ENTRIES", "1")
+
+    cv_file = str(PROJECT_ROOT / "cv-data" / "cv_en.yml")
+
+    result = render_worker.render_job({"id": "big", "cv_file": cv_file, "discard": True})
+
+    assert not result["ok"]
+    assert result["limit"]["limit"] == "max_entries"
+    assert result["error"].startswith("RenderLimitError")
+
+
+@pytest.mark.weasyprint
+def test_layout_pdf_page_limit():
+    """Documents with more pages than max_pages are rejected after layout."""
+    from backend.generators.pdf_generator import layout_pdf
+
+    cv_data = load_cv(PROJECT_ROOT / "cv-data" / "cv_en.yml")
+
+    with pytest.raises(RenderLimitError, match="max_pages"):
+        layout_pdf(cv_data, "en", limits=RenderLimits(max_pages=0))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="RLIMIT_AS is enforced on Linux")
+def test_memory_limit_raises_memory_error():
+    """Allocations beyond the worker's address space cap raise MemoryError."""
+    code = (
+        "from backend.generators.limits import apply_memory_limit\n"
+        "apply_memory_limit(512)\n"
+        "try:\n"
+        "    bytearray(1024 * 1024 * 1024)\n"
+        "except MemoryError:\n"
+        "    print('capped')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+
+    assert result.stdout.strip() == "capped"
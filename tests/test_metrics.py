@@ -0,0 +1,92 @@
+"""
+Tests for pipeline stage metrics.
+"""
+
+import pstats
+import threading
+from pathlib import Path
+
+import pytest
+
+from backend import metrics
+from backend.metrics import read_records, stage, write_prometheus
+
+
+def test_stage_is_inert_without_configuration(monkeypatch, tmp_path: Path):
+    """Nothing is recorded unless a metrics file or profile directory is set."""
+    monkeypatch.delenv(metrics.METRICS_ENV, raising=False)
+    monkeypatch.delenv(metrics.PROFILE_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    with stage("parse", lang="en"):
+        pass
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stage_records_timing_and_profile(monkeypatch, tmp_path: Path):
+    """Each stage run appends a JSON line and writes a pstats dump."""
+    metrics_file = tmp_path / "metrics.jsonl"
+    monkeypatch.setenv(metrics.METRICS_ENV, str(metrics_file))
+    monkeypatch.setenv(metrics.PROFILE_ENV, str(tmp_path / "profiles"))
+
+    with stage("html", lang="fr"):
+        sum(range(1000))
+    with pytest.raises(ValueError):
+        with stage("pdf_layout", lang="fr"):
+            raise ValueError("boom")
+
+    records = list(read_records(metrics_file))
+    assert [(r["stage"], r["lang"], r["ok"]) for r in records] == [
+        ("html", "fr", True),
+        ("pdf_layout", "fr", False),
+    ]
+    assert records[0]["seconds"] >= 0
+    assert pstats.Stats(str(tmp_path / "profiles" / "html-fr.pstats")).total_calls > 0
+
+
+def test_concurrent_stages_profile_one_at_a_time(monkeypatch, tmp_path: Path):
+    """A stage of another thread is not profiled while one is, and says so."""
+    monkeypatch.delenv(metrics.METRICS_ENV, raising=False)
+    monkeypatch.setenv(metrics.PROFILE_ENV, str(tmp_path))
+    profiling = threading.Event()
+    done = threading.Event()
+
+    def _profiled_stage():
+        with stage("pdf_layout", lang="en"):
+            profiling.set()
+            done.wait(5)
+
+    thread = threading.Thread(target=_profiled_stage)
+    thread.start()
+    try:
+        assert profiling.wait(5)
+        with pytest.warns(RuntimeWarning, match="'html' not profiled"):
+            with stage("html", lang="fr"):
+                pass
+    finally:
+        done.set()
+        thread.join()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["pdf_layout-en.pstats"]
+    with stage("html", lang="fr"):
+        pass
+    assert (tmp_path / "html-fr.pstats").exists()
+
+
+def test_write_prometheus(tmp_path: Path):
+    """Runs with the same labels are summed into one sample per metric."""
+    records = [
+        {"stage": "parse", "lang": "en", "seconds": 0.25, "ok": True},
+        {"stage": "parse", "lang": "en", "seconds": 0.5, "ok": False},
+        {"stage": "html", "lang": "en", "seconds": 1.0, "ok": True},
+    ]
+    output = tmp_path / "cv.prom"
+
+    write_prometheus(records, output)
+
+    text = output.read_text()
+    assert "# TYPE resume_stage_seconds gauge" in text
+    assert 'resume_stage_seconds{lang="en",stage="parse"} 0.75' in text
+    assert 'resume_stage_runs{lang="en",stage="parse"} 2' in text
+    assert 'resume_stage_failures{lang="en",stage="parse"} 1' in text
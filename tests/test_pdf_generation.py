@@ -2,10 +2,22 @@
 Basic tests for CV generation functionality.
 """
 
-import tempfile
+import io
 from pathlib import Path
 
-from backend.generators.pdf_generator import create_pdf_html, generate_pdf
+import pytest
+
+from backend.generators import pdf_generator
+from backend.generators.pdf_generator import (
+    create_pdf_html,
+    generate_pdf,
+    layout_pdf,
+    page_metadata,
+    render_pdf_buffer,
+    render_pdf_bytes,
+    stream_pdf,
+    write_pdf_previews,
+)
 from backend.parsers.schema import validate_cv
 from backend.parsers.yaml_parser import parse_cv_file, parse_cv_with_base
 
@@ -39,15 +51,9 @@ def test_pdf_generation():
         assert cv_data["personal"]["name"] in html_content
         assert "Inter" in html_content  # Check for professional font
 
-        # Generate actual PDF to temp file
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            pdf_path = f.name
-
-        generate_pdf(cv_data, pdf_path, lang)
-        pdf_file = Path(pdf_path)
-        assert pdf_file.exists(), f"PDF file was not generated for {lang}"
-        assert pdf_file.stat().st_size > 0, f"PDF file is empty for {lang}"
-        pdf_file.unlink()  # Clean up
+        # Generate actual PDF in memory
+        pdf = render_pdf_bytes(cv_data, lang)
+        assert pdf.startswith(b"%PDF"), f"PDF was not generated for {lang}"
 
         print(f"✓ PDF generation test passed for {lang.upper()}")
 
@@ -83,6 +89,79 @@ def test_pdf_styling():
     print("✓ PDF styling test passed")
 
 
+def test_pdf_output_targets(tmp_path: Path):
+    """PDFs can be written to paths and file objects, returned or streamed."""
+    cv_data_dir = Path(__file__).parent.parent / "cv-data"
+    cv_data = validate_cv(parse_cv_file(str(cv_data_dir / "cv_en.yml"))).model_dump()
+    cv_data["translations"] = parse_cv_file(str(cv_data_dir / "ui_translations.yml"))
+
+    pdf = render_pdf_bytes(cv_data, "en")
+    buffer = io.BytesIO()
+    generate_pdf(cv_data, buffer, "en")
+    generate_pdf(cv_data, tmp_path / "cv.pdf", "en")
+    view = render_pdf_buffer(cv_data, "en")
+    chunks = list(stream_pdf(cv_data, "en", chunk_size=1024))
+
+    assert buffer.getvalue() == pdf
+    assert (tmp_path / "cv.pdf").read_bytes() == pdf
+    assert view.readonly and view == pdf
+    assert all(len(chunk) <= 1024 for chunk in chunks)
+    assert b"".join(chunks) == pdf
+    with pytest.raises(ValueError):
+        next(stream_pdf(cv_data, "en", chunk_size=0))
+
+
+def test_pdf_layout_reuse(tmp_path: Path):
+    """One layout gives the PDF, its page metadata and a preview per page."""
+    pytest.importorskip("pypdfium2")
+    cv_data_dir = Path(__file__).parent.parent / "cv-data"
+    cv_data = validate_cv(parse_cv_file(str(cv_data_dir / "cv_en.yml"))).model_dump()
+    cv_data["translations"] = parse_cv_file(str(cv_data_dir / "ui_translations.yml"))
+
+    document = layout_pdf(cv_data, "en")
+    buffer = io.BytesIO()
+    assert generate_pdf(cv_data, buffer, "en", document=document) is document
+    metadata = page_metadata(document)
+    (tmp_path / "cv_en-p99.png").write_bytes(b"stale")
+    previews = write_pdf_previews(buffer.getbuffer(), tmp_path, "cv_en", width=120)
+
+    assert metadata["page_count"] == len(previews) > 0
+    assert all(page["width_mm"] > 0 for page in metadata["pages"])
+    assert [p.name for p in previews] == [f"cv_en-p{n}.png" for n in range(1, len(previews) + 1)]
+    assert sorted(tmp_path.glob("*.png")) == sorted(previews)
+
+
+def test_pdf_offline_fonts(tmp_path: Path, monkeypatch):
+    """Bundled fonts replace the Google Fonts stylesheet; remote URLs are refused."""
+    (tmp_path / "Inter-Regular.woff2").write_bytes(b"")
+    (tmp_path / "Inter-Bold.ttf").write_bytes(b"")
+    monkeypatch.setattr(pdf_generator, "FONTS_DIR", tmp_path)
+    pdf_generator.local_fonts_css.cache_clear()
+
+    try:
+        css = pdf_generator.local_fonts_css()
+    finally:
+        pdf_generator.local_fonts_css.cache_clear()
+
+    assert css.count("@font-face") == 2
+    assert "font-weight: 400" in css and "format('woff2')" in css
+    assert "font-weight: 700" in css and "format('truetype')" in css
+
+    with pytest.raises(ValueError):
+        pdf_generator._refuse_remote("https://fonts.gstatic.com/inter.woff2")
+    pdf_generator._refuse_remote((tmp_path / "Inter-Regular.woff2").as_uri())
+
+
+def test_inter_fonts_bundled():
+    """Every Inter weight of the stylesheet is bundled with its license."""
+    css = pdf_generator.local_fonts_css()
+
+    for weight, suffix in pdf_generator.INTER_WEIGHTS.items():
+        assert f"font-weight: {weight};" in css
+        assert (pdf_generator.FONTS_DIR / f"Inter-{suffix}.woff2").stat().st_size > 0
+    assert "Open Font License" in (pdf_generator.FONTS_DIR / "LICENSE.txt").read_text()
+
+
 if __name__ == "__main__":
     test_pdf_generation()
     test_pdf_styling()
@@ -0,0 +1,50 @@
+"""
+Tests for single-pass multi-format rendering.
+"""
+
+import pytest
+
+from backend.generators.context import RenderContext
+from backend.generators.json_generator import generate_json, generate_public_json
+from backend.generators.render import render_all
+
+CV_DATA = {
+    "personal": {
+        "name": "Jane Doe",
+        "email": "jane@example.com",
+        "phone": "+41 00 000 00 00",
+        "birth_date": "1990-01-01",
+    },
+    "summary": "Engineer",
+    "experience": [],
+    "education": [],
+    "skills": [{"category": "Languages", "items": ["Python", "Go"]}],
+    "translations": {"en": {"experience": "Experience", "skills": "Skills"}},
+}
+
+
+def test_context_computes_intermediates_once():
+    """Context properties are derived on first use and then reused."""
+    context = RenderContext(CV_DATA, "en")
+
+    assert context.skill_lines == [("Languages", "Python, Go")]
+    assert context.skill_lines is context.skill_lines
+    assert context.public_personal is context.public_personal
+    assert "phone" not in context.public_personal
+    assert context.headings["skills"] == "Skills"
+
+
+def test_render_all_matches_individual_generators():
+    """Shared-context outputs are identical to the standalone generators."""
+    outputs = render_all(CV_DATA, "en", formats=("html", "json", "public_json"))
+
+    assert set(outputs) == {"html", "json", "public_json"}
+    assert outputs["json"] == generate_json(CV_DATA)
+    assert outputs["public_json"] == generate_public_json(CV_DATA)
+    assert "Jane Doe" in outputs["html"]
+
+
+def test_render_all_rejects_unknown_format():
+    """Unknown formats fail before anything is rendered."""
+    with pytest.raises(ValueError, match="docx"):
+        render_all(CV_DATA, "en", formats=("html", "docx"))
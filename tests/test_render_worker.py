@@ -0,0 +1,117 @@
+"""
+Tests for the long-lived PDF render worker.
+"""
+
+import base64
+import io
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from backend import render_worker
+from backend.generators.limits import RenderLimits
+from backend.render_worker import RenderClient, RenderService
+
+
+def _fake_render(job):
+    """Stand-in for render_job that skips WeasyPrint."""
+    return {"id": job.get("id"), "ok": True, "size": 4, "render_ms": 1.5}
+
+
+def test_serve_stream_reports_each_job(monkeypatch):
+    """Every line gets a result with timings, including malformed ones."""
+    monkeypatch.setattr(render_worker, "render_job", _fake_render)
+    service = RenderService(executor=ThreadPoolExecutor(max_workers=2))
+    outfile = io.StringIO()
+
+    service.serve_stream(io.StringIO('{"id": "a", "lang": "en"}\nnot json\n\n[1]\n'), outfile)
+    service.shutdown()
+
+    results = [json.loads(line) for line in outfile.getvalue().splitlines()]
+    assert len(results) == 3
+    by_id = {result["id"]: result for result in results if result["id"]}
+    assert by_id["a"]["ok"] and by_id["a"]["timing"]["render_ms"] == 1.5
+    assert by_id["a"]["timing"]["total_ms"] >= 0
+    assert [result["ok"] for result in results if result["id"] is None] == [False, False]
+
+
+def test_socket_results_written_before_close(tmp_path: Path, monkeypatch):
+    """A client that half-closes after sending its jobs still gets every result."""
+    monkeypatch.setattr(render_worker, "render_job", _fake_render)
+    service = RenderService(executor=ThreadPoolExecutor(max_workers=4))
+    server = service.socket_server(str(tmp_path / "render.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        for _ in range(20):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(10)
+                sock.connect(str(tmp_path / "render.sock"))
+                sock.sendall(b"".join(b'{"id": "%d"}\n' % n for n in range(4)))
+                sock.shutdown(socket.SHUT_WR)
+                with sock.makefile("r", encoding="utf-8") as reader:
+                    results = [json.loads(line) for line in reader]
+            assert sorted(result["id"] for result in results) == ["0", "1", "2", "3"]
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+
+
+def test_client_times_out_on_stuck_worker(tmp_path: Path):
+    """A worker that never answers fails the client with a TimeoutError."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(tmp_path / "stuck.sock"))
+        server.listen()
+        with RenderClient(str(tmp_path / "stuck.sock"), timeout=0.1) as client:
+            with pytest.raises(TimeoutError, match="has not sent a result within 0.1s"):
+                client.render(lang="en", cv_data={})
+
+
+def test_client_timeout_follows_time_limit():
+    """Clients wait for the layout time limit plus a margin, with a finite default."""
+    assert render_worker.client_timeout(RenderLimits()) == render_worker.CLIENT_TIMEOUT_S
+    assert render_worker.client_timeout(RenderLimits(max_seconds=20)) == (
+        20 + render_worker.CLIENT_TIMEOUT_MARGIN_S
+    )
+
+
+def test_render_job_rejects_job_without_cv():
+    """A job must name a CV file or carry CV data."""
+    result = render_worker.render_job({"id": "x", "lang": "en"})
+
+    assert not result["ok"]
+    assert "cv_file" in result["error"]
+
+
+@pytest.mark.weasyprint
+def test_render_via_socket(tmp_path: Path):
+    """A client renders a real CV through a worker listening on a socket."""
+    cv_file = Path(__file__).parent.parent / "cv-data" / "cv_fr.yml"
+    service = RenderService(executor=ThreadPoolExecutor(max_workers=1))
+    server = service.socket_server(str(tmp_path / "render.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with RenderClient(str(tmp_path / "render.sock"), timeout=120) as client:
+            to_file, in_memory = client.render_many(
+                [
+                    {"cv_file": str(cv_file), "output": str(tmp_path / "cv_fr.pdf")},
+                    {"cv_file": str(cv_file)},
+                ]
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+
+    assert to_file["ok"], to_file.get("error")
+    assert (tmp_path / "cv_fr.pdf").stat().st_size == to_file["size"] > 0
+    assert in_memory["ok"], in_memory.get("error")
+    assert base64.b64decode(in_memory["pdf_base64"]).startswith(b"%PDF")
@@ -0,0 +1,68 @@
+"""
+Tests for CV schema validation.
+"""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from backend.parsers import schema
+from backend.parsers.schema import (
+    CVData,
+    Experience,
+    PersonalInfo,
+    clear_validation_cache,
+    construct_cv,
+    validate_cv,
+    validate_cv_cached,
+    validate_cv_dump,
+    validate_cv_json,
+)
+from backend.parsers.yaml_parser import parse_cv_with_base
+
+CV_FILE = Path(__file__).parent.parent / "cv-data" / "cv_fr.yml"
+
+
+def test_validate_cv_json_matches_dict_validation():
+    """Validating JSON bytes gives the same model as validating the dict."""
+    cv = validate_cv(parse_cv_with_base(str(CV_FILE)))
+
+    assert validate_cv_json(cv.model_dump_json().encode("utf-8")) == cv
+
+
+def test_construct_cv_builds_nested_models():
+    """Trusted data is turned into the same nested models, without validation."""
+    cv = validate_cv(parse_cv_with_base(str(CV_FILE)))
+
+    constructed = construct_cv(cv.model_dump())
+
+    assert isinstance(constructed, CVData)
+    assert isinstance(constructed.personal, PersonalInfo)
+    assert isinstance(constructed.experience[0], Experience)
+    assert constructed == cv
+
+
+def test_validated_digests_skip_validation(monkeypatch):
+    """A digest seen before is served without calling the validator again."""
+    clear_validation_cache()
+    data = parse_cv_with_base(str(CV_FILE))
+    first = validate_cv_dump(data, "digest-1")
+    first["summary"] = "Mutated"
+
+    calls = []
+    monkeypatch.setattr(schema, "validate_cv", lambda d: calls.append(d))
+    second = validate_cv_dump(data, "digest-1")
+    model = validate_cv_cached(data, "digest-1")
+
+    assert calls == []
+    assert second["summary"] != "Mutated"
+    assert model.model_dump() == second
+
+
+def test_invalid_data_is_not_remembered():
+    """Failed validation raises every time."""
+    clear_validation_cache()
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate_cv_dump({"summary": "No personal section"}, "digest-2")
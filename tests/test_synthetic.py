@@ -0,0 +1,39 @@
+"""
+Tests for the synthetic CV generator.
+"""
+
+import pytest
+
+from backend.parsers.schema import validate_cv
+from backend.parsers.yaml_parser import parse_cv_with_base
+from backend.synthetic import generate_cv, generate_override, write_cv_set
+
+
+def test_generate_cv_is_deterministic():
+    """The same seed and sizes give the same CV; another seed does not."""
+    assert generate_cv(seed=7, experiences=20) == generate_cv(seed=7, experiences=20)
+    assert generate_cv(seed=7) != generate_cv(seed=8)
+    assert len(generate_cv(experiences=50, projects=0)["experience"]) == 50
+
+
+def test_write_cv_set_is_valid(tmp_path):
+    """Generated sources merge and validate like the hand-written ones."""
+    write_cv_set(tmp_path, ("en", "fr", "de"), seed=3, experiences=40, skills=12)
+
+    for lang in ("en", "fr", "de"):
+        cv = validate_cv(parse_cv_with_base(str(tmp_path / f"cv_{lang}.yml")))
+        assert len(cv.experience) == 40
+    assert (tmp_path / "ui_translations.yml").exists()
+
+
+def test_generate_override_ratio():
+    """override_ratio sets the share of translated entries."""
+    base = generate_cv(experiences=10, projects=4)
+
+    assert "experience" not in generate_override(base, "fr", override_ratio=0.0)
+    half = generate_override(base, "fr", override_ratio=0.5)
+    assert len(half["experience"]) == 5
+    assert all(entry["title"].startswith("[fr] ") for entry in half["experience"])
+    assert len(generate_override(base, "fr", override_ratio=1.0)["projects"]) == 4
+    with pytest.raises(ValueError):
+        generate_override(base, "fr", override_ratio=1.5)
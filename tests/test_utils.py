@@ -0,0 +1,31 @@
+"""
+Tests for the shared backend helpers.
+"""
+
+from pathlib import Path
+
+from backend.utils import LRUCache, write_atomic
+
+
+def test_write_atomic_replaces_content(tmp_path: Path):
+    """Text and bytes replace the file in one step, leaving no temporary file."""
+    target = tmp_path / "manifest.json"
+
+    write_atomic(target, "é\n")
+    write_atomic(target, target.read_bytes() + b"more\n")
+
+    assert target.read_text(encoding="utf-8") == "é\nmore\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Reads refresh an entry; the oldest one is dropped past maxsize."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,46 @@
+"""
+Tests for the validate_cv.py pre-commit hook.
+"""
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from hooks import validate_cv
+
+CV_DATA_DIR = Path(__file__).parent.parent / "cv-data"
+
+
+def _copy_cv_data(tmp_path: Path) -> Path:
+    cv_dir = tmp_path / "cv-data"
+    shutil.copytree(CV_DATA_DIR, cv_dir)
+    return cv_dir
+
+
+def test_expand_targets(tmp_path):
+    """The base pulls in every language, the UI translations only when rendering."""
+    cv_dir = _copy_cv_data(tmp_path)
+    every_cv = sorted(cv_dir.glob("cv_*.yml"))
+    translations = cv_dir / "ui_translations.yml"
+
+    assert validate_cv.expand_targets([cv_dir / "cv_fr.yml"]) == [cv_dir / "cv_fr.yml"]
+    assert validate_cv.expand_targets([cv_dir / "cv_en.yml"]) == every_cv
+    assert validate_cv.expand_targets([translations]) == []
+    assert validate_cv.expand_targets([translations], render=True) == every_cv
+
+
+def test_main_caches_passing_files(tmp_path, capsys):
+    """Valid files are cached by content; changing the base invalidates its dependents."""
+    cv_dir = _copy_cv_data(tmp_path)
+    cache = tmp_path / "cache.json"
+    argv = ["--cache", str(cache), str(cv_dir / "cv_en.yml")]
+
+    assert validate_cv.main(argv, executor=ThreadPoolExecutor(max_workers=2)) == 0
+    assert "(cached)" not in capsys.readouterr().out
+    assert validate_cv.main(argv) == 0
+    assert capsys.readouterr().out.count("(cached)") == len(list(cv_dir.glob("cv_*.yml")))
+
+    (cv_dir / "cv_en.yml").write_text("personal: {}\n", encoding="utf-8")
+    assert validate_cv.main(argv) == 1
+    out = capsys.readouterr().out
+    assert "(cached)" not in out and "✗" in out
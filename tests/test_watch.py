@@ -0,0 +1,99 @@
+"""
+Tests for watch mode.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend import watch
+from backend.watch import PollingWatcher, dependency_graph, make_watcher, translation_targets
+
+FORMATS = ("html", "json", "pdf")
+LANGUAGES = ["en", "fr", "it"]
+
+
+def test_dependency_graph(tmp_path: Path):
+    """The base language feeds every language, other files only their own."""
+    graph = dependency_graph(LANGUAGES, FORMATS, tmp_path)
+
+    assert graph[tmp_path.resolve() / "cv_en.yml"] == {lang: set(FORMATS) for lang in LANGUAGES}
+    assert graph[tmp_path.resolve() / "cv_fr.yml"] == {"fr": set(FORMATS)}
+
+
+def test_translation_targets():
+    """A translations change rebuilds that language's headings and every JSON."""
+    old = {lang: {"skills": "Skills"} for lang in LANGUAGES}
+    new = {**old, "fr": {"skills": "Compétences"}}
+
+    assert translation_targets(old, old, LANGUAGES, FORMATS) == {}
+    assert translation_targets(old, new, LANGUAGES, FORMATS) == {
+        "en": {"json"},
+        "fr": {"html", "json", "pdf"},
+        "it": {"json"},
+    }
+
+
+def test_watchers_report_changed_files(tmp_path: Path):
+    """Both the polling and the native watcher report writes to watched files."""
+    watched = tmp_path / "cv_en.yml"
+    other = tmp_path / "notes.txt"
+    watched.write_text("a")
+
+    for make in (lambda: PollingWatcher([watched], interval=0.01), lambda: make_watcher([watched])):
+        watcher = make()
+        try:
+            assert watcher.wait(0.05) == set()
+            other.write_text("ignored")
+            watched.write_text(watched.read_text() + "b")
+            assert watcher.wait(1.0) == {watched.resolve()}
+        finally:
+            watcher.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_overflow_and_stale_watches(tmp_path: Path):
+    """Unknown or removed watches are skipped; a queue overflow reports every source."""
+    sources = [tmp_path / "cv_en.yml", tmp_path / "cv_fr.yml"]
+    watcher = watch.InotifyWatcher(sources)
+    read_fd, write_fd = os.pipe()
+    os.close(watcher._fd)
+    # Feed hand-made events through a pipe in place of the inotify descriptor
+    watcher._fd = read_fd
+    try:
+        wd = next(iter(watcher._dirs))
+        os.write(write_fd, watch._IN_EVENT.pack(wd, watch._IN_IGNORED, 0, 0))
+        os.write(write_fd, watch._IN_EVENT.pack(wd + 1, watch._IN_DELETE, 0, 0))
+        assert watcher._read_events() == set()
+        assert watcher._dirs == {}
+        assert watcher._missing == {tmp_path.resolve()}
+
+        os.write(write_fd, watch._IN_EVENT.pack(-1, watch._IN_Q_OVERFLOW, 0, 0))
+        assert watcher._read_events() == {source.resolve() for source in sources}
+    finally:
+        watcher.close()
+        os.close(write_fd)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_rewatches_recreated_directory(tmp_path: Path):
+    """A removed and recreated source directory keeps being watched."""
+    source = tmp_path / "cv-data" / "cv_en.yml"
+    source.parent.mkdir()
+    source.write_text("a")
+    watcher = watch.InotifyWatcher([source])
+    try:
+        shutil.rmtree(source.parent)
+        assert watcher.wait(1.0) == {source.resolve()}
+
+        source.parent.mkdir()
+        source.write_text("b")
+        assert watcher.wait(2.0) == {source.resolve()}
+
+        source.write_text("c")
+        assert watcher.wait(1.0) == {source.resolve()}
+    finally:
+        watcher.close()
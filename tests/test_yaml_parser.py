@@ -0,0 +1,133 @@
+"""
+Tests for YAML parsing and merging.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.parsers import yaml_parser
+from backend.parsers.yaml_parser import (
+    clear_parse_cache,
+    deep_merge,
+    merge_lists_by_id,
+    parse_cv_file,
+    parse_cv_with_base,
+)
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_parse_cache_returns_private_copies(tmp_path: Path):
+    """Mutating a parse result does not corrupt the cached entry."""
+    clear_parse_cache()
+    cv_file = _write(tmp_path / "cv_en.yml", "personal:\n  name: Jane\nskills:\n  - category: A\n")
+
+    first = parse_cv_file(str(cv_file))
+    first["personal"]["name"] = "Mutated"
+    first["skills"].append({"category": "B"})
+
+    second = parse_cv_file(str(cv_file))
+    assert second == {"personal": {"name": "Jane"}, "skills": [{"category": "A"}]}
+
+
+def test_parse_cache_invalidated_on_change(tmp_path: Path):
+    """Editing a file (new mtime/size) is picked up on the next parse."""
+    clear_parse_cache()
+    cv_file = _write(tmp_path / "cv_en.yml", "summary: old\n")
+    assert parse_cv_file(str(cv_file)) == {"summary": "old"}
+
+    _write(cv_file, "summary: newer\n")
+    stat = cv_file.stat()
+    os.utime(cv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert parse_cv_file(str(cv_file)) == {"summary": "newer"}
+    assert len(yaml_parser._parse_cache) == 1
+
+
+def test_parse_cache_is_bounded(tmp_path: Path, monkeypatch):
+    """The least recently used entries are evicted past the size limit."""
+    clear_parse_cache()
+    monkeypatch.setattr(yaml_parser._parse_cache, "maxsize", 2)
+    files = [_write(tmp_path / f"cv_{i}.yml", f"summary: {i}\n") for i in range(3)]
+
+    for cv_file in files:
+        parse_cv_file(str(cv_file))
+
+    cached_paths = list(yaml_parser._parse_cache)
+    assert cached_paths == [os.path.realpath(files[1]), os.path.realpath(files[2])]
+
+
+def test_parse_with_base_shares_base_parse(tmp_path: Path):
+    """Override languages reuse one parse of the base file."""
+    clear_parse_cache()
+    _write(tmp_path / "cv_en.yml", "summary: Engineer\nexperience:\n  - id: exp_1\n    title: Dev\n")
+    _write(tmp_path / "cv_fr.yml", "experience:\n  - id: exp_1\n    title: Développeur\n")
+    _write(tmp_path / "cv_it.yml", "summary: Ingegnere\n")
+
+    fr = parse_cv_with_base(str(tmp_path / "cv_fr.yml"))
+    it = parse_cv_with_base(str(tmp_path / "cv_it.yml"))
+    fr["summary"] = "Mutated"
+
+    assert fr["experience"] == [{"id": "exp_1", "title": "Développeur"}]
+    assert it == {"summary": "Ingegnere", "experience": [{"id": "exp_1", "title": "Dev"}]}
+    assert parse_cv_file(str(tmp_path / "cv_en.yml"))["summary"] == "Engineer"
+    assert len(yaml_parser._parse_cache) == 3
+
+
+def test_iter_cv_bundle_streams_documents(tmp_path: Path):
+    """Each non-empty document of a bundle is yielded lazily, in order."""
+    bundle = _write(tmp_path / "bundle.yml", "summary: one\n---\n---\nsummary: two\nbirth_date: 1990-05-15\n")
+
+    documents = yaml_parser.iter_cv_bundle(str(bundle))
+
+    assert next(documents) == {"summary": "one"}
+    second = next(documents)
+    assert second["summary"] == "two"
+    assert second["birth_date"].isoformat() == "1990-05-15"
+    assert list(documents) == []
+
+
+def test_merge_lists_by_id_keeps_base_order():
+    """Overrides are matched by id regardless of their position."""
+    base = [{"id": "a", "title": "A"}, "plain", {"id": "b", "title": "B"}, {"title": "no id"}]
+    override = [{"id": "b", "title": "B2"}, {"id": "a", "title": "A2"}, {"id": "a", "title": "A3"}]
+
+    merged = merge_lists_by_id(base, override)
+
+    assert merged == [{"id": "a", "title": "A2"}, "plain", {"id": "b", "title": "B2"}, {"title": "no id"}]
+
+
+def test_merge_lists_unmatched_policies():
+    """Override items missing from the base are ignored, appended or rejected."""
+    base = [{"id": "a", "title": "A"}]
+    override = [{"id": "z", "title": "Z"}]
+
+    assert merge_lists_by_id(base, override) == base
+    assert merge_lists_by_id(base, override, unmatched="append") == base + override
+    with pytest.raises(ValueError, match="'z'"):
+        merge_lists_by_id(base, override, unmatched="error")
+    with pytest.raises(ValueError, match="Unknown unmatched policy"):
+        merge_lists_by_id(base, override, unmatched="replace")
+
+
+def test_deep_merge_uses_section_merge_keys():
+    """Sections without ids are matched on their configured key field."""
+    base = {
+        "skills": [{"category": "Backend", "items": ["Python"]}],
+        "languages": [{"name": "English", "level": "Native"}],
+    }
+    override = {
+        "skills": [{"category": "Backend", "label": "Back-end"}],
+        "languages": [{"name": "English", "level": "Natif"}],
+    }
+
+    merged = deep_merge(base, override)
+    assert merged["skills"] == [{"category": "Backend", "items": ["Python"], "label": "Back-end"}]
+    assert merged["languages"] == [{"name": "English", "level": "Natif"}]
+
+    merged = deep_merge(base, override, merge_keys={})
+    assert merged == base
@@ -2,6 +2,20 @@ import html2pdf from "html2pdf.js";
 import { useCallback, useEffect, useState } from "react";
 import "./styles/App.css";
 
+// Asset manifest written by backend/generate.py, fetched once per page load
+let manifestPromise = null;
+
+function loadManifest() {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${import.meta.env.BASE_URL}cv-manifest.json`, {
+      cache: "no-cache",
+    })
+      .then((res) => (res.ok ? res.json() : null))
+      .catch(() => null);
+  }
+  return manifestPromise;
+}
+
 function App() {
   const [cvData, setCvData] = useState(null);
   const [currentLang, setCurrentLang] = useState("en");
@@ -32,8 +46,15 @@ function App() {
   }, [cvData]);
 
   useEffect(() => {
-    // Load CV data for current language
-    fetch(`${import.meta.env.BASE_URL}cv_${currentLang}.json`)
+    // Load CV data for current language: the fingerprinted file listed in
+    // the asset manifest when available, the plain JSON otherwise
+    loadManifest()
+      .then((manifest) => {
+        const file = manifest?.files?.[currentLang]?.file;
+        return fetch(
+          `${import.meta.env.BASE_URL}${file || `cv_${currentLang}.json`}`,
+        );
+      })
       .then((res) => {
         if (!res.ok) {
           throw new Error(`HTTP error! status: ${res.status}`);